@@ -8,6 +8,7 @@ from supabase import create_client, Client
 from typing import List, Dict, Optional
 from datetime import datetime
 import uuid
+from utils import chunked, group_updates
 from advanced_models import User, Category, Todo, WeatherRecord, Priority, Status
 
 class AdvancedDatabaseManager:
@@ -16,15 +17,26 @@ class AdvancedDatabaseManager:
     Orta seviye Python OOP özellikleri
     """
     
-    def __init__(self):
-        """Veritabanı bağlantısını başlat"""
+    def __init__(self, client: Client = None):
+        """
+        Veritabanı bağlantısını başlat
+        
+        Args:
+            client: Hazır istemci (ör. fake_supabase.FakeSupabaseClient); verilmezse
+                SUPABASE_URL ve SUPABASE_KEY ile oluşturulur
+        """
         self.url = os.getenv('SUPABASE_URL')
         self.key = os.getenv('SUPABASE_KEY')
         
-        if not self.url or not self.key:
-            raise ValueError("SUPABASE_URL ve SUPABASE_KEY environment variables gerekli!")
+        if client is None:
+            if not self.url or not self.key:
+                raise ValueError("SUPABASE_URL ve SUPABASE_KEY environment variables gerekli!")
+            client = create_client(self.url, self.key)
+        
+        self.supabase: Client = client
         
-        self.supabase: Client = create_client(self.url, self.key)
+        # Toplu işlemlerde tek istekte gönderilecek satır sayısı
+        self.bulk_chunk_size = int(os.getenv('DB_BULK_CHUNK_SIZE', '500'))
     
     # Kullanıcı işlemleri
     def create_user(self, username: str, email: str) -> Optional[User]:
@@ -228,8 +240,8 @@ class AdvancedDatabaseManager:
             print(f"Kategori bazlı todo getirme hatası: {e}")
             return []
     
-    def update_todo(self, todo_id: str, **kwargs) -> bool:
-        """Todo güncelle"""
+    def update_todo(self, todo_id: str, owner_id: Optional[str] = None, **kwargs) -> bool:
+        """Todo güncelle (owner_id verilirse yalnızca o kullanıcının todo'su)"""
         try:
             # Enum değerlerini string'e çevir
             if 'priority' in kwargs and isinstance(kwargs['priority'], Priority):
@@ -237,71 +249,156 @@ class AdvancedDatabaseManager:
             if 'status' in kwargs and isinstance(kwargs['status'], Status):
                 kwargs['status'] = kwargs['status'].value
             
-            result = self.supabase.table('todos').update(kwargs).eq('id', todo_id).execute()
+            query = self.supabase.table('todos').update(kwargs).eq('id', todo_id)
+            if owner_id is not None:
+                query = query.eq('user_id', owner_id)
+            result = query.execute()
             return len(result.data) > 0
         except Exception as e:
             print(f"Todo güncelleme hatası: {e}")
             return False
     
-    def delete_todo(self, todo_id: str) -> bool:
-        """Todo sil"""
+    def delete_todo(self, todo_id: str, owner_id: Optional[str] = None) -> bool:
+        """Todo sil (owner_id verilirse yalnızca o kullanıcının todo'su)"""
         try:
-            result = self.supabase.table('todos').delete().eq('id', todo_id).execute()
+            query = self.supabase.table('todos').delete().eq('id', todo_id)
+            if owner_id is not None:
+                query = query.eq('user_id', owner_id)
+            result = query.execute()
             return len(result.data) > 0
         except Exception as e:
             print(f"Todo silme hatası: {e}")
             return False
     
-    def toggle_todo_complete(self, todo_id: str) -> bool:
-        """Todo tamamla/tamamlanmamış yap"""
+    def toggle_todo_complete(self, todo_id: str, owner_id: Optional[str] = None) -> bool:
+        """Todo tamamla/tamamlanmamış yap (owner_id verilirse yalnızca o kullanıcının todo'su)"""
         try:
-            # Önce mevcut durumu al
-            result = self.supabase.table('todos').select('completed').eq('id', todo_id).execute()
-            if not result.data:
-                return False
-            
-            current_status = result.data[0]['completed']
-            new_status = not current_status
-            
-            # Durumu güncelle
-            update_data = {'completed': new_status}
-            if new_status:
-                update_data['status'] = 'completed'
-            else:
-                update_data['status'] = 'pending'
-            
-            update_result = self.supabase.table('todos').update(update_data).eq('id', todo_id).execute()
-            return len(update_result.data) > 0
+            # completed ve status tek atomik UPDATE ile çevrilir (toggle_todo_complete fonksiyonu)
+            result = self.supabase.rpc(
+                'toggle_todo_complete', {'p_todo_id': todo_id, 'p_user_id': owner_id}
+            ).execute()
+            return len(result.data) > 0
         except Exception as e:
             print(f"Todo durum güncelleme hatası: {e}")
             return False
     
-    def search_todos(self, user_id: str, query: str) -> List[Todo]:
-        """Todo'ları ara"""
+    # Toplu işlemler
+    def create_todos_bulk(self, user_id: str, todos: List[Dict], chunk_size: int = None) -> List[Optional[Todo]]:
+        """Todo'ları parça parça çok satırlı INSERT ile oluştur (giriş sırasıyla)"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = []
+        
+        for chunk in chunked(todos, chunk_size):
+            rows = []
+            for todo in chunk:
+                priority = todo.get('priority', 'orta')
+                status = todo.get('status', 'pending')
+                rows.append({
+                    'user_id': user_id,
+                    'text': todo['text'],
+                    'description': todo.get('description'),
+                    'priority': priority.value if isinstance(priority, Priority) else priority,
+                    'status': status.value if isinstance(status, Status) else status,
+                    'completed': todo.get('completed', False),
+                    'due_date': todo.get('due_date'),
+                    'tags': todo.get('tags', []),
+                    'category_id': todo.get('category_id')
+                })
+            
+            try:
+                result = self.supabase.table('todos').insert(rows).execute()
+                created = [Todo.from_dict(todo_dict) for todo_dict in result.data or []]
+                results.extend(created + [None] * (len(chunk) - len(created)))
+            except Exception as e:
+                print(f"Toplu todo oluşturma hatası: {e}")
+                results.extend([None] * len(chunk))
+        
+        return results
+    
+    def update_todos_bulk(self, updates: Dict[str, Dict], chunk_size: int = None) -> Dict[str, bool]:
+        """Aynı değişikliği alan todo'ları gruplayıp id IN (...) ile toplu güncelle"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = {todo_id: False for todo_id in updates}
+        
+        # Enum değerleri group_updates içinde string'e çevrilir
+        for patch, todo_ids in group_updates(updates):
+            for chunk in chunked(todo_ids, chunk_size):
+                try:
+                    result = self.supabase.table('todos').update(patch).in_('id', chunk).execute()
+                    for row in result.data or []:
+                        results[row['id']] = True
+                except Exception as e:
+                    print(f"Toplu todo güncelleme hatası: {e}")
+        
+        return results
+    
+    def delete_todos_bulk(self, todo_ids: List[str], chunk_size: int = None) -> Dict[str, bool]:
+        """Todo'ları parça parça id IN (...) ile toplu sil"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = {todo_id: False for todo_id in todo_ids}
+        
+        for chunk in chunked(list(todo_ids), chunk_size):
+            try:
+                result = self.supabase.table('todos').delete().in_('id', chunk).execute()
+                for row in result.data or []:
+                    results[row['id']] = True
+            except Exception as e:
+                print(f"Toplu todo silme hatası: {e}")
+        
+        return results
+    
+    def search_todos(self, user_id: str, query: str, limit: int = 20, offset: int = 0) -> List[Todo]:
+        """
+        Todo'ları ara (text, description ve tags üzerinde, en alakalı önce)
+        
+        Args:
+            user_id (str): Kullanıcı ID'si
+            query (str): Arama metni (web arama sözdizimi: "ifade", or, -hariç)
+            limit (int): En fazla sonuç sayısı
+            offset (int): Atlanacak sonuç sayısı (sayfalama)
+        """
+        if not query or not query.strip():
+            return []
         try:
-            # PostgreSQL full-text search kullanarak
-            result = self.supabase.table('todos').select('*').eq('user_id', user_id).text_search('text', query).execute()
-            todos = []
-            for todo_dict in result.data:
-                todos.append(Todo(
-                    id=todo_dict['id'],
-                    user_id=todo_dict['user_id'],
-                    category_id=todo_dict['category_id'],
-                    text=todo_dict['text'],
-                    description=todo_dict['description'],
-                    priority=Priority(todo_dict['priority']),
-                    status=Status(todo_dict['status']),
-                    completed=todo_dict['completed'],
-                    due_date=datetime.fromisoformat(todo_dict['due_date'].replace('Z', '+00:00')) if todo_dict['due_date'] else None,
-                    tags=todo_dict['tags'] or [],
-                    created_at=datetime.fromisoformat(todo_dict['created_at'].replace('Z', '+00:00')),
-                    updated_at=datetime.fromisoformat(todo_dict['updated_at'].replace('Z', '+00:00'))
-                ))
-            return todos
+            # search_todos SQL fonksiyonu: GIN indeksli tsvector + ts_rank_cd
+            result = self.supabase.rpc('search_todos', {
+                'p_user_id': user_id,
+                'p_query': query,
+                'p_limit': limit,
+                'p_offset': offset
+            }).execute()
+            return [Todo.from_dict(todo_dict) for todo_dict in result.data or []]
         except Exception as e:
             print(f"Todo arama hatası: {e}")
             return []
     
+    def fuzzy_search_todos(self, user_id: str, query: str, threshold: float = 0.3,
+                           limit: int = 20, offset: int = 0) -> List[Todo]:
+        """
+        Yazım hatası toleranslı arama (pg_trgm, Türkçe karakter katlamalı)
+        
+        Args:
+            user_id (str): Kullanıcı ID'si
+            query (str): Arama metni
+            threshold (float): En düşük benzerlik (0-1)
+            limit (int): En fazla sonuç sayısı
+            offset (int): Atlanacak sonuç sayısı (sayfalama)
+        """
+        if not query or not query.strip():
+            return []
+        try:
+            result = self.supabase.rpc('fuzzy_search_todos', {
+                'p_user_id': user_id,
+                'p_query': query,
+                'p_threshold': threshold,
+                'p_limit': limit,
+                'p_offset': offset
+            }).execute()
+            return [Todo.from_dict(todo_dict) for todo_dict in result.data or []]
+        except Exception as e:
+            print(f"Bulanık arama hatası: {e}")
+            return []
+    
     def get_overdue_todos(self, user_id: str) -> List[Todo]:
         """Süresi geçmiş todo'ları getir"""
         try:
@@ -328,24 +425,34 @@ class AdvancedDatabaseManager:
             print(f"Süresi geçmiş todo getirme hatası: {e}")
             return []
     
+    def _fetch_statistics_row(self, user_id: str) -> Dict:
+        """Sayaç tablosundan istatistik satırı, yoksa aggregate sorgu"""
+        result = self.supabase.rpc('todo_statistics_cached', {'p_user_id': user_id}).execute()
+        if result.data:
+            return result.data[0]
+        
+        result = self.supabase.rpc('todo_statistics', {'p_user_id': user_id}).execute()
+        return result.data[0] if result.data else {}
+    
     def get_todo_statistics(self, user_id: str) -> Dict:
         """Gelişmiş istatistikler"""
         try:
-            todos = self.get_user_todos(user_id)
+            # Sayımlar veritabanında yapılır (user_todo_stats / todo_statistics)
+            row = self._fetch_statistics_row(user_id)
             
-            total = len(todos)
-            completed = len([t for t in todos if t.completed])
+            total = row.get('total') or 0
+            completed = row.get('completed') or 0
             pending = total - completed
-            overdue = len(self.get_overdue_todos(user_id))
+            overdue = row.get('overdue') or 0
             
             # Öncelik bazlı istatistikler
-            high_priority = len([t for t in todos if t.priority == Priority.HIGH])
-            medium_priority = len([t for t in todos if t.priority == Priority.MEDIUM])
-            low_priority = len([t for t in todos if t.priority == Priority.LOW])
+            high_priority = row.get('high_priority') or 0
+            medium_priority = row.get('medium_priority') or 0
+            low_priority = row.get('low_priority') or 0
             
             # Durum bazlı istatistikler
-            in_progress = len([t for t in todos if t.status == Status.IN_PROGRESS])
-            cancelled = len([t for t in todos if t.status == Status.CANCELLED])
+            in_progress = row.get('in_progress') or 0
+            cancelled = row.get('cancelled') or 0
             
             return {
                 'total': total,
@@ -404,5 +511,19 @@ class AdvancedDatabaseManager:
             print(f"Hava durumu kaydı oluşturma hatası: {e}")
             return None
 
+def create_advanced_db_manager():
+    """Yapılandırmaya göre (DATABASE_BACKEND) gelişmiş veritabanı yöneticisi oluştur"""
+    backend = os.getenv('DATABASE_BACKEND', 'supabase').lower()
+    if backend == 'postgres':
+        from postgres_database import PostgresAdvancedDatabaseManager
+        return PostgresAdvancedDatabaseManager()
+    if backend == 'sqlite':
+        from sqlite_database import SQLiteAdvancedDatabaseManager
+        return SQLiteAdvancedDatabaseManager()
+    if backend == 'fake':
+        from fake_supabase import FakeSupabaseClient
+        return AdvancedDatabaseManager(client=FakeSupabaseClient())
+    return AdvancedDatabaseManager()
+
 # Global gelişmiş veritabanı yöneticisi
-advanced_db_manager = AdvancedDatabaseManager()
+advanced_db_manager = create_advanced_db_manager()
@@ -1,8 +1,16 @@
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
 import os
+import sys
 from datetime import datetime
 import requests
 
+PROJECT_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from search_index import InvertedIndex
+from utils import search_todos as rank_todo_matches
+
 # Initialize Flask app
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-here')
@@ -10,6 +18,8 @@ app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-here')
 # In-memory storage
 todos = []
 todo_counter = 0
+# Todo id -> words of text, description and tags (search without scanning every todo)
+todo_index = InvertedIndex()
 categories = [
     {'id': 1, 'name': 'Genel', 'color': '#007bff'},
     {'id': 2, 'name': 'İş', 'color': '#28a745'},
@@ -55,6 +65,10 @@ def get_weather(city):
     except:
         return None
 
+def add_todo_record(todo):
+    todos.append(todo)
+    todo_index.add(todo['id'], [todo.get('text'), todo.get('description'), *(todo.get('tags') or [])], todo)
+
 def get_priority_order(priority):
     priority_map = {'yüksek': 1, 'orta': 2, 'düşük': 3}
     return priority_map.get(priority, 2)
@@ -197,7 +211,7 @@ def add_todo():
         'created_at': datetime.now().strftime('%Y-%m-%d %H:%M')
     }
     
-    todos.append(new_todo)
+    add_todo_record(new_todo)
     return redirect(url_for('index'))
 
 @app.route('/add_advanced_todo', methods=['POST'])
@@ -226,7 +240,7 @@ def add_advanced_todo():
         'category_id': int(category_id) if category_id else None
     }
     
-    todos.append(new_todo)
+    add_todo_record(new_todo)
     return redirect(url_for('advanced_index'))
 
 @app.route('/add_category', methods=['POST'])
@@ -258,13 +272,9 @@ def search_todos():
     if not query:
         return redirect(url_for('advanced_index'))
     
-    # Basit arama - todo metninde, açıklamada ve etiketlerde ara
-    filtered_todos = []
-    for todo in todos:
-        if (query.lower() in todo.get('text', '').lower() or
-            query.lower() in todo.get('description', '').lower() or
-            any(query.lower() in tag.lower() for tag in todo.get('tags', []))):
-            filtered_todos.append(todo)
+    # İndeks tüm kelimeleri içeren todo'ları bulur; yalnızca onlar sıralanır
+    candidates = [todo_index.get(key) for key in todo_index.search(query)]
+    filtered_todos = rank_todo_matches(candidates, query)
     
     stats = get_todo_statistics()
     
@@ -296,6 +306,7 @@ def complete_todo(todo_id):
 def delete_todo(todo_id):
     global todos
     todos = [todo for todo in todos if todo['id'] != todo_id]
+    todo_index.remove(todo_id)
     # Hangi sayfadan geldiğini kontrol et
     referer = request.headers.get('Referer', '')
     if '/advanced' in referer:
@@ -335,7 +346,7 @@ def api_create_todo():
         'created_at': datetime.now().strftime('%Y-%m-%d %H:%M')
     }
     
-    todos.append(new_todo)
+    add_todo_record(new_todo)
     
     return jsonify({
         'success': True,
@@ -1,6 +1,7 @@
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
 from dotenv import load_dotenv
 import os
+import sys
 from datetime import datetime
 from supabase import create_client, Client
 import requests
@@ -10,6 +11,20 @@ load_dotenv()
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 TEMPLATE_DIR = os.path.normpath(os.path.join(BASE_DIR, '..', 'templates'))
 STATIC_DIR = os.path.normpath(os.path.join(BASE_DIR, '..', 'static'))
+PROJECT_ROOT = os.path.normpath(os.path.join(BASE_DIR, '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from todo_cache import UserDataCache
+from cache_bus import create_invalidation_bus
+from page_loader import PageLoader, WEATHER_DEADLINE, DB_DEADLINE
+from async_database import AsyncAdvancedDatabaseManager, AsyncPageLoader
+from db_metrics import DBMetrics
+from utils import search_todos as rank_todo_matches
+from search_index import TrigramIndex, InvertedIndex, DEFAULT_THRESHOLD
+from due_index import DueDateIndex, parse_due_date
+from todo_stats import TodoStats
+from user_locks import StripedLock, IdAllocator
 
 app = Flask(
     __name__,
@@ -35,6 +50,11 @@ try:
 except Exception as _e:
     supabase = None
 
+# Count and time every Supabase round trip per request; warns on budget overruns and
+# repeated queries, adds Server-Timing in debug mode and serves /debug/db-stats.
+db_metrics = DBMetrics(app)
+supabase = db_metrics.instrument(supabase)
+
 # Helpers for Supabase
 def get_or_create_user(username: str) -> str | None:
     try:
@@ -47,39 +67,248 @@ def get_or_create_user(username: str) -> str | None:
     except Exception:
         return None
 
+# Per-user read-through cache for todo/category lists; mutation routes patch it and publish
+# the write on the invalidation bus so every other cache attached to it evicts the user.
+# With CACHE_INVALIDATION_BACKEND=postgres the bus spans workers (LISTEN/NOTIFY), which makes
+# long TTLs safe; the default 'memory' bus only reaches caches in this process, so the TTL
+# bounds how stale another worker's view can get.
+cache_bus = None
+try:
+    cache_bus = create_invalidation_bus()
+except Exception as _e:
+    print(f"Cache invalidation bus unavailable, falling back to TTL only: {_e}")
+_default_ttl = '3600' if os.environ.get('CACHE_INVALIDATION_BACKEND', 'memory').lower() == 'postgres' else '60'
+user_cache = UserDataCache(
+    max_users=int(os.environ.get('TODO_CACHE_MAX_USERS', '1024')),
+    ttl=float(os.environ.get('TODO_CACHE_TTL', _default_ttl))
+)
+if cache_bus is not None:
+    user_cache.attach_bus(cache_bus)
+
+def _query_user_todos(user_id: str):
+    res = supabase.table('todos').select('*').eq('user_id', user_id).order('created_at').execute()
+    return res.data or []
+
+def _query_user_categories(user_id: str):
+    res = supabase.table('categories').select('*').eq('user_id', user_id).order('created_at').execute()
+    return res.data or []
+
 def fetch_user_todos(user_id: str):
     try:
-        res = supabase.table('todos').select('*').eq('user_id', user_id).order('created_at').execute()
-        return res.data or []
+        return user_cache.get(user_id, 'todos', lambda: _query_user_todos(user_id))
     except Exception:
         return []
 
 def fetch_user_categories(user_id: str):
     try:
-        res = supabase.table('categories').select('*').eq('user_id', user_id).order('created_at').execute()
-        return res.data or []
+        return user_cache.get(user_id, 'categories', lambda: _query_user_categories(user_id))
     except Exception:
         return []
 
+def begin_cache_write(user_id: str):
+    # register before the DB write: the NOTIFY for it may arrive before the write returns
+    return cache_bus.expect_echo(user_id, user_cache) if cache_bus is not None else None
+
+def finish_cache_write(user_id: str, kind: str, echo, rows, patch):
+    # write-through: patch our copy with the returned rows (bump if none), evict everyone else
+    if rows:
+        user_cache.apply(user_id, kind, patch)
+    else:
+        user_cache.bump(user_id, kind)
+    if cache_bus is not None:
+        if not rows:
+            cache_bus.cancel_echo(echo)
+        cache_bus.publish(user_id, source=user_cache, echo=echo)
+
+def fail_cache_write(user_id: str, kind: str, echo):
+    # outcome unknown: drop our copy and tell every cache, this one included
+    user_cache.bump(user_id, kind)
+    if cache_bus is not None:
+        cache_bus.cancel_echo(echo)
+        try:
+            cache_bus.publish(user_id)
+        except Exception as e:
+            print(f"Cache invalidation publish failed: {e}")
+
+def cache_append(user_id: str, kind: str, echo, rows):
+    # write-through for inserts: cached list + returned rows
+    finish_cache_write(user_id, kind, echo, rows, lambda cached: cached + list(rows or []))
+
+def fetch_user_statistics(user_id: str):
+    # trigger-maintained counters first (primary-key lookup), aggregate query as fallback
+    try:
+        res = supabase.rpc('todo_statistics_cached', {'p_user_id': user_id}).execute()
+        if not res.data:
+            res = supabase.rpc('todo_statistics', {'p_user_id': user_id}).execute()
+        row = (res.data or [{}])[0]
+    except Exception:
+        row = {}
+    total = row.get('total') or 0
+    completed = row.get('completed') or 0
+    return {
+        'total': total,
+        'completed': completed,
+        'pending': total - completed,
+        'completion_rate': round((completed / total * 100), 1) if total > 0 else 0,
+        'high_priority': row.get('high_priority') or 0,
+        'medium_priority': row.get('medium_priority') or 0,
+        'low_priority': row.get('low_priority') or 0,
+        'overdue': row.get('overdue') or 0
+    }
+
+# /advanced loads todos, categories and stats over the async PostgREST client on one shared
+# background loop (one client, reused connections); ADVANCED_ASYNC_LOADS=0 falls back to the
+# thread pool. The async client is wrapped by db_metrics like the sync one.
+def create_async_manager():
+    manager = AsyncAdvancedDatabaseManager(url=SUPABASE_URL, key=SUPABASE_ANON_KEY)
+    manager.client = db_metrics.instrument(manager.client)
+    return manager
+
+async_pages = None
+if supabase and os.environ.get('ADVANCED_ASYNC_LOADS', '1') == '1':
+    async_pages = AsyncPageLoader(create_async_manager, timeout=max(WEATHER_DEADLINE, DB_DEADLINE) + 1)
+
+SEARCH_PAGE_SIZE = int(os.environ.get('SEARCH_PAGE_SIZE', '20'))
+
+SEARCH_FUZZY_THRESHOLD = float(os.environ.get('SEARCH_FUZZY_THRESHOLD', str(DEFAULT_THRESHOLD)))
+
+def search_user_todos(user_id: str, username: str, query: str, limit: int = SEARCH_PAGE_SIZE, offset: int = 0,
+                      fuzzy: bool = False, threshold: float = SEARCH_FUZZY_THRESHOLD):
+    # ranked full-text search: GIN-indexed search_todos() in Postgres, the per-user inverted
+    # index in memory.
+    # fuzzy mode tolerates typos and ı/i, ş/s, ğ/g mix-ups: pg_trgm fuzzy_search_todos() in
+    # Postgres, the per-user trigram index in memory.
+    if not query or not query.strip():
+        return []
+    if supabase:
+        try:
+            if fuzzy:
+                res = supabase.rpc('fuzzy_search_todos', {
+                    'p_user_id': user_id,
+                    'p_query': query,
+                    'p_threshold': threshold,
+                    'p_limit': limit,
+                    'p_offset': offset
+                }).execute()
+            else:
+                res = supabase.rpc('search_todos', {
+                    'p_user_id': user_id,
+                    'p_query': query,
+                    'p_limit': limit,
+                    'p_offset': offset
+                }).execute()
+            return res.data or []
+        except Exception:
+            app.logger.exception('Todo search failed')
+            return []
+    user_state = USERS.get(username)
+    if not user_state:
+        return []
+    with user_state['lock']:
+        if fuzzy:
+            index = user_state['search_index']
+            return [index.get(key) for key, _ in index.search(query, threshold, limit, offset)]
+        # the index narrows to todos matching every word; only those get scored
+        index = user_state['fulltext_index']
+        candidates = [index.get(key) for key in index.search(query)]
+        return rank_todo_matches(candidates, query, limit, offset)
+
 # In-memory user store: username -> per-user state
 USERS = {}
+# usernames hash onto a fixed set of locks: users rarely wait on each other,
+# and the lock count does not grow with the user count
+USER_LOCKS = StripedLock(int(os.environ.get('USER_LOCK_STRIPES', '64')))
 
 def get_current_username():
     return session.get('username')
 
 def ensure_user(username):
-    if username not in USERS:
-        USERS[username] = {
-            'todos': [],
-            'todo_counter': 0,
-            'categories': [
-                {'id': 1, 'name': 'Genel', 'color': '#007bff'},
-                {'id': 2, 'name': 'İş', 'color': '#28a745'},
-                {'id': 3, 'name': 'Kişisel', 'color': '#ffc107'},
-                {'id': 4, 'name': 'Acil', 'color': '#dc3545'}
-            ],
-            'category_counter': 4,
-        }
+    user_state = USERS.get(username)
+    if user_state is not None:
+        return user_state
+    with USER_LOCKS(username):
+        # re-check: another request may have created the user while we waited
+        if username not in USERS:
+            USERS[username] = _new_user_state(username)
+        return USERS[username]
+
+def _new_user_state(username):
+    return {
+        # guards every structure below; ids come from the allocators
+        'lock': USER_LOCKS(username),
+        'todos': [],
+        'todo_ids': IdAllocator(0),
+        'categories': [
+            {'id': 1, 'name': 'Genel', 'color': '#007bff'},
+            {'id': 2, 'name': 'İş', 'color': '#28a745'},
+            {'id': 3, 'name': 'Kişisel', 'color': '#ffc107'},
+            {'id': 4, 'name': 'Acil', 'color': '#dc3545'}
+        ],
+        'category_ids': IdAllocator(4),
+        # todo id -> todo text trigrams, for fuzzy search
+        'search_index': TrigramIndex(),
+        # word -> todo ids over text, description and tags, for full-text search
+        'fulltext_index': InvertedIndex(),
+        # incomplete todos ordered by due date, for overdue filter and stats
+        'due_index': DueDateIndex(),
+        # counters kept in step with todos, so stats never rescan the list
+        'stats': TodoStats(),
+    }
+
+def index_memory_due_date(user_state, todo):
+    if todo.get('completed'):
+        user_state['due_index'].remove(todo['id'])
+    else:
+        user_state['due_index'].add(todo['id'], todo.get('due_date'), todo)
+
+def searchable_fields(todo):
+    return [todo.get('text'), todo.get('description'), *(todo.get('tags') or [])]
+
+def add_memory_todo(user_state, todo):
+    with user_state['lock']:
+        user_state['todos'].append(todo)
+        user_state['search_index'].add(todo['id'], todo['text'], todo)
+        user_state['fulltext_index'].add(todo['id'], searchable_fields(todo), todo)
+        index_memory_due_date(user_state, todo)
+        user_state['stats'].track(todo['id'], todo)
+
+def remove_memory_todo(user_state, todo_id):
+    with user_state['lock']:
+        user_state['todos'] = [todo for todo in user_state['todos'] if todo['id'] != todo_id]
+        user_state['search_index'].remove(todo_id)
+        user_state['fulltext_index'].remove(todo_id)
+        user_state['due_index'].remove(todo_id)
+        user_state['stats'].untrack(todo_id)
+
+def toggle_memory_todo(user_state, todo_id):
+    with user_state['lock']:
+        for todo in user_state['todos']:
+            if todo['id'] == todo_id:
+                todo['completed'] = not todo['completed']
+                index_memory_due_date(user_state, todo)
+                user_state['stats'].track(todo_id, todo)
+                return todo
+    return None
+
+def add_memory_category(user_state, category):
+    with user_state['lock']:
+        user_state['categories'].append(category)
+
+def is_overdue(todo, now):
+    if todo.get('completed', False):
+        return False
+    due_date = parse_due_date(todo.get('due_date'))
+    if due_date is None:
+        return False
+    # DB rows carry aware timestamps, form values are naive local time
+    return due_date.timestamp() < now.timestamp()
+
+def filter_overdue(todos, user_state=None):
+    if user_state is not None:
+        with user_state['lock']:
+            return user_state['due_index'].overdue()
+    now = datetime.now()
+    return [todo for todo in todos if is_overdue(todo, now)]
 
 def require_login_redirect():
     username = get_current_username()
@@ -119,7 +348,7 @@ def get_weather(city):
             'units': 'metric',
             'lang': 'tr'
         }
-        response = requests.get(WEATHER_API_URL, params=params)
+        response = requests.get(WEATHER_API_URL, params=params, timeout=WEATHER_DEADLINE)
         data = response.json()
         
         if response.status_code == 200:
@@ -142,35 +371,19 @@ def get_priority_order(priority):
 def validate_todo_text(text):
     return 2 <= len(text) <= 500
 
-def get_todo_statistics():
-    total = len(todos)
-    completed = len([todo for todo in todos if todo.get('completed', False)])
-    pending = total - completed
-    
-    high_priority = len([todo for todo in todos if todo.get('priority') == 'yüksek'])
-    medium_priority = len([todo for todo in todos if todo.get('priority') == 'orta'])
-    low_priority = len([todo for todo in todos if todo.get('priority') == 'düşük'])
-    
-    overdue = 0
-    for todo in todos:
-        if todo.get('due_date'):
-            try:
-                due_date = datetime.strptime(todo['due_date'], '%Y-%m-%dT%H:%M')
-                if due_date < datetime.now() and not todo.get('completed', False):
-                    overdue += 1
-            except:
-                pass
-    
-    return {
-        'total': total,
-        'completed': completed,
-        'pending': pending,
-        'completion_rate': round((completed / total * 100), 1) if total > 0 else 0,
-        'high_priority': high_priority,
-        'medium_priority': medium_priority,
-        'low_priority': low_priority,
-        'overdue': overdue
-    }
+def get_todo_statistics(todos_ref):
+    # one pass over rows fetched from the database
+    now = datetime.now()
+    return TodoStats.from_todos(todos_ref).as_dict(overdue=sum(1 for todo in todos_ref if is_overdue(todo, now)))
+
+def memory_todo_statistics(user_state):
+    with user_state['lock']:
+        return user_state['stats'].as_dict(overdue=user_state['due_index'].overdue_count())
+
+def check_memory_statistics(user_state):
+    # consistency check for tests: [] when the counters match the todo list
+    with user_state['lock']:
+        return user_state['stats'].check(user_state['todos'], key=lambda todo: todo['id'])
 
 @app.route('/')
 def index():
@@ -181,27 +394,26 @@ def index():
     username = get_current_username()
     user_id = session.get('user_id')
     if not supabase:
-        ensure_user(username)
-        user_state = USERS[username]
+        user_state = ensure_user(username)
     else:
         user_state = None
     try:
         city = request.args.get('city', 'Istanbul')
         filter_priority = request.args.get('filter')
-        weather_data = get_weather(city)
-
-        filtered_todos = fetch_user_todos(user_id) if supabase else user_state['todos']
+        # weather, todos and stats are independent: overlap them on the shared pool
+        loader = PageLoader('index')
+        loader.submit('weather', get_weather, city, deadline=WEATHER_DEADLINE)
+        if supabase:
+            loader.submit('todos', fetch_user_todos, user_id, deadline=DB_DEADLINE, default=[])
+            loader.submit('stats', fetch_user_statistics, user_id, deadline=DB_DEADLINE,
+                          default=get_todo_statistics([]))
+        loaded = loader.gather()
+        weather_data = loaded['weather']
+
+        filtered_todos = loaded['todos'] if supabase else user_state['todos']
         if filter_priority:
             if filter_priority == 'overdue':
-                filtered_todos = []
-                for todo in filtered_todos:
-                    if todo.get('due_date'):
-                        try:
-                            due_date = datetime.strptime(todo['due_date'], '%Y-%m-%dT%H:%M')
-                            if due_date < datetime.now() and not todo.get('completed', False):
-                                filtered_todos.append(todo)
-                        except:
-                            pass
+                filtered_todos = filter_overdue(filtered_todos, user_state)
             else:
                 filtered_todos = [todo for todo in filtered_todos if todo.get('priority') == filter_priority]
 
@@ -210,33 +422,11 @@ def index():
             key=lambda x: (get_priority_order(x.get('priority', 'orta')), x.get('created_at', ''))
         )
 
-        # compute stats for this user
-        todos_ref = filtered_todos
-        total = len(todos_ref)
-        completed = len([t for t in todos_ref if t.get('completed')])
-        pending = total - completed
-        high_priority = len([t for t in todos_ref if t.get('priority') == 'yüksek'])
-        medium_priority = len([t for t in todos_ref if t.get('priority') == 'orta'])
-        low_priority = len([t for t in todos_ref if t.get('priority') == 'düşük'])
-        overdue = 0
-        for t in todos_ref:
-            if t.get('due_date'):
-                try:
-                    due_date = datetime.strptime(t['due_date'], '%Y-%m-%dT%H:%M')
-                    if due_date < datetime.now() and not t.get('completed', False):
-                        overdue += 1
-                except:
-                    pass
-        stats = {
-            'total': total,
-            'completed': completed,
-            'pending': pending,
-            'completion_rate': round((completed / total * 100), 1) if total > 0 else 0,
-            'high_priority': high_priority,
-            'medium_priority': medium_priority,
-            'low_priority': low_priority,
-            'overdue': overdue
-        }
+        # stats cover all of the user's todos, not just the filtered view
+        if supabase:
+            stats = loaded['stats']
+        else:
+            stats = memory_todo_statistics(user_state)
 
         return render_template(
             'index.html',
@@ -264,27 +454,33 @@ def advanced_index():
     username = get_current_username()
     user_id = session.get('user_id')
     if not supabase:
-        ensure_user(username)
-        user_state = USERS[username]
+        user_state = ensure_user(username)
     else:
         user_state = None
     try:
         city = request.args.get('city', 'Istanbul')
         filter_priority = request.args.get('filter')
-        weather_data = get_weather(city)
-
-        filtered_todos = fetch_user_todos(user_id) if supabase else user_state['todos']
+        # weather, todos, categories and stats are independent: load them concurrently
+        if async_pages:
+            loaded = async_pages.load_advanced_page(
+                user_id, city, get_weather, stats_default=get_todo_statistics([]), cache=user_cache,
+                weather_deadline=WEATHER_DEADLINE, db_deadline=DB_DEADLINE
+            )
+        else:
+            loader = PageLoader('advanced_index')
+            loader.submit('weather', get_weather, city, deadline=WEATHER_DEADLINE)
+            if supabase:
+                loader.submit('todos', fetch_user_todos, user_id, deadline=DB_DEADLINE, default=[])
+                loader.submit('categories', fetch_user_categories, user_id, deadline=DB_DEADLINE, default=[])
+                loader.submit('stats', fetch_user_statistics, user_id, deadline=DB_DEADLINE,
+                              default=get_todo_statistics([]))
+            loaded = loader.gather()
+        weather_data = loaded['weather']
+
+        filtered_todos = loaded['todos'] if supabase else user_state['todos']
         if filter_priority:
             if filter_priority == 'overdue':
-                filtered_todos = []
-                for todo in filtered_todos:
-                    if todo.get('due_date'):
-                        try:
-                            due_date = datetime.strptime(todo['due_date'], '%Y-%m-%dT%H:%M')
-                            if due_date < datetime.now() and not todo.get('completed', False):
-                                filtered_todos.append(todo)
-                        except:
-                            pass
+                filtered_todos = filter_overdue(filtered_todos, user_state)
             else:
                 filtered_todos = [todo for todo in filtered_todos if todo.get('priority') == filter_priority]
 
@@ -293,33 +489,11 @@ def advanced_index():
             key=lambda x: (get_priority_order(x.get('priority', 'orta')), x.get('created_at', ''))
         )
 
-        # same stats as index for this user
-        todos_ref = filtered_todos
-        total = len(todos_ref)
-        completed = len([t for t in todos_ref if t.get('completed')])
-        pending = total - completed
-        high_priority = len([t for t in todos_ref if t.get('priority') == 'yüksek'])
-        medium_priority = len([t for t in todos_ref if t.get('priority') == 'orta'])
-        low_priority = len([t for t in todos_ref if t.get('priority') == 'düşük'])
-        overdue = 0
-        for t in todos_ref:
-            if t.get('due_date'):
-                try:
-                    due_date = datetime.strptime(t['due_date'], '%Y-%m-%dT%H:%M')
-                    if due_date < datetime.now() and not t.get('completed', False):
-                        overdue += 1
-                except:
-                    pass
-        stats = {
-            'total': total,
-            'completed': completed,
-            'pending': pending,
-            'completion_rate': round((completed / total * 100), 1) if total > 0 else 0,
-            'high_priority': high_priority,
-            'medium_priority': medium_priority,
-            'low_priority': low_priority,
-            'overdue': overdue
-        }
+        # stats cover all of the user's todos, not just the filtered view
+        if supabase:
+            stats = loaded['stats']
+        else:
+            stats = memory_todo_statistics(user_state)
 
         return render_template(
             'advanced_index.html',
@@ -328,7 +502,7 @@ def advanced_index():
             current_city=city,
             current_filter=filter_priority,
             stats=stats,
-            categories=(fetch_user_categories(user_id) if supabase else user_state['categories']),
+            categories=(loaded['categories'] if supabase else user_state['categories']),
             user=username
         )
     except Exception as e:
@@ -340,46 +514,97 @@ def advanced_index():
             'static_dir': STATIC_DIR
         }), 500
 
+@app.route('/search_todos')
+def search_todos():
+    gate = require_login_redirect()
+    if gate:
+        return gate
+    query = request.args.get('q', '').strip()
+    if not query:
+        return redirect(url_for('advanced_index'))
+    username = get_current_username()
+    user_id = session.get('user_id')
+    page = max(request.args.get('page', 1, type=int), 1)
+    fuzzy = request.args.get('mode') == 'fuzzy'
+    try:
+        loader = PageLoader('search_todos')
+        loader.submit('todos', search_user_todos, user_id, username, query,
+                      SEARCH_PAGE_SIZE, (page - 1) * SEARCH_PAGE_SIZE, fuzzy,
+                      deadline=DB_DEADLINE, default=[])
+        if supabase:
+            loader.submit('categories', fetch_user_categories, user_id, deadline=DB_DEADLINE, default=[])
+            loader.submit('stats', fetch_user_statistics, user_id, deadline=DB_DEADLINE,
+                          default=get_todo_statistics([]))
+        loaded = loader.gather()
+
+        if supabase:
+            stats = loaded['stats']
+            categories = loaded['categories']
+        else:
+            user_state = ensure_user(username)
+            stats = memory_todo_statistics(user_state)
+            categories = user_state['categories']
+
+        # results keep their relevance order
+        return render_template(
+            'advanced_index.html',
+            todos=loaded['todos'],
+            weather=None,
+            current_city=request.args.get('city', 'Istanbul'),
+            current_filter=None,
+            stats=stats,
+            categories=categories,
+            user=username,
+            search_query=query,
+            page=page
+        )
+    except Exception as e:
+        app.logger.exception('Search route failed')
+        return jsonify({
+            'error': str(e),
+            'hint': 'Template render failed',
+            'template_dir': TEMPLATE_DIR,
+            'static_dir': STATIC_DIR
+        }), 500
+
 @app.route('/add', methods=['POST'])
 def add_todo():
     gate = require_login_redirect()
     if gate:
         return gate
     username = get_current_username()
-    ensure_user(username)
-    user_state = USERS[username] if not supabase else None
+    user_state = ensure_user(username) if not supabase else None
     todo_text = request.form.get('todo')
     priority = request.form.get('priority', 'orta')
     
     if not validate_todo_text(todo_text):
         return redirect(url_for('index'))
     
-    if not supabase:
-        user_state['todo_counter'] += 1
     new_todo = {
-        'id': (user_state['todo_counter'] if not supabase else None),
+        'id': (user_state['todo_ids'].next() if not supabase else None),
         'text': todo_text,
         'priority': priority,
         'completed': False,
         'created_at': datetime.now().strftime('%Y-%m-%d %H:%M')
     }
     if supabase:
+        echo = begin_cache_write(session.get('user_id'))
         try:
-            supabase.table('todos').insert({
+            res = supabase.table('todos').insert({
                 'user_id': session.get('user_id'),
                 'text': todo_text,
                 'priority': priority,
                 'completed': False
             }).execute()
+            cache_append(session.get('user_id'), 'todos', echo, res.data)
         except Exception:
+            fail_cache_write(session.get('user_id'), 'todos', echo)
             # fallback to memory if insert fails
-            ensure_user(username)
-            user_state = USERS[username]
-            user_state['todo_counter'] += 1
-            new_todo['id'] = user_state['todo_counter']
-            user_state['todos'].append(new_todo)
+            user_state = ensure_user(username)
+            new_todo['id'] = user_state['todo_ids'].next()
+            add_memory_todo(user_state, new_todo)
     else:
-        user_state['todos'].append(new_todo)
+        add_memory_todo(user_state, new_todo)
     return redirect(url_for('index'))
 
 @app.route('/add_advanced_todo', methods=['POST'])
@@ -388,8 +613,7 @@ def add_advanced_todo():
     if gate:
         return gate
     username = get_current_username()
-    ensure_user(username)
-    user_state = USERS[username] if not supabase else None
+    user_state = ensure_user(username) if not supabase else None
     todo_text = request.form.get('todo')
     priority = request.form.get('priority', 'orta')
     category_id = request.form.get('category_id')
@@ -400,10 +624,8 @@ def add_advanced_todo():
     if not validate_todo_text(todo_text):
         return redirect(url_for('advanced_index'))
     
-    if not supabase:
-        user_state['todo_counter'] += 1
     new_todo = {
-        'id': (user_state['todo_counter'] if not supabase else None),
+        'id': (user_state['todo_ids'].next() if not supabase else None),
         'text': todo_text,
         'priority': priority,
         'completed': False,
@@ -414,8 +636,9 @@ def add_advanced_todo():
         'category_id': int(category_id) if category_id else None
     }
     if supabase:
+        echo = begin_cache_write(session.get('user_id'))
         try:
-            supabase.table('todos').insert({
+            res = supabase.table('todos').insert({
                 'user_id': session.get('user_id'),
                 'text': todo_text,
                 'priority': priority,
@@ -425,14 +648,14 @@ def add_advanced_todo():
                 'tags': [tag.strip() for tag in tags.split(',') if tag.strip()] if tags else None,
                 'category_id': category_id or None
             }).execute()
+            cache_append(session.get('user_id'), 'todos', echo, res.data)
         except Exception:
-            ensure_user(username)
-            user_state = USERS[username]
-            user_state['todo_counter'] += 1
-            new_todo['id'] = user_state['todo_counter']
-            user_state['todos'].append(new_todo)
+            fail_cache_write(session.get('user_id'), 'todos', echo)
+            user_state = ensure_user(username)
+            new_todo['id'] = user_state['todo_ids'].next()
+            add_memory_todo(user_state, new_todo)
     else:
-        user_state['todos'].append(new_todo)
+        add_memory_todo(user_state, new_todo)
     return redirect(url_for('advanced_index'))
 
 @app.route('/add_category', methods=['POST'])
@@ -441,8 +664,7 @@ def add_category():
     if gate:
         return gate
     username = get_current_username()
-    ensure_user(username)
-    user_state = USERS[username] if not supabase else None
+    user_state = ensure_user(username) if not supabase else None
     name = request.form.get('name')
     color = request.form.get('color', '#007bff')
     
@@ -452,28 +674,27 @@ def add_category():
     if not color.startswith('#'):
         color = '#' + color
     
-    if not supabase:
-        user_state['category_counter'] += 1
     new_category = {
-        'id': (user_state['category_counter'] if not supabase else None),
+        'id': (user_state['category_ids'].next() if not supabase else None),
         'name': name,
         'color': color
     }
     if supabase:
+        echo = begin_cache_write(session.get('user_id'))
         try:
-            supabase.table('categories').insert({
+            res = supabase.table('categories').insert({
                 'user_id': session.get('user_id'),
                 'name': name,
                 'color': color if color.startswith('#') else f'#{color}'
             }).execute()
+            cache_append(session.get('user_id'), 'categories', echo, res.data)
         except Exception:
-            ensure_user(username)
-            user_state = USERS[username]
-            user_state['category_counter'] += 1
-            new_category['id'] = user_state['category_counter']
-            user_state['categories'].append(new_category)
+            fail_cache_write(session.get('user_id'), 'categories', echo)
+            user_state = ensure_user(username)
+            new_category['id'] = user_state['category_ids'].next()
+            add_memory_category(user_state, new_category)
     else:
-        user_state['categories'].append(new_category)
+        add_memory_category(user_state, new_category)
     return redirect(url_for('advanced_index'))
 
 @app.route('/complete/<int:todo_id>')
@@ -483,20 +704,18 @@ def complete_todo(todo_id):
         return gate
     username = get_current_username()
     if supabase:
+        user_id = session.get('user_id')
+        echo = begin_cache_write(user_id)
         try:
-            user_id = session.get('user_id')
-            row = supabase.table('todos').select('completed').eq('id', todo_id).eq('user_id', user_id).single().execute().data
-            if row is not None:
-                supabase.table('todos').update({'completed': (not row.get('completed', False))}).eq('id', todo_id).eq('user_id', user_id).execute()
+            # atomic flip in one round trip, scoped to the current user
+            res = supabase.rpc('toggle_todo_complete', {'p_todo_id': todo_id, 'p_user_id': user_id}).execute()
+            updated = {row['id']: row for row in (res.data or [])}
+            finish_cache_write(user_id, 'todos', echo, res.data,
+                               lambda cached: [updated.get(t.get('id'), t) for t in cached])
         except Exception:
-            pass
+            fail_cache_write(user_id, 'todos', echo)
     else:
-        ensure_user(username)
-        user_state = USERS[username]
-        for todo in user_state['todos']:
-            if todo['id'] == todo_id:
-                todo['completed'] = not todo['completed']
-                break
+        toggle_memory_todo(ensure_user(username), todo_id)
     referer = request.headers.get('Referer', '')
     if '/advanced' in referer:
         return redirect(url_for('advanced_index'))
@@ -509,15 +728,18 @@ def delete_todo(todo_id):
         return gate
     username = get_current_username()
     if supabase:
+        user_id = session.get('user_id')
+        echo = begin_cache_write(user_id)
         try:
-            user_id = session.get('user_id')
-            supabase.table('todos').delete().eq('id', todo_id).eq('user_id', user_id).execute()
+            res = supabase.table('todos').delete().eq('id', todo_id).eq('user_id', user_id).execute()
+            deleted = {row['id'] for row in (res.data or [])}
+            finish_cache_write(user_id, 'todos', echo, res.data,
+                               lambda cached: [t for t in cached if t.get('id') not in deleted])
         except Exception:
-            pass
+            fail_cache_write(user_id, 'todos', echo)
     else:
-        ensure_user(username)
-        user_state = USERS[username]
-        user_state['todos'] = [todo for todo in user_state['todos'] if todo['id'] != todo_id]
+        user_state = ensure_user(username)
+        remove_memory_todo(user_state, todo_id)
     referer = request.headers.get('Referer', '')
     if '/advanced' in referer:
         return redirect(url_for('advanced_index'))
@@ -559,41 +781,73 @@ def api_get_todos():
     if supabase:
         todos_ref = fetch_user_todos(user_id)
     else:
-        if username not in USERS:
+        user_state = USERS.get(username)
+        if user_state is None:
             return jsonify({'success': True, 'data': [], 'count': 0})
-        todos_ref = USERS[username]['todos']
+        with user_state['lock']:
+            todos_ref = list(user_state['todos'])
     return jsonify({'success': True, 'data': todos_ref, 'count': len(todos_ref)})
 
+@app.route('/api/todos/search', methods=['GET'])
+def api_search_todos():
+    username = get_current_username()
+    user_id = session.get('user_id')
+    if not username:
+        return jsonify({'success': False, 'error': 'auth required'}), 401
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'success': False, 'error': 'q parameter required'}), 400
+    limit = min(max(request.args.get('limit', SEARCH_PAGE_SIZE, type=int), 1), 100)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    mode = request.args.get('mode', 'fulltext')
+    if mode not in ('fulltext', 'fuzzy'):
+        return jsonify({'success': False, 'error': 'mode must be fulltext or fuzzy'}), 400
+    threshold = min(max(request.args.get('threshold', SEARCH_FUZZY_THRESHOLD, type=float), 0.0), 1.0)
+    results = search_user_todos(user_id, username, query, limit, offset,
+                                fuzzy=(mode == 'fuzzy'), threshold=threshold)
+    return jsonify({
+        'success': True,
+        'data': results,
+        'count': len(results),
+        'limit': limit,
+        'offset': offset,
+        'mode': mode
+    })
+
 @app.route('/api/todos', methods=['POST'])
 def api_create_todo():
     username = get_current_username()
     user_id = session.get('user_id')
     if not username:
         return jsonify({'success': False, 'error': 'auth required'}), 401
-    user_state = USERS[username] if not supabase else None
+    user_state = ensure_user(username) if not supabase else None
     data = request.get_json()
     if not data or 'text' not in data:
         return jsonify({'success': False, 'error': 'Text field required'}), 400
     
-    if not supabase:
-        user_state['todo_counter'] += 1
     priority = data.get('priority', 'orta')
     new_todo = {
-        'id': (user_state['todo_counter'] if not supabase else None),
+        'id': (user_state['todo_ids'].next() if not supabase else None),
         'text': data['text'],
         'priority': priority,
         'completed': False,
         'created_at': datetime.now().strftime('%Y-%m-%d %H:%M')
     }
     if supabase:
-        supabase.table('todos').insert({
-            'user_id': user_id,
-            'text': data['text'],
-            'priority': priority,
-            'completed': False
-        }).execute()
+        echo = begin_cache_write(user_id)
+        try:
+            res = supabase.table('todos').insert({
+                'user_id': user_id,
+                'text': data['text'],
+                'priority': priority,
+                'completed': False
+            }).execute()
+        except Exception:
+            fail_cache_write(user_id, 'todos', echo)
+            raise
+        cache_append(user_id, 'todos', echo, res.data)
     else:
-        user_state['todos'].append(new_todo)
+        add_memory_todo(user_state, new_todo)
     return jsonify({
         'success': True,
         'data': new_todo
@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
 import requests
 import os
 from datetime import datetime
@@ -11,6 +11,8 @@ from models import Todo, WeatherData, TodoManager
 from utils import get_priority_order, get_weather_data, format_datetime, validate_todo_text, get_todo_statistics
 from config import config
 from database import db_manager
+from page_loader import PageLoader, WEATHER_DEADLINE, DB_DEADLINE
+from db_metrics import DBMetrics
 from auth import (
     login_required, get_current_user, login_user, logout_user, 
     is_logged_in, get_user_todos, create_user_todo, update_user_todo, 
@@ -24,6 +26,11 @@ app.secret_key = 'your-secret-key-here'
 config_name = os.environ.get('FLASK_ENV', 'development')
 app.config.from_object(config[config_name])
 
+# İstek başına veritabanı çağrı sayısı/süresi (debug modunda Server-Timing ve /debug/db-stats)
+db_metrics = DBMetrics(app)
+if hasattr(db_manager, 'supabase'):
+    db_manager.supabase = db_metrics.instrument(db_manager.supabase)
+
 # Todo yöneticisi (Singleton pattern)
 todo_manager = TodoManager()
 
@@ -107,20 +114,34 @@ def index():
     city = request.args.get('city', 'Istanbul')
     filter_priority = request.args.get('filter')
     
-    # Hava durumu verilerini al (OOP kullanarak)
-    weather_data = get_weather_data(city, app.config['WEATHER_API_KEY'])
+    # Hava durumu ve veritabanı okumaları havuzda eşzamanlı çalışır; oturum bilgisi
+    # önceden okunur, havuz thread'leri istek bağlamına erişmez
+    loader = PageLoader('index')
+    loader.submit('weather', get_weather_data, city, app.config['WEATHER_API_KEY'], deadline=WEATHER_DEADLINE)
     
     # Kullanıcı giriş kontrolü
     if not is_logged_in():
+        weather_data = loader.gather()['weather']
         return render_template('login.html', weather=weather_data, current_city=city)
     
-    # Todo'ları veritabanından al (PostgreSQL)
-    all_todos = get_user_todos()
+    # Todo'lar ve kullanıcı bilgisi veritabanından (PostgreSQL)
+    user_id = session['user_id']
+    loader.submit('todos', db_manager.get_user_todos, user_id, deadline=DB_DEADLINE, default=[])
+    loader.submit('user', db_manager.get_user_by_username, session.get('username'), deadline=DB_DEADLINE)
+    
+    # Sonuçları topla (süre sınırı aşılan çağrı varsayılan değerle döner)
+    results = loader.gather()
+    all_todos = results['todos']
+    weather_data = results['weather']
+    user = results['user']
+    
+    # Öncelik filtresi ve istatistikler yüklenen listeden türetilir (ek sorgu yok)
     filtered_todos = (
-        get_user_todos_by_priority(filter_priority) 
+        [todo for todo in all_todos if todo.get('priority') == filter_priority]
         if filter_priority 
         else all_todos
     )
+    stats = get_todo_statistics(all_todos)
     
     # Todo'ları öncelik sırasına göre sırala (lambda fonksiyonu)
     sorted_todos = sorted(
@@ -128,9 +149,6 @@ def index():
         key=lambda x: (get_priority_order(x.get('priority', 'orta')), x['created_at'])
     )
     
-    # İstatistikleri hesapla (veritabanından)
-    stats = get_user_statistics()
-    
     return render_template(
         'index.html', 
         todos=sorted_todos, 
@@ -138,7 +156,7 @@ def index():
         current_city=city, 
         current_filter=filter_priority,
         stats=stats,
-        user=get_current_user()
+        user=user
     )
 
 @app.route('/add', methods=['POST'])
@@ -264,7 +282,7 @@ def api_update_todo(todo_id):
     if 'text' in data:
         todo.update_text(data['text'])
     if 'priority' in data:
-        todo.update_priority(data['priority'])
+        todo_manager.update_priority(todo_id, data['priority'])
     if 'completed' in data:
         if data['completed'] != todo.completed:
             todo.toggle_complete()
@@ -0,0 +1,262 @@
+"""
+Asenkron Veritabanı Yönetimi
+Birbirinden bağımsız sorguları eşzamanlı çalıştırmak için
+
+Supabase'in kullandığı postgrest paketindeki asenkron istemci ile
+AdvancedDatabaseManager'ın okuma arayüzünü sunar. Sayfa gecikmesi
+bağımlılıkların toplamı yerine en yavaşının süresi olur.
+
+Senkron view'ler AsyncPageLoader kullanır: tek bir arka plan event loop'u
+ve o loop'a bağlı tek istemci süreç boyunca yeniden kullanılır.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from postgrest import AsyncPostgrestClient
+
+from advanced_models import Category, Todo
+
+
+class AsyncAdvancedDatabaseManager:
+    """
+    Asenkron gelişmiş veritabanı yönetim sınıfı
+
+    İstemci oluşturulduğu event loop'a bağlıdır; uzun ömürlü kullanımda
+    (ASGI / async view) tek örnek, senkron view'lerde AsyncPageLoader kullanın.
+    """
+
+    def __init__(self, client: AsyncPostgrestClient = None, url: str = None, key: str = None):
+        """
+        Asenkron PostgREST istemcisini başlat
+
+        Args:
+            client (AsyncPostgrestClient): Hazır istemci
+            url (str): Supabase adresi (varsayılan SUPABASE_URL)
+            key (str): Anon anahtar (varsayılan api/main ile aynı SUPABASE_ANON_KEY,
+                yoksa SUPABASE_KEY)
+        """
+        if client is None:
+            url = url or os.getenv('SUPABASE_URL')
+            key = key or os.getenv('SUPABASE_ANON_KEY') or os.getenv('SUPABASE_KEY')
+
+            if not url or not key:
+                raise ValueError("SUPABASE_URL ve SUPABASE_ANON_KEY environment variables gerekli!")
+
+            client = AsyncPostgrestClient(
+                f"{url.rstrip('/')}/rest/v1",
+                headers={'apikey': key, 'Authorization': f'Bearer {key}'}
+            )
+        self.client = client
+
+    async def aclose(self):
+        """İstemci bağlantılarını kapat"""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def fetch_rows(self, table: str, user_id: str) -> List[Dict]:
+        """
+        Kullanıcının ham satırlarını oluşturulma sırasıyla getir
+
+        Hata yakalanmaz: önbelleğe boş liste yazılmaması için çağırana iletilir.
+
+        Args:
+            table (str): 'todos' veya 'categories'
+            user_id (str): Kullanıcı ID'si
+        """
+        result = await self.client.from_(table).select('*').eq('user_id', user_id).order('created_at').execute()
+        return result.data or []
+
+    async def get_user_todos(self, user_id: str) -> List[Todo]:
+        """Kullanıcının todo'larını getir"""
+        try:
+            result = await self.client.from_('todos').select('*').eq('user_id', user_id).order('created_at', desc=True).execute()
+            return [Todo.from_dict(todo_dict) for todo_dict in result.data]
+        except Exception as e:
+            print(f"Todo'ları getirme hatası: {e}")
+            return []
+
+    async def get_todos_by_priority(self, user_id: str, priority: str) -> List[Todo]:
+        """Önceliğe göre todo'ları getir"""
+        try:
+            result = await self.client.from_('todos').select('*').eq('user_id', user_id).eq('priority', priority).order('created_at', desc=True).execute()
+            return [Todo.from_dict(todo_dict) for todo_dict in result.data]
+        except Exception as e:
+            print(f"Öncelik bazlı todo getirme hatası: {e}")
+            return []
+
+    async def get_todos_by_category(self, user_id: str, category_id: str) -> List[Todo]:
+        """Kategoriye göre todo'ları getir"""
+        try:
+            result = await self.client.from_('todos').select('*').eq('user_id', user_id).eq('category_id', category_id).order('created_at', desc=True).execute()
+            return [Todo.from_dict(todo_dict) for todo_dict in result.data]
+        except Exception as e:
+            print(f"Kategori bazlı todo getirme hatası: {e}")
+            return []
+
+    async def get_user_categories(self, user_id: str) -> List[Category]:
+        """Kullanıcının kategorilerini getir"""
+        try:
+            result = await self.client.from_('categories').select('*').eq('user_id', user_id).execute()
+            return [Category.from_dict(cat_dict) for cat_dict in result.data]
+        except Exception as e:
+            print(f"Kategoriler getirme hatası: {e}")
+            return []
+
+    async def get_todo_statistics(self, user_id: str) -> Dict:
+        """Gelişmiş istatistikler (sayaç tablosu, yoksa aggregate sorgu)"""
+        try:
+            result = await self.client.rpc('todo_statistics_cached', {'p_user_id': user_id}).execute()
+            if not result.data:
+                result = await self.client.rpc('todo_statistics', {'p_user_id': user_id}).execute()
+            row = result.data[0] if result.data else {}
+        except Exception as e:
+            print(f"İstatistik hesaplama hatası: {e}")
+            row = {}
+
+        total = row.get('total') or 0
+        completed = row.get('completed') or 0
+        return {
+            'total': total,
+            'completed': completed,
+            'pending': total - completed,
+            'overdue': row.get('overdue') or 0,
+            'completion_rate': round((completed / total * 100), 1) if total > 0 else 0,
+            'high_priority': row.get('high_priority') or 0,
+            'medium_priority': row.get('medium_priority') or 0,
+            'low_priority': row.get('low_priority') or 0,
+            'in_progress': row.get('in_progress') or 0,
+            'cancelled': row.get('cancelled') or 0
+        }
+
+
+async def gather_named(**awaitables: Awaitable) -> Dict[str, Any]:
+    """
+    Adlandırılmış işleri eşzamanlı çalıştır
+
+    Bir işin hatası diğerlerini iptal etmez; hata nesnesi sonuç olarak döner.
+
+    Returns:
+        dict: Ad -> sonuç (veya exception)
+    """
+    names = list(awaitables)
+    results = await asyncio.gather(*awaitables.values(), return_exceptions=True)
+    return dict(zip(names, results))
+
+
+class AsyncPageLoader:
+    """
+    Senkron view'lerden asenkron yüklemeleri çalıştıran köprü
+
+    İlk kullanımda bir daemon thread'de event loop başlatır ve yöneticiyi o
+    loop içinde bir kez oluşturur; sonraki istekler aynı loop'u ve istemcinin
+    bağlantı havuzunu kullanır. Thread güvenlidir.
+
+    Args:
+        manager_factory (callable): Yönetici oluşturucu (varsayılan AsyncAdvancedDatabaseManager)
+        timeout (float): Bir yüklemenin en uzun bekleme süresi (saniye)
+    """
+
+    def __init__(self, manager_factory: Optional[Callable[[], AsyncAdvancedDatabaseManager]] = None,
+                 timeout: Optional[float] = None):
+        self.manager_factory = manager_factory or AsyncAdvancedDatabaseManager
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._manager: Optional[AsyncAdvancedDatabaseManager] = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        """Arka plan loop'unu başlat (ilk çağrıda)"""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='async-page-loader', daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    async def _get_manager(self) -> AsyncAdvancedDatabaseManager:
+        # Yalnızca loop thread'inde çalışır; await olmadığından yarış yok
+        if self._manager is None:
+            self._manager = self.manager_factory()
+        return self._manager
+
+    def run(self, main: Callable[[AsyncAdvancedDatabaseManager], Awaitable[Any]]) -> Any:
+        """
+        Coroutine fonksiyonunu paylaşılan loop'ta çalıştır ve sonucunu bekle
+
+        Args:
+            main (callable): Yöneticiyi alıp sonuç döndüren coroutine fonksiyonu
+
+        Returns:
+            main'in sonucu
+        """
+        async def runner():
+            return await main(await self._get_manager())
+
+        future = asyncio.run_coroutine_threadsafe(runner(), self._start())
+        try:
+            return future.result(self.timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    def close(self):
+        """İstemciyi kapat ve loop'u durdur"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._manager is not None:
+            asyncio.run_coroutine_threadsafe(self._manager.aclose(), loop).result(self.timeout)
+            self._manager = None
+        loop.call_soon_threadsafe(loop.stop)
+
+    def load_advanced_page(self, user_id: str, city: str, weather_loader: Callable[[str], Any],
+                           stats_default: Dict, cache=None, weather_deadline: Optional[float] = None,
+                           db_deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Gelişmiş sayfanın bağımsız verilerini eşzamanlı yükle
+
+        Todo'lar, kategoriler ve istatistikler asenkron istemciyle, senkron
+        hava durumu çağrısı bir thread'de aynı anda çalışır. Süresi dolan
+        veya hata veren yükleme varsayılan değerle döner.
+
+        Args:
+            user_id (str): Kullanıcı ID'si
+            city (str): Hava durumu şehri
+            weather_loader (callable): Şehir alıp hava durumu döndüren senkron fonksiyon
+            stats_default (dict): İstatistikler yüklenemezse kullanılacak değer
+            cache (todo_cache.UserDataCache): Todo/kategori listeleri için önbellek
+            weather_deadline (float): Hava durumu süre sınırı (saniye)
+            db_deadline (float): Veritabanı süre sınırı (saniye)
+
+        Returns:
+            dict: 'todos', 'categories' (ham satırlar), 'stats', 'weather' anahtarlı sonuçlar
+        """
+        async def main(manager: AsyncAdvancedDatabaseManager):
+            def rows(kind):
+                if cache is None:
+                    return manager.fetch_rows(kind, user_id)
+                return cache.aget(user_id, kind, lambda: manager.fetch_rows(kind, user_id))
+
+            results = await gather_named(
+                todos=asyncio.wait_for(rows('todos'), db_deadline),
+                categories=asyncio.wait_for(rows('categories'), db_deadline),
+                stats=asyncio.wait_for(manager.get_todo_statistics(user_id), db_deadline),
+                weather=asyncio.wait_for(asyncio.to_thread(weather_loader, city), weather_deadline)
+            )
+            defaults = {'todos': [], 'categories': [], 'stats': stats_default, 'weather': None}
+            for name, default in defaults.items():
+                if isinstance(results[name], Exception):
+                    print(f"Asenkron sayfa yükleme hatası ({name}): {results[name]!r}")
+                    results[name] = default
+            return results
+
+        return self.run(main)
@@ -6,6 +6,8 @@ Flask-Login entegrasyonu
 from flask import session, request, redirect, url_for, flash
 from functools import wraps
 from database import db_manager
+from request_context import get_request_context
+from utils import get_todo_statistics
 import uuid
 
 def login_required(f):
@@ -30,8 +32,10 @@ def get_current_user():
     if 'user_id' not in session:
         return None
     
-    user_id = session['user_id']
-    return db_manager.get_user_by_username(session.get('username'))
+    username = session.get('username')
+    return get_request_context().fetch(
+        'users', lambda: db_manager.get_user_by_username(username), username=username
+    )
 
 def login_user(username: str, email: str = None):
     """
@@ -94,7 +98,9 @@ def get_user_todos():
         return []
     
     user_id = session['user_id']
-    return db_manager.get_user_todos(user_id)
+    return get_request_context().fetch(
+        'todos', lambda: db_manager.get_user_todos(user_id), user_id=user_id
+    )
 
 def create_user_todo(text: str, priority: str = 'orta'):
     """
@@ -111,6 +117,7 @@ def create_user_todo(text: str, priority: str = 'orta'):
         return None
     
     user_id = session['user_id']
+    get_request_context().invalidate('todos')
     return db_manager.create_todo(user_id, text, priority)
 
 def update_user_todo(todo_id: str, **kwargs):
@@ -127,14 +134,10 @@ def update_user_todo(todo_id: str, **kwargs):
     if not is_logged_in():
         return False
     
-    # Todo'nun kullanıcıya ait olduğunu kontrol et
-    user_todos = get_user_todos()
-    todo_exists = any(todo['id'] == todo_id for todo in user_todos)
-    
-    if not todo_exists:
-        return False
-    
-    return db_manager.update_todo(todo_id, **kwargs)
+    # Sahiplik kontrolü yazma sorgusunun filtresinde (user_id) yapılır;
+    # etkilenen satır yoksa todo bulunamadı veya kullanıcıya ait değil demektir
+    get_request_context().invalidate('todos')
+    return db_manager.update_todo(todo_id, owner_id=session['user_id'], **kwargs)
 
 def delete_user_todo(todo_id: str):
     """
@@ -149,14 +152,10 @@ def delete_user_todo(todo_id: str):
     if not is_logged_in():
         return False
     
-    # Todo'nun kullanıcıya ait olduğunu kontrol et
-    user_todos = get_user_todos()
-    todo_exists = any(todo['id'] == todo_id for todo in user_todos)
-    
-    if not todo_exists:
-        return False
-    
-    return db_manager.delete_todo(todo_id)
+    # Sahiplik kontrolü yazma sorgusunun filtresinde (user_id) yapılır;
+    # etkilenen satır yoksa todo bulunamadı veya kullanıcıya ait değil demektir
+    get_request_context().invalidate('todos')
+    return db_manager.delete_todo(todo_id, owner_id=session['user_id'])
 
 def toggle_user_todo(todo_id: str):
     """
@@ -171,14 +170,10 @@ def toggle_user_todo(todo_id: str):
     if not is_logged_in():
         return False
     
-    # Todo'nun kullanıcıya ait olduğunu kontrol et
-    user_todos = get_user_todos()
-    todo_exists = any(todo['id'] == todo_id for todo in user_todos)
-    
-    if not todo_exists:
-        return False
-    
-    return db_manager.toggle_todo_complete(todo_id)
+    # Sahiplik kontrolü yazma sorgusunun filtresinde (user_id) yapılır;
+    # etkilenen satır yoksa todo bulunamadı veya kullanıcıya ait değil demektir
+    get_request_context().invalidate('todos')
+    return db_manager.toggle_todo_complete(todo_id, owner_id=session['user_id'])
 
 def get_user_todos_by_priority(priority: str):
     """
@@ -194,7 +189,17 @@ def get_user_todos_by_priority(priority: str):
         return []
     
     user_id = session['user_id']
-    return db_manager.get_todos_by_priority(user_id, priority)
+    context = get_request_context()
+    
+    # Tüm liste bu istekte zaten yüklendiyse filtre bellekte uygulanır
+    all_todos = context.peek('todos', user_id=user_id)
+    if all_todos is not None:
+        return [todo for todo in all_todos if todo.get('priority') == priority]
+    
+    return context.fetch(
+        'todos', lambda: db_manager.get_todos_by_priority(user_id, priority),
+        user_id=user_id, priority=priority
+    )
 
 def get_user_statistics():
     """
@@ -215,4 +220,14 @@ def get_user_statistics():
         }
     
     user_id = session['user_id']
-    return db_manager.get_todo_statistics(user_id)
+    context = get_request_context()
+    
+    # Tüm liste bu istekte zaten yüklendiyse istatistik ondan türetilir
+    all_todos = context.peek('todos', user_id=user_id)
+    if all_todos is not None:
+        return get_todo_statistics(all_todos)
+    
+    return context.fetch(
+        'todos', lambda: db_manager.get_todo_statistics(user_id),
+        user_id=user_id, view='statistics'
+    )
@@ -0,0 +1,77 @@
+"""
+Toplu Yazma Benchmark'ı
+Satır satır döngü ile create/update/delete_todos_bulk karşılaştırması
+
+Kullanım:
+    SUPABASE_URL=... SUPABASE_KEY=... python benchmarks/bench_bulk_writes.py --count 5000
+
+Ağ olmadan (sahte istemci, istek başına 20 ms gecikme):
+    DATABASE_BACKEND=fake python benchmarks/bench_bulk_writes.py --fake --latency-ms 20
+
+Benchmark kendi kullanıcısını oluşturur ve işi bitince eklediği todo'ları siler.
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DatabaseManager
+from fake_supabase import FakeSupabaseClient
+
+
+def timed(label, count, func, client=None):
+    """Fonksiyonu çalıştır ve saniye başına işlem sayısını (sahte istemcide istek sayısını) yazdır"""
+    if client is not None:
+        client.reset_calls()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    requests = f"  {client.call_count:6d} istek" if client is not None else ''
+    print(f"{label:<28} {elapsed:8.2f} s  {count / elapsed:10.1f} satır/s{requests}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=5000, help="Yazılacak todo sayısı")
+    parser.add_argument('--chunk-size', type=int, default=500, help="Toplu istek başına satır sayısı")
+    parser.add_argument('--fake', action='store_true', help="Ağ yerine bellek içi sahte istemci kullan")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Sahte istemcide istek başına gecikme (ms)")
+    args = parser.parse_args()
+
+    client = FakeSupabaseClient(latency=args.latency_ms / 1000) if args.fake else None
+    manager = DatabaseManager(client=client)
+    username = f"bench-{uuid.uuid4().hex[:8]}"
+    user = manager.create_user(username, f"{username}@bench.local")
+    if not user:
+        sys.exit("Benchmark kullanıcısı oluşturulamadı")
+    user_id = user['id']
+    todos = [{'text': f"Benchmark todo {i}", 'priority': 'orta'} for i in range(args.count)]
+
+    print(f"{args.count} todo, parça boyutu {args.chunk_size}\n")
+
+    # Satır satır
+    created = timed("create (döngü)", args.count,
+                    lambda: [manager.create_todo(user_id, t['text'], t['priority']) for t in todos], client)
+    ids = [todo['id'] for todo in created if todo]
+    timed("update (döngü)", len(ids),
+          lambda: [manager.update_todo(todo_id, completed=True) for todo_id in ids], client)
+    timed("delete (döngü)", len(ids),
+          lambda: [manager.delete_todo(todo_id) for todo_id in ids], client)
+
+    # Toplu
+    created = timed("create_todos_bulk", args.count,
+                    lambda: manager.create_todos_bulk(user_id, todos, args.chunk_size), client)
+    ids = [todo['id'] for todo in created if todo]
+    timed("update_todos_bulk", len(ids),
+          lambda: manager.update_todos_bulk({todo_id: {'completed': True} for todo_id in ids}, args.chunk_size), client)
+    timed("delete_todos_bulk", len(ids),
+          lambda: manager.delete_todos_bulk(ids, args.chunk_size), client)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Sütunlu Depo Benchmark'ı
+ColumnarTodoManager (NumPy) ile nesne tabanlı depoların ekleme, filtre ve istatistik hızları
+
+Kullanım (numpy gerekli):
+    python benchmarks/bench_columnar.py --users 1000 --todos-per-user 200
+
+Karşılaştırılan depolar:
+    liste    - advanced_models.Todo listesi, her sorguda tam tarama
+    indeksli - advanced_models.TodoManager (kullanıcı bölümleri ve ikincil indeksler)
+    sütunlu  - columnar_store.ColumnarTodoManager (vektörel maskeler)
+
+Tüm kullanıcılar üzerindeki analizlerde (global istatistik) sütunlu depo
+öne çıkar; tek kullanıcılık aramalarda indeksli depo daha hızlıdır.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advanced_models import Priority, Status, Todo, create_todo_manager
+
+
+class ListStore:
+    """Todo kayıtları listesi: sorgular tam tarama"""
+
+    def __init__(self):
+        self.todos = []
+
+    def create_todo(self, user_id, text, **kwargs):
+        todo = Todo(id=str(uuid.uuid4()), user_id=user_id, text=text, **kwargs)
+        self.todos.append(todo)
+        return todo
+
+    def get_todos_by_priority(self, user_id, priority):
+        return [t for t in self.todos if t.user_id == user_id and t.priority == priority]
+
+    def get_overdue_todos(self, user_id):
+        return [t for t in self.todos if t.user_id == user_id and t.is_overdue()]
+
+    def get_todo_statistics(self, user_id):
+        todos = [t for t in self.todos if t.user_id == user_id]
+        return self._statistics(todos)
+
+    def global_statistics(self):
+        return self._statistics(self.todos)
+
+    @staticmethod
+    def _statistics(todos):
+        total = len(todos)
+        completed = sum(1 for t in todos if t.completed)
+        return {
+            'total': total,
+            'completed': completed,
+            'overdue': sum(1 for t in todos if t.is_overdue()),
+            'completion_rate': round(completed / total * 100, 1) if total else 0,
+            'high_priority': sum(1 for t in todos if t.priority == Priority.HIGH)
+        }
+
+
+def indexed_global_statistics(manager):
+    """TodoManager'da global istatistik: kullanıcı sayaçlarının toplamı"""
+    totals = {}
+    for user_id in list(manager._partitions):
+        for key, value in manager.get_todo_statistics(user_id).items():
+            totals[key] = totals.get(key, 0) + value
+    total = totals.get('total', 0)
+    totals['completion_rate'] = round(totals.get('completed', 0) / total * 100, 1) if total else 0
+    return totals
+
+
+def rows(users, todos_per_user):
+    random.seed(42)
+    now = datetime.now()
+    priorities = list(Priority)
+    for user in range(users):
+        for n in range(todos_per_user):
+            done = random.random() < 0.4
+            yield f"user-{user}", f"Todo {n}", {
+                'priority': random.choice(priorities),
+                'status': Status.COMPLETED if done else Status.PENDING,
+                'completed': done,
+                'due_date': now + timedelta(days=random.uniform(-30, 30)) if random.random() < 0.5 else None
+            }
+
+
+def timed(func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=1000, help="Kullanıcı sayısı")
+    parser.add_argument('--todos-per-user', type=int, default=200, help="Kullanıcı başına todo sayısı")
+    parser.add_argument('--samples', type=int, default=20, help="Sorgulanacak örnek kullanıcı sayısı")
+    args = parser.parse_args()
+
+    count = args.users * args.todos_per_user
+    stores = {'liste': ListStore(), 'indeksli': create_todo_manager('indexed'),
+              'sütunlu': create_todo_manager('columnar')}
+    samples = [f"user-{random.randrange(args.users)}" for _ in range(args.samples)]
+
+    results = {}
+    for name, store in stores.items():
+        elapsed = timed(lambda: [store.create_todo(u, text, **kwargs)
+                                 for u, text, kwargs in rows(args.users, args.todos_per_user)])
+        global_stats = (indexed_global_statistics if name == 'indeksli'
+                        else lambda manager: manager.global_statistics())
+        results[name] = {
+            'ekleme (todo/s)': count / elapsed,
+            'öncelik filtresi (ms)': timed(lambda: [store.get_todos_by_priority(u, Priority.HIGH)
+                                                    for u in samples]) * 1000 / len(samples),
+            'süresi geçmiş (ms)': timed(lambda: [store.get_overdue_todos(u) for u in samples]) * 1000 / len(samples),
+            'kullanıcı istatistiği (ms)': timed(lambda: [store.get_todo_statistics(u)
+                                                          for u in samples]) * 1000 / len(samples),
+            'global istatistik (ms)': timed(lambda: global_stats(store), repeat=3) * 1000
+        }
+
+    print(f"{count} todo ({args.users} kullanıcı x {args.todos_per_user})\n")
+    print(f"{'Ölçüm':<28}" + ''.join(f"{name:>14}" for name in stores))
+    for metric in results['liste']:
+        print(f"{metric:<28}" + ''.join(f"{results[name][metric]:14.2f}" for name in stores))
+
+
+if __name__ == '__main__':
+    main()
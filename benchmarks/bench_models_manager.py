@@ -0,0 +1,102 @@
+"""
+Basit TodoManager Benchmark'ı
+models.TodoManager'da ID ile getirme/silme ve öncelik filtresinin eski liste taramasıyla karşılaştırması
+
+Kullanım:
+    python benchmarks/bench_models_manager.py --count 1000000 --operations 1000
+
+Eski yönetici get_todo/delete_todo'da listeyi baştan tarar ve silmede
+listenin kalanını kaydırır; yenisi ID sözlüğü ve öncelik indeksi kullanır.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Todo, TodoManager
+
+PRIORITIES = ('yüksek', 'orta', 'düşük')
+
+
+class ListTodoManager:
+    """Eski models.TodoManager: tek liste, doğrusal arama"""
+
+    def __init__(self):
+        self.todos = []
+
+    def add(self, todo):
+        self.todos.append(todo)
+
+    def get_todo(self, todo_id):
+        for todo in self.todos:
+            if todo.id == todo_id:
+                return todo
+        return None
+
+    def delete_todo(self, todo_id):
+        for i, todo in enumerate(self.todos):
+            if todo.id == todo_id:
+                del self.todos[i]
+                return True
+        return False
+
+    def get_todos_by_priority(self, priority):
+        return [todo.to_dict() for todo in self.todos if todo.priority == priority]
+
+
+def timed(label, operations, func):
+    """İşlem başına mikro saniye"""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e6 / operations
+
+
+def measure(manager, ids, operations):
+    """Sorgu adı -> işlem başına µs (silinen ID'ler ölçüm sonunda yöneticiden çıkmış olur)"""
+    lookups = random.sample(ids, operations)
+    deletes = random.sample(ids, operations)
+    return {
+        'get_todo': timed('get_todo', operations, lambda: [manager.get_todo(i) for i in lookups]),
+        'delete_todo': timed('delete_todo', operations, lambda: [manager.delete_todo(i) for i in deletes]),
+        'get_todos_by_priority': timed('get_todos_by_priority', 3,
+                                       lambda: [manager.get_todos_by_priority(p) for p in PRIORITIES])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1000000, help="Todo sayısı")
+    parser.add_argument('--operations', type=int, default=1000, help="Ölçülecek get/delete sayısı")
+    parser.add_argument('--skip-baseline', action='store_true', help="Eski liste taramasını ölçme")
+    args = parser.parse_args()
+
+    random.seed(42)
+    manager = TodoManager()
+    baseline = None if args.skip_baseline else ListTodoManager()
+
+    start = time.perf_counter()
+    for n in range(args.count):
+        todo = manager.add_todo(f"Todo {n}", PRIORITIES[n % 3])
+        if baseline is not None:
+            baseline.add(Todo(todo.text, todo.priority, todo.id))
+    print(f"{args.count} todo üretildi ({time.perf_counter() - start:.1f} s)\n")
+
+    ids = list(range(1, args.count + 1))
+    after = measure(manager, ids, args.operations)
+    before = measure(baseline, ids, args.operations) if baseline is not None else {}
+
+    print(f"{'İşlem':<24} {'liste (µs)':>12} {'sözlük (µs)':>12} {'hızlanma':>9}")
+    for name, new_us in after.items():
+        old_us = before.get(name)
+        if old_us is None:
+            print(f"{name:<24} {'-':>12} {new_us:12.2f}")
+        else:
+            print(f"{name:<24} {old_us:12.2f} {new_us:12.2f} {old_us / new_us:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Bellek İçi TodoManager Benchmark'ı
+Kullanıcı bölümlü ve indeksli advanced_models.TodoManager ile eski tam liste taramasının karşılaştırması
+
+Kullanım:
+    python benchmarks/bench_todo_manager.py --users 2000 --todos-per-user 100
+
+Referans ölçüm 100k kullanıcı x 100 todo ile yapılır (~10M todo, birkaç GB bellek):
+    python benchmarks/bench_todo_manager.py --users 100000 --todos-per-user 100 --skip-baseline
+
+Sütunlu depo (columnar_store) aynı sorgularla ölçülebilir:
+    python benchmarks/bench_todo_manager.py --backend columnar
+
+Eski yönetici her sorguda tüm kullanıcıların todo'larını taradığından süresi
+toplam todo sayısıyla, yenisi yalnızca sorgulanan kullanıcının sonuçlarıyla büyür.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advanced_models import Priority, Status, create_todo_manager
+
+
+class ListScanTodoManager:
+    """Eski TodoManager sorguları: tek liste, her sorguda tam tarama"""
+
+    def __init__(self):
+        self.todos = []
+
+    def add(self, todo):
+        self.todos.append(todo)
+
+    def get_user_todos(self, user_id):
+        return [todo for todo in self.todos if todo.user_id == user_id]
+
+    def get_todos_by_priority(self, user_id, priority):
+        return [todo for todo in self.get_user_todos(user_id) if todo.priority == priority]
+
+    def get_todos_by_category(self, user_id, category_id):
+        return [todo for todo in self.get_user_todos(user_id) if todo.category_id == category_id]
+
+    def get_overdue_todos(self, user_id):
+        return [todo for todo in self.get_user_todos(user_id) if todo.is_overdue()]
+
+    def get_todo_statistics(self, user_id):
+        todos = self.get_user_todos(user_id)
+        return {
+            'total': len(todos),
+            'completed': len([t for t in todos if t.completed]),
+            'overdue': len(self.get_overdue_todos(user_id)),
+            'high_priority': len([t for t in todos if t.priority == Priority.HIGH]),
+            'in_progress': len([t for t in todos if t.status == Status.IN_PROGRESS])
+        }
+
+
+def populate(manager, baseline, users, todos_per_user):
+    """Rastgele öncelik, durum, kategori ve bitiş tarihli todo'lar üret"""
+    now = datetime.now()
+    priorities = list(Priority)
+    for user in range(users):
+        user_id = f"user-{user}"
+        for n in range(todos_per_user):
+            done = random.random() < 0.4
+            todo = manager.create_todo(
+                user_id, f"Todo {n}",
+                category_id=f"{user_id}-cat-{n % 5}",
+                priority=random.choice(priorities),
+                status=Status.COMPLETED if done else Status.PENDING,
+                completed=done,
+                due_date=now + timedelta(days=random.uniform(-30, 30)) if random.random() < 0.5 else None
+            )
+            if baseline is not None:
+                baseline.add(todo)
+
+
+def measure(manager, samples, repeat):
+    """Sorgu adı -> çağrı başına ortalama ms"""
+    queries = {
+        'get_user_todos': lambda user_id: manager.get_user_todos(user_id),
+        'get_todos_by_priority': lambda user_id: manager.get_todos_by_priority(user_id, Priority.HIGH),
+        'get_todos_by_category': lambda user_id: manager.get_todos_by_category(user_id, f"{user_id}-cat-0"),
+        'get_overdue_todos': lambda user_id: manager.get_overdue_todos(user_id),
+        'get_todo_statistics': lambda user_id: manager.get_todo_statistics(user_id)
+    }
+    results = {}
+    for name, query in queries.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for user_id in samples:
+                query(user_id)
+        results[name] = (time.perf_counter() - start) * 1000 / (repeat * len(samples))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=2000, help="Kullanıcı sayısı")
+    parser.add_argument('--todos-per-user', type=int, default=100, help="Kullanıcı başına todo sayısı")
+    parser.add_argument('--samples', type=int, default=20, help="Sorgulanacak örnek kullanıcı sayısı")
+    parser.add_argument('--repeat', type=int, default=3, help="Sorgu başına tekrar sayısı")
+    parser.add_argument('--skip-baseline', action='store_true', help="Eski tam taramayı ölçme")
+    parser.add_argument('--backend', choices=('indexed', 'columnar'), default='indexed',
+                        help="Ölçülecek todo deposu (create_todo_manager)")
+    args = parser.parse_args()
+
+    random.seed(42)
+    manager = create_todo_manager(args.backend)
+    baseline = None if args.skip_baseline else ListScanTodoManager()
+
+    start = time.perf_counter()
+    populate(manager, baseline, args.users, args.todos_per_user)
+    print(f"{args.users * args.todos_per_user} todo üretildi ({time.perf_counter() - start:.1f} s)\n")
+
+    samples = [f"user-{random.randrange(args.users)}" for _ in range(args.samples)]
+    after = measure(manager, samples, args.repeat)
+    before = measure(baseline, samples, 1) if baseline is not None else {}
+
+    print(f"{'Sorgu':<24} {'tarama (ms)':>12} {'indeks (ms)':>12} {'hızlanma':>9}")
+    for name, new_ms in after.items():
+        old_ms = before.get(name)
+        if old_ms is None:
+            print(f"{name:<24} {'-':>12} {new_ms:12.4f}")
+        else:
+            print(f"{name:<24} {old_ms:12.4f} {new_ms:12.4f} {old_ms / new_ms:8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Todo Bellek Benchmark'ı
+Sıkıştırılmış Todo kayıtlarının eski dataclass/sınıflarla todo başına bellek karşılaştırması
+
+Kullanım:
+    python benchmarks/bench_todo_memory.py --count 200000
+
+tracemalloc ile ölçülür: todo listesi oluşturulmadan önceki ve sonraki
+ayrılmış bellek farkı todo sayısına bölünür. Satırlar her ölçümde aynı
+tohumla, veritabanından okunmuş gibi yeniden üretilir (her satırda yeni
+kullanıcı ID'si, etiket metinleri ve datetime nesneleri); kayıtların
+tuttuğu metin ve tarih nesneleri de ölçüme girer.
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import models
+from advanced_models import Priority, Status, Todo
+
+
+@dataclass
+class LegacyTodo:
+    """Eski advanced_models.Todo: __dict__, liste etiketler, datetime alanları"""
+    id: str
+    user_id: str
+    category_id: Optional[str] = None
+    text: str = ""
+    description: Optional[str] = None
+    priority: Priority = Priority.MEDIUM
+    status: Status = Status.PENDING
+    completed: bool = False
+    due_date: Optional[datetime] = None
+    tags: List[str] = None
+    created_at: datetime = None
+    updated_at: datetime = None
+
+    def __post_init__(self):
+        if self.tags is None:
+            self.tags = []
+        if self.created_at is None:
+            self.created_at = datetime.now()
+        if self.updated_at is None:
+            self.updated_at = datetime.now()
+
+
+class LegacySimpleTodo:
+    """Eski models.Todo: __dict__ ve biçimlendirilmiş tarih metinleri"""
+
+    def __init__(self, text, priority='orta', todo_id=None):
+        self.id = todo_id
+        self.text = text
+        self.priority = priority
+        self.completed = False
+        self.created_at = datetime.now().strftime('%d.%m.%Y %H:%M')
+        self.updated_at = None
+
+
+def advanced_rows(count, users):
+    """Veritabanı satırı benzeri keyword argümanları"""
+    random.seed(42)
+    user_ids = [str(uuid.uuid4()) for _ in range(users)]
+    priorities = list(Priority)
+    now = datetime.now()
+    for n in range(count):
+        yield {
+            'id': str(uuid.uuid4()),
+            # Her satır kendi metin nesnesini taşır (JSON'dan okunmuş gibi)
+            'user_id': ''.join(user_ids[n % users]),
+            'text': f"Todo {n}",
+            'priority': priorities[n % 3],
+            'due_date': now + timedelta(days=random.uniform(-30, 30)) if n % 2 else None,
+            'tags': [''.join('ev'), ''.join('market')] if n % 4 == 0 else None
+        }
+
+
+def measure(label, build, count):
+    """Oluşturulan nesnelerin todo başına bayt cinsinden bellek maliyeti"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    todos = build()
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    per_todo = (after - before) / count
+    print(f"{label:<34} {per_todo:10.1f} B/todo  {(after - before) / 2 ** 20:9.1f} MiB  {elapsed:6.2f} s")
+    del todos
+    return per_todo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=200000, help="Todo sayısı")
+    parser.add_argument('--users', type=int, default=100, help="Kullanıcı sayısı")
+    args = parser.parse_args()
+
+    print(f"{args.count} todo, {args.users} kullanıcı\n")
+
+    def rows():
+        return advanced_rows(args.count, args.users)
+
+    legacy = measure("advanced_models (eski dataclass)", lambda: [LegacyTodo(**row) for row in rows()], args.count)
+    compact = measure("advanced_models.Todo (slots)", lambda: [Todo(**row) for row in rows()], args.count)
+    print(f"{'':<34} {legacy / compact:10.2f}x daha küçük\n")
+
+    legacy = measure("models (eski sınıf)",
+                     lambda: [LegacySimpleTodo(f"Todo {n}", ''.join('orta'), n) for n in range(args.count)], args.count)
+    compact = measure("models.Todo (slots)",
+                      lambda: [models.Todo(f"Todo {n}", ''.join('orta'), n) for n in range(args.count)], args.count)
+    print(f"{'':<34} {legacy / compact:10.2f}x daha küçük")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Bellek İçi Kullanıcı Deposu Eşzamanlılık Testi
+api/main.py USERS deposunu çok thread'le zorlayıp tutarlılığı ve işlem hızını ölçer
+
+Kullanım:
+    python benchmarks/stress_user_store.py --threads 1 2 4 8 --ops 500 --users 4
+
+Her thread kendi test istemcisiyle oturum açar ve rastgele bir kullanıcı
+adına todo ekler, tamamlar ve siler (aynı kullanıcıyı birden fazla thread
+paylaşır). Sonunda her kullanıcı için ID'lerin tekil olduğu, todo sayısının
+eklenen - silinen sayısına eşit olduğu ve indekslerle sayaçların listeyle
+tutarlı olduğu kontrol edilir.
+
+--stripes 1 tek global kilidi ölçer. CPython'da GIL nedeniyle işlemci
+yoğun isteklerde thread sayısıyla hız sınırlı artar; fark kilit
+beklemesinin (global kilit) ortadan kalkmasından gelir.
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'api'))
+
+# Supabase olmadan bellek içi depoyu kullan
+os.environ['SUPABASE_URL'] = ''
+os.environ.setdefault('WEATHER_API_KEY', 'demo-key')
+
+import main as api
+from user_locks import StripedLock
+
+
+def worker(usernames, ops, seed, counts, errors):
+    """Rastgele kullanıcılar adına ekle/tamamla/sil"""
+    rng = random.Random(seed)
+    clients = {}
+    for _ in range(ops):
+        username = rng.choice(usernames)
+        client = clients.get(username)
+        if client is None:
+            client = clients[username] = api.app.test_client()
+            client.post('/login', data={'username': username})
+        try:
+            action = rng.random()
+            if action < 0.6:
+                response = client.post('/api/todos', json={'text': f"stres {rng.random():.6f}",
+                                                           'priority': rng.choice(['yüksek', 'orta', 'düşük'])})
+                if response.status_code == 201:
+                    counts.setdefault(username, []).append(('add', response.get_json()['data']['id']))
+            else:
+                todos = client.get('/api/todos').get_json()['data']
+                if not todos:
+                    continue
+                todo_id = rng.choice(todos)['id']
+                if action < 0.8:
+                    client.get(f'/complete/{todo_id}')
+                else:
+                    client.get(f'/delete/{todo_id}')
+                    counts.setdefault(username, []).append(('delete', todo_id))
+        except Exception as e:
+            errors.append(repr(e))
+
+
+def check_users(usernames, counts):
+    """Kullanıcı deposunun tutarlılık sorunları"""
+    problems = []
+    for username in usernames:
+        state = api.USERS.get(username)
+        if state is None:
+            continue
+        events = counts.get(username, [])
+        added = [todo_id for kind, todo_id in events if kind == 'add']
+        removed = {todo_id for kind, todo_id in events if kind == 'delete'}
+        ids = [todo['id'] for todo in state['todos']]
+        if len(added) != len(set(added)):
+            problems.append(f"{username}: aynı ID birden fazla todo'ya verildi")
+        if len(ids) != len(set(ids)):
+            problems.append(f"{username}: listede tekrar eden ID var")
+        expected = set(added) - removed
+        if set(ids) != expected:
+            problems.append(f"{username}: {len(ids)} todo var, {len(expected)} bekleniyordu")
+        for index in ('search_index', 'fulltext_index'):
+            if len(state[index]) != len(ids):
+                problems.append(f"{username}: {index} {len(state[index])} kayıt, liste {len(ids)}")
+        problems.extend(f"{username}: {problem}" for problem in api.check_memory_statistics(state))
+    return problems
+
+
+def run(threads, ops, users, stripes):
+    """Bir thread sayısı için (işlem/s, sorunlar)"""
+    api.USERS.clear()
+    api.USER_LOCKS = StripedLock(stripes)
+    usernames = [f"stres-{n}" for n in range(users)]
+    counts_per_thread = [dict() for _ in range(threads)]
+    errors = []
+    workers = [
+        threading.Thread(target=worker, args=(usernames, ops, seed, counts_per_thread[seed], errors))
+        for seed in range(threads)
+    ]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    counts = {}
+    for per_thread in counts_per_thread:
+        for username, events in per_thread.items():
+            counts.setdefault(username, []).extend(events)
+    return threads * ops / elapsed, errors + check_users(usernames, counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8], help="Denenecek thread sayıları")
+    parser.add_argument('--ops', type=int, default=500, help="Thread başına işlem sayısı")
+    parser.add_argument('--users', type=int, default=4, help="Kullanıcı sayısı")
+    parser.add_argument('--stripes', type=int, default=64, help="Kilit şeridi sayısı (1 = global kilit)")
+    args = parser.parse_args()
+
+    api.get_weather = lambda city: None
+    failed = False
+    print(f"{args.users} kullanıcı, {args.stripes} kilit şeridi, thread başına {args.ops} işlem\n")
+    print(f"{'thread':>6} {'işlem/s':>10}  sonuç")
+    for threads in args.threads:
+        throughput, problems = run(threads, args.ops, args.users, args.stripes)
+        failed = failed or bool(problems)
+        print(f"{threads:6d} {throughput:10.1f}  {'tutarlı' if not problems else f'{len(problems)} sorun'}")
+        for problem in problems[:10]:
+            print(f"       - {problem}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+"""
+Önbellek Geçersiz Kılma Kanalı
+Worker'lar arası önbellek tahliyesi (Postgres LISTEN/NOTIFY veya süreç içi)
+
+Yazan önbellek (source) değişikliği zaten kendine uyguladığı için
+yayından etkilenmez; yalnızca aynı kanala bağlı diğer önbellekler
+kullanıcıyı tahliye eder.
+"""
+
+import os
+import select
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Trigger'ların NOTIFY gönderdiği kanal (supabase_sql_incremental.sql)
+DEFAULT_CHANNEL = 'todo_cache_invalidate'
+
+# Kendi yazmamızın NOTIFY yankısını bekleme süresi (saniye)
+ECHO_WINDOW = float(os.environ.get('CACHE_ECHO_WINDOW_SECONDS', '5.0'))
+
+
+class InvalidationBus(ABC):
+    """
+    Geçersiz kılma kanalı taban sınıfı
+
+    Abonelere etkilenen kullanıcının ID'si iletilir. None, "hangi
+    kullanıcının etkilendiği bilinmiyor, tüm önbelleği boşalt" anlamına
+    gelir (ör. dinleyici bağlantısı koptuğunda kaçırılan bildirimler için).
+
+    Yazma akışı:
+        echo = bus.expect_echo(user_id, cache)   # veritabanı yazmasından önce
+        ...                                       # yazma, cache.apply/bump
+        bus.publish(user_id, source=cache, echo=echo)
+    Yazmanın sonucu belirsizse (hata) bus.cancel_echo(echo) ve source
+    olmadan bus.publish(user_id) ile yazan dahil herkes tahliye edilir.
+    """
+
+    def __init__(self):
+        self._subscribers: List[Tuple[Any, Callable[[Optional[str]], None]]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[Optional[str]], None], source: Any = None):
+        """
+        Geçersiz kılma bildirimlerine abone ol
+
+        Args:
+            callback (callable): user_id (veya None) ile çağrılır
+            source: Abonenin kimliği (ör. önbellek); kendi yayınları ona iletilmez
+        """
+        with self._lock:
+            self._subscribers.append((source, callback))
+
+    @abstractmethod
+    def publish(self, user_id: str, source: Any = None, echo: Any = None):
+        """
+        Kullanıcının önbelleklerini tüm worker'larda geçersiz kıl
+
+        Args:
+            user_id (str): Kullanıcı ID'si
+            source: Yazmayı zaten uygulamış abone (tahliye edilmez)
+            echo: Yazmadan önce expect_echo'nun döndürdüğü değer
+        """
+
+    def expect_echo(self, user_id: str, source: Any) -> Any:
+        """Yazmadan önce çağrılır; yazmanın veritabanı bildirimi source'u tahliye etmez"""
+        return None
+
+    def cancel_echo(self, echo: Any):
+        """Gelmeyecek yankıyı unut (yazma hata verdi veya satır değişmedi)"""
+
+    def close(self):
+        """Kanalı kapat"""
+
+    def _dispatch(self, user_id: Optional[str], source: Any = None):
+        """Bildirimi source dışındaki tüm abonelere ilet"""
+        with self._lock:
+            subscribers = [callback for owner, callback in self._subscribers
+                           if source is None or owner is not source]
+        for callback in subscribers:
+            try:
+                callback(user_id)
+            except Exception as e:
+                print(f"Önbellek geçersiz kılma hatası: {e}")
+
+
+class InProcessInvalidationBus(InvalidationBus):
+    """
+    Süreç içi kanal
+
+    Tek sunuculu kurulumlar ve testler için: aynı süreçteki önbellekler
+    (ör. birden fazla uygulama örneği) birbirinin yazmalarını hemen görür.
+    """
+
+    def publish(self, user_id: str, source: Any = None, echo: Any = None):
+        self._dispatch(user_id, source)
+
+
+class PostgresInvalidationBus(InvalidationBus):
+    """
+    Postgres LISTEN/NOTIFY kanalı
+
+    todos/categories tablolarındaki trigger'lar değişen satırın user_id'sini
+    NOTIFY ile yayınlar; her worker'daki dinleyici thread ilgili önbellek
+    kayıtlarını tahliye eder. Bağlantı koptuğunda yeniden bağlanılır ve
+    arada kaçırılmış olabilecek bildirimler için tüm önbellek boşaltılır.
+
+    Uygulamanın kendi yazmaları trigger'lar tarafından zaten yayınlanır.
+    Yazmadan önce expect_echo ile kaydedilen yankı, o kullanıcı için gelen
+    ilk bildirimde tüketilir ve yazan önbellek atlanır; böylece worker yeni
+    güncellediği kaydı kendi bildirimiyle tahliye etmez. ECHO_WINDOW içinde
+    gelmeyen yankılar düşürülür.
+
+    LISTEN doğrudan Postgres bağlantısı gerektirir (DATABASE_URL; Supabase'de
+    session modunda pooler veya doğrudan bağlantı).
+    """
+
+    def __init__(self, dsn: str, channel: str = DEFAULT_CHANNEL,
+                 poll_interval: float = 5.0, reconnect_delay: float = 5.0):
+        """
+        Dinleyici thread'i başlat
+
+        Args:
+            dsn (str): Postgres bağlantı adresi
+            channel (str): LISTEN kanalı
+            poll_interval (float): select() zaman aşımı (saniye)
+            reconnect_delay (float): Bağlantı hatasından sonra bekleme (saniye)
+        """
+        super().__init__()
+        try:
+            import psycopg2
+            import psycopg2.extensions
+        except ImportError as e:
+            raise ImportError("PostgresInvalidationBus için psycopg2 gerekli!") from e
+
+        self._psycopg2 = psycopg2
+        self.dsn = dsn
+        self.channel = channel
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        self._echoes: Dict[str, List[list]] = {}
+        self._echo_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._listen, name='cache-invalidation-listener', daemon=True)
+        self._thread.start()
+
+    def _listen(self):
+        """LISTEN döngüsü (arka plan thread'i)"""
+        psycopg2 = self._psycopg2
+        while not self._stopped.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(self.dsn)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cur:
+                    cur.execute(f'LISTEN "{self.channel}"')
+                # Bağlantı yokken gelen bildirimler kaçırılmış olabilir
+                self._dispatch(None)
+
+                while not self._stopped.is_set():
+                    if select.select([conn], [], [], self.poll_interval) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        user_id = notify.payload or None
+                        self._dispatch(user_id, self._take_echo(user_id))
+            except Exception as e:
+                print(f"Önbellek dinleyici bağlantı hatası: {e}")
+                self._stopped.wait(self.reconnect_delay)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+    def expect_echo(self, user_id: str, source: Any) -> list:
+        echo = [time.monotonic() + ECHO_WINDOW, source, str(user_id)]
+        with self._echo_lock:
+            self._echoes.setdefault(echo[2], []).append(echo)
+        return echo
+
+    def cancel_echo(self, echo: Optional[list]):
+        if echo is None:
+            return
+        with self._echo_lock:
+            pending = self._echoes.get(echo[2], [])
+            if echo in pending:
+                pending.remove(echo)
+            if not pending:
+                self._echoes.pop(echo[2], None)
+
+    def _take_echo(self, user_id: Optional[str]) -> Any:
+        """Bildirim kendi yazmamızın yankısıysa yazan önbelleği döndür"""
+        if user_id is None:
+            return None
+        now = time.monotonic()
+        with self._echo_lock:
+            pending = [echo for echo in self._echoes.pop(user_id, []) if echo[0] > now]
+            if not pending:
+                return None
+            echo = pending.pop(0)
+            if pending:
+                self._echoes[user_id] = pending
+            return echo[1]
+
+    def publish(self, user_id: str, source: Any = None, echo: Any = None):
+        """
+        NOTIFY gönder
+
+        source verilirse yazma uygulamanın kendisindendir: trigger'lar
+        bildirimi zaten gönderir, tekrar gönderilmez. source olmadan
+        (uygulama dışı değişiklik veya sonucu belirsiz yazma) tüm
+        worker'lar, bu worker dahil, kullanıcıyı tahliye eder.
+        """
+        if source is not None:
+            return
+        conn = self._psycopg2.connect(self.dsn)
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute('SELECT pg_notify(%s, %s)', (self.channel, str(user_id)))
+        finally:
+            conn.close()
+
+    def close(self):
+        self._stopped.set()
+        self._thread.join(timeout=self.poll_interval + 1)
+
+
+def create_invalidation_bus(backend: str = None) -> InvalidationBus:
+    """
+    Yapılandırmaya göre geçersiz kılma kanalı oluştur
+
+    Args:
+        backend (str): 'memory' veya 'postgres'; verilmezse
+            CACHE_INVALIDATION_BACKEND ortam değişkeni (varsayılan 'memory')
+
+    Returns:
+        InvalidationBus: Kanal nesnesi
+    """
+    backend = (backend or os.environ.get('CACHE_INVALIDATION_BACKEND', 'memory')).lower()
+    if backend == 'postgres':
+        dsn = os.environ.get('DATABASE_URL')
+        if not dsn:
+            raise ValueError("postgres geçersiz kılma kanalı için DATABASE_URL gerekli!")
+        return PostgresInvalidationBus(dsn)
+    if backend == 'memory':
+        return InProcessInvalidationBus()
+    raise ValueError(f"Bilinmeyen geçersiz kılma kanalı: {backend}")
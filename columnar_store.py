@@ -0,0 +1,396 @@
+"""
+Sütunlu Todo Deposu
+Analiz ve toplu filtreler için NumPy dizileriyle tutulan bellek içi todo deposu
+
+Todo'lar satır nesneleri yerine paralel dizilerde tutulur: kullanıcı kodu,
+öncelik, durum, tamamlandı bilgisi ve zaman damgaları sayısal dizilerde;
+metin, açıklama ve etiketler nesne dizilerinde. Filtreler ve istatistikler
+tüm satırlar üzerinde vektörel boolean maskelerle hesaplanır; arama her
+satırda saklanan kelime kümesini tarar.
+
+Ekleme diziler dolunca kapasiteyi ikiye katlar (amortize O(1)); silme
+satırı mezar taşıyla işaretler, ölü satırlar belli bir orana ulaşınca diziler
+sıkıştırılır.
+
+NumPy isteğe bağlıdır (pip install numpy); yüklü değilse depo oluşturulurken
+ImportError verilir. Dönen nesneler advanced_models.Todo'dur; değişiklikler
+depoya yöneticinin metotlarıyla yapılmalıdır (ya da ardından reindex_todo).
+
+Örnek:
+    manager = create_todo_manager('columnar')   # veya TODO_STORE_BACKEND=columnar
+    manager.create_todo(user_id, "Süt al", priority=Priority.HIGH)
+    manager.get_todo_statistics(user_id)
+"""
+
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from advanced_models import Category, Priority, Status, Todo, _EPOCH, _from_micros, _intern
+from search_index import tokenize
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PRIORITIES = (Priority.HIGH, Priority.MEDIUM, Priority.LOW)
+STATUSES = tuple(Status)
+PRIORITY_CODES = {priority: code for code, priority in enumerate(PRIORITIES)}
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+# Bitiş tarihi olmayan satırlar için en büyük değer: hiçbir zaman süresi geçmez
+NO_DUE_DATE = 2 ** 63 - 1
+
+# Ölü satır oranı bunu aşınca (ve en az COMPACT_MIN_ROWS satır varsa) sıkıştır
+COMPACT_RATIO = 0.25
+COMPACT_MIN_ROWS = 1024
+
+# Sütun adı -> dtype ('O' nesne dizisi)
+COLUMNS = {
+    'id': 'O',
+    'user': 'int32',
+    'category_id': 'O',
+    'text': 'O',
+    'description': 'O',
+    'tags': 'O',
+    'tokens': 'O',
+    'priority': 'int8',
+    'status': 'int8',
+    'completed': 'bool',
+    'due': 'int64',
+    'due_aware': 'bool',
+    'created': 'int64',
+    'updated': 'int64',
+    'zones': 'O',
+    'alive': 'bool',
+}
+
+
+def _now_micros():
+    """(UTC epoch mikro saniye, yerel dilimsiz mikro saniye) - Todo zaman damgalarıyla karşılaştırmak için"""
+    utc = time.time_ns() // 1000
+    local = (datetime.now() - _EPOCH) // timedelta(microseconds=1)
+    return utc, local
+
+
+class ColumnarTodoManager:
+    """
+    NumPy sütunlarıyla todo yöneticisi
+
+    advanced_models.TodoManager'ın arayüzünü aynı imzalar ve aynı sonuç
+    sıralarıyla sağlar (advanced_models.create_todo_manager ile seçilir);
+    ayrıca tüm kullanıcılar üzerinde toplu analiz için global_statistics sunar.
+
+    Args:
+        capacity (int): Başlangıç satır kapasitesi
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise ImportError("ColumnarTodoManager için numpy gerekli!")
+        self._capacity = max(1, capacity)
+        self._columns = {name: np.empty(self._capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self._columns['alive'][:] = False
+        self._size = 0
+        self._dead = 0
+        self._rows: Dict[str, int] = {}
+        self._user_codes: Dict[str, int] = {}
+        self._user_ids: List[str] = []
+        self.categories: List[Category] = []
+
+    def __len__(self) -> int:
+        return self._size - self._dead
+
+    def _column(self, name: str):
+        """Kullanılan satırlara ait sütun görünümü"""
+        return self._columns[name][:self._size]
+
+    @property
+    def todos(self) -> List[Todo]:
+        """Tüm todo'lar, oluşturulma sırasıyla"""
+        return self._todos(self._column('alive'))
+
+    # Yazma
+    def _grow(self):
+        """Kapasiteyi ikiye katla"""
+        self._capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.empty(self._capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            if name == 'alive':
+                grown[self._size:] = False
+            self._columns[name] = grown
+
+    def _user_code(self, user_id: str, create: bool = False) -> Optional[int]:
+        code = self._user_codes.get(user_id)
+        if code is None and create:
+            code = self._user_codes[user_id] = len(self._user_ids)
+            self._user_ids.append(user_id)
+        return code
+
+    def _write(self, row: int, todo: Todo):
+        """Todo alanlarını satıra yaz"""
+        columns = self._columns
+        # Todo zaman damgalarını zaten mikro saniye olarak tutar; datetime'a çevirmeden kopyala
+        due = todo._due
+        columns['id'][row] = todo.id
+        columns['user'][row] = self._user_code(todo.user_id, create=True)
+        columns['category_id'][row] = todo.category_id
+        columns['text'][row] = todo.text
+        columns['description'][row] = todo.description
+        columns['tags'][row] = tuple(todo._tags)
+        columns['tokens'][row] = frozenset(
+            token for text in (todo.text, todo.description, *todo._tags) for token in tokenize(text))
+        columns['priority'][row] = PRIORITY_CODES[todo.priority]
+        columns['status'][row] = STATUS_CODES[todo.status]
+        columns['completed'][row] = todo.completed
+        columns['due'][row] = NO_DUE_DATE if due is None else due
+        columns['due_aware'][row] = todo._zones[2] is not None
+        columns['created'][row] = todo._created
+        columns['updated'][row] = todo._updated
+        columns['zones'][row] = todo._zones
+        columns['alive'][row] = True
+
+    def _read(self, row: int) -> Todo:
+        """Satırdan Todo oluştur"""
+        columns = self._columns
+        created_zone, updated_zone, due_zone = columns['zones'][row]
+        due = int(columns['due'][row])
+        return Todo(
+            id=columns['id'][row],
+            user_id=self._user_ids[int(columns['user'][row])],
+            category_id=columns['category_id'][row],
+            text=columns['text'][row],
+            description=columns['description'][row],
+            priority=PRIORITIES[columns['priority'][row]],
+            status=STATUSES[columns['status'][row]],
+            completed=bool(columns['completed'][row]),
+            due_date=None if due == NO_DUE_DATE else _from_micros(due, due_zone),
+            tags=columns['tags'][row],
+            created_at=_from_micros(int(columns['created'][row]), created_zone),
+            updated_at=_from_micros(int(columns['updated'][row]), updated_zone)
+        )
+
+    def _append(self, todo: Todo) -> Todo:
+        if self._size == self._capacity:
+            self._grow()
+        row = self._size
+        self._write(row, todo)
+        self._rows[todo.id] = row
+        self._size += 1
+        return todo
+
+    def create_todo(self, user_id: str, text: str, **kwargs) -> Todo:
+        """Yeni todo oluştur"""
+        todo = Todo(id=str(uuid.uuid4()), user_id=_intern(user_id), text=text, **kwargs)
+        return self._append(todo)
+
+    def get_todo(self, todo_id: str) -> Optional[Todo]:
+        """ID ile todo getir"""
+        row = self._rows.get(todo_id)
+        return self._read(row) if row is not None else None
+
+    def _mutate(self, todo_id: str, change) -> Optional[Todo]:
+        """Satırı Todo'ya çevir, değiştir ve geri yaz"""
+        row = self._rows.get(todo_id)
+        if row is None:
+            return None
+        todo = self._read(row)
+        change(todo)
+        self._write(row, todo)
+        return todo
+
+    def reindex_todo(self, todo: Todo):
+        """Doğrudan değiştirilmiş bir todo'yu satırına geri yaz"""
+        row = self._rows.get(todo.id)
+        if row is not None:
+            self._write(row, todo)
+
+    def toggle_complete(self, todo_id: str) -> Optional[Todo]:
+        """Todo'yu tamamla/tamamlanmamış yap"""
+        return self._mutate(todo_id, lambda todo: todo.toggle_complete())
+
+    def update_status(self, todo_id: str, status: Status) -> Optional[Todo]:
+        """Todo durumunu güncelle"""
+        def change(todo: Todo):
+            todo.status = status
+            todo.completed = status == Status.COMPLETED
+            todo.updated_at = datetime.now()
+        return self._mutate(todo_id, change)
+
+    def update_priority(self, todo_id: str, priority: Priority) -> Optional[Todo]:
+        """Todo önceliğini güncelle"""
+        return self._mutate(todo_id, lambda todo: todo.update_priority(priority))
+
+    def update_category(self, todo_id: str, category_id: Optional[str]) -> Optional[Todo]:
+        """Todo kategorisini değiştir"""
+        def change(todo: Todo):
+            todo.category_id = category_id
+            todo.updated_at = datetime.now()
+        return self._mutate(todo_id, change)
+
+    def update_due_date(self, todo_id: str, due_date: Optional[datetime]) -> Optional[Todo]:
+        """Todo bitiş tarihini değiştir"""
+        def change(todo: Todo):
+            todo.due_date = due_date
+            todo.updated_at = datetime.now()
+        return self._mutate(todo_id, change)
+
+    def update_text(self, todo_id: str, new_text: str) -> Optional[Todo]:
+        """Todo metnini güncelle"""
+        return self._mutate(todo_id, lambda todo: todo.update_text(new_text))
+
+    def add_tag(self, todo_id: str, tag: str) -> Optional[Todo]:
+        """Todo'ya etiket ekle"""
+        return self._mutate(todo_id, lambda todo: todo.add_tag(tag))
+
+    def remove_tag(self, todo_id: str, tag: str) -> Optional[Todo]:
+        """Todo'dan etiket kaldır"""
+        return self._mutate(todo_id, lambda todo: todo.remove_tag(tag))
+
+    def create_category(self, user_id: str, name: str, color: str = '#007bff') -> Category:
+        """Yeni kategori oluştur"""
+        category = Category(id=str(uuid.uuid4()), user_id=user_id, name=name, color=color)
+        self.categories.append(category)
+        return category
+
+    def delete_todo(self, todo_id: str) -> bool:
+        """Todo sil (mezar taşı; gerekirse sıkıştırma)"""
+        row = self._rows.pop(todo_id, None)
+        if row is None:
+            return False
+        columns = self._columns
+        columns['alive'][row] = False
+        # Nesne referanslarını bırak
+        for name in ('id', 'category_id', 'text', 'description', 'tags', 'tokens', 'zones'):
+            columns[name][row] = None
+        self._dead += 1
+        if self._size >= COMPACT_MIN_ROWS and self._dead > self._size * COMPACT_RATIO:
+            self.compact()
+        return True
+
+    def compact(self):
+        """Ölü satırları atarak dizileri sıkıştır (sıra korunur)"""
+        alive = self._column('alive').copy()
+        size = int(np.count_nonzero(alive))
+        capacity = max(size * 2, 1)
+        for name, column in self._columns.items():
+            packed = np.empty(capacity, dtype=column.dtype)
+            packed[:size] = column[:self._size][alive]
+            if name == 'alive':
+                packed[size:] = False
+            self._columns[name] = packed
+        self._capacity = capacity
+        self._size = size
+        self._dead = 0
+        self._rows = {todo_id: row for row, todo_id in enumerate(self._columns['id'][:size])}
+
+    # Okuma
+    def _user_mask(self, user_id: str):
+        code = self._user_code(user_id)
+        if code is None:
+            return None
+        return self._column('alive') & (self._column('user') == code)
+
+    def _now(self):
+        """Satır başına şu an: saat dilimli bitişler UTC, dilimsizler yerel saatle karşılaştırılır"""
+        now_utc, now_local = _now_micros()
+        return np.where(self._column('due_aware'), now_utc, now_local)
+
+    def _overdue_mask(self, mask):
+        return mask & ~self._column('completed') & (self._column('due') < self._now())
+
+    def _by_due(self, mask) -> List[Todo]:
+        """Maskelenen satırlar, en erken bitiş önce (eşitlikte oluşturulma sırası)"""
+        rows = np.flatnonzero(mask)
+        rows = rows[np.argsort(self._column('due')[rows], kind='stable')]
+        return [self._read(row) for row in rows]
+
+    def _todos(self, mask) -> List[Todo]:
+        if mask is None:
+            return []
+        return [self._read(row) for row in np.flatnonzero(mask)]
+
+    def get_user_todos(self, user_id: str) -> List[Todo]:
+        """Kullanıcının todo'larını getir"""
+        return self._todos(self._user_mask(user_id))
+
+    def get_user_categories(self, user_id: str) -> List[Category]:
+        """Kullanıcının kategorilerini getir"""
+        return [cat for cat in self.categories if cat.user_id == user_id]
+
+    def get_todos_by_priority(self, user_id: str, priority: Priority) -> List[Todo]:
+        """Önceliğe göre todo'ları getir"""
+        mask = self._user_mask(user_id)
+        return self._todos(None if mask is None else mask & (self._column('priority') == PRIORITY_CODES[priority]))
+
+    def get_todos_by_status(self, user_id: str, status: Status) -> List[Todo]:
+        """Duruma göre todo'ları getir"""
+        mask = self._user_mask(user_id)
+        return self._todos(None if mask is None else mask & (self._column('status') == STATUS_CODES[status]))
+
+    def get_todos_by_category(self, user_id: str, category_id: Optional[str]) -> List[Todo]:
+        """Kategoriye göre todo'ları getir"""
+        mask = self._user_mask(user_id)
+        return self._todos(None if mask is None else mask & (self._column('category_id') == category_id))
+
+    def get_overdue_todos(self, user_id: str) -> List[Todo]:
+        """Süresi geçmiş todo'ları getir (en eski bitiş tarihi önce)"""
+        mask = self._user_mask(user_id)
+        if mask is None:
+            return []
+        return self._by_due(self._overdue_mask(mask))
+
+    def get_todos_due_within(self, user_id: str, window: timedelta) -> List[Todo]:
+        """Önümüzdeki `window` içinde süresi dolacak todo'ları getir (en yakın önce)"""
+        mask = self._user_mask(user_id)
+        if mask is None:
+            return []
+        start = self._now()
+        end = start + window // timedelta(microseconds=1)
+        due = self._column('due')
+        return self._by_due(mask & ~self._column('completed') & (due >= start) & (due < end))
+
+    def search_todos(self, user_id: str, query: str) -> List[Todo]:
+        """Todo'ları ara (her kelime metin, açıklama veya etiketlerde bir kelimenin öneki olmalı)"""
+        mask = self._user_mask(user_id)
+        terms = set(tokenize(query))
+        if mask is None or not terms:
+            return []
+        tokens = self._columns['tokens']
+        return [self._read(row) for row in np.flatnonzero(mask)
+                if all(any(token.startswith(term) for token in tokens[row]) for term in terms)]
+
+    def _statistics(self, mask) -> Dict:
+        """Maskelenen satırların istatistikleri"""
+        total = int(np.count_nonzero(mask)) if mask is not None else 0
+        if not total:
+            priorities = statuses = [0] * len(STATUSES)
+            completed = overdue = 0
+        else:
+            completed = int(np.count_nonzero(mask & self._column('completed')))
+            overdue = int(np.count_nonzero(self._overdue_mask(mask)))
+            priorities = np.bincount(self._column('priority')[mask], minlength=len(PRIORITIES))
+            statuses = np.bincount(self._column('status')[mask], minlength=len(STATUSES))
+        return {
+            'total': total,
+            'completed': completed,
+            'pending': total - completed,
+            'overdue': overdue,
+            'completion_rate': round((completed / total * 100), 1) if total > 0 else 0,
+            'high_priority': int(priorities[PRIORITY_CODES[Priority.HIGH]]),
+            'medium_priority': int(priorities[PRIORITY_CODES[Priority.MEDIUM]]),
+            'low_priority': int(priorities[PRIORITY_CODES[Priority.LOW]]),
+            'in_progress': int(statuses[STATUS_CODES[Status.IN_PROGRESS]]),
+            'cancelled': int(statuses[STATUS_CODES[Status.CANCELLED]])
+        }
+
+    def get_todo_statistics(self, user_id: str) -> Dict:
+        """Gelişmiş istatistikler"""
+        return self._statistics(self._user_mask(user_id))
+
+    def global_statistics(self) -> Dict:
+        """Tüm kullanıcılar üzerinde istatistikler"""
+        return self._statistics(self._column('alive'))
@@ -15,8 +15,14 @@ class Config:
     WEATHER_API_KEY = os.environ.get('WEATHER_API_KEY') or 'e73f50fbc7e75e1594e9c58d5a2f451e'
     WEATHER_API_URL = 'http://api.openweathermap.org/data/2.5/weather'
     
-    # Veritabanı ayarları (gelecekte kullanım için)
+    # Veritabanı ayarları
+    # DATABASE_BACKEND: 'supabase' (PostgREST), 'postgres' (DATABASE_URL ile doğrudan bağlantı)
+    # 'sqlite' (SQLITE_PATH dosyasında yerel veritabanı) veya 'fake' (bellek içi sahte istemci)
+    DATABASE_BACKEND = os.environ.get('DATABASE_BACKEND', 'supabase')
     DATABASE_URL = os.environ.get('DATABASE_URL')
+    DB_POOL_MIN = int(os.environ.get('DB_POOL_MIN', '1'))
+    DB_POOL_MAX = int(os.environ.get('DB_POOL_MAX', '10'))
+    SQLITE_PATH = os.environ.get('SQLITE_PATH', 'todo.db')
     
     # Debug modu
     DEBUG = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
@@ -8,21 +8,33 @@ from supabase import create_client, Client
 from typing import List, Dict, Optional
 from datetime import datetime
 import uuid
+from utils import chunked, group_updates
 
 class DatabaseManager:
     """
     Supabase veritabanı yönetim sınıfı
     """
     
-    def __init__(self):
-        """Veritabanı bağlantısını başlat"""
+    def __init__(self, client: Client = None):
+        """
+        Veritabanı bağlantısını başlat
+        
+        Args:
+            client: Hazır istemci (ör. fake_supabase.FakeSupabaseClient); verilmezse
+                SUPABASE_URL ve SUPABASE_KEY ile oluşturulur
+        """
         self.url = os.getenv('SUPABASE_URL')
         self.key = os.getenv('SUPABASE_KEY')
         
-        if not self.url or not self.key:
-            raise ValueError("SUPABASE_URL ve SUPABASE_KEY environment variables gerekli!")
+        if client is None:
+            if not self.url or not self.key:
+                raise ValueError("SUPABASE_URL ve SUPABASE_KEY environment variables gerekli!")
+            client = create_client(self.url, self.key)
         
-        self.supabase: Client = create_client(self.url, self.key)
+        self.supabase: Client = client
+        
+        # Toplu işlemlerde tek istekte gönderilecek satır sayısı
+        self.bulk_chunk_size = int(os.getenv('DB_BULK_CHUNK_SIZE', '500'))
     
     def create_user(self, username: str, email: str) -> Dict:
         """
@@ -107,67 +119,157 @@ class DatabaseManager:
             print(f"Todo'ları getirme hatası: {e}")
             return []
     
-    def update_todo(self, todo_id: str, **kwargs) -> bool:
+    def update_todo(self, todo_id: str, owner_id: Optional[str] = None, **kwargs) -> bool:
         """
         Todo güncelle
         
         Args:
             todo_id (str): Todo ID'si
+            owner_id (str): Verilirse yalnızca bu kullanıcının todo'su güncellenir
             **kwargs: Güncellenecek alanlar
         
         Returns:
-            bool: Güncelleme başarılı mı?
+            bool: Güncelleme başarılı mı? (todo yok veya başkasına aitse False)
         """
         try:
-            result = self.supabase.table('todos').update(kwargs).eq('id', todo_id).execute()
+            query = self.supabase.table('todos').update(kwargs).eq('id', todo_id)
+            if owner_id is not None:
+                query = query.eq('user_id', owner_id)
+            result = query.execute()
             return len(result.data) > 0
         except Exception as e:
             print(f"Todo güncelleme hatası: {e}")
             return False
     
-    def delete_todo(self, todo_id: str) -> bool:
+    def delete_todo(self, todo_id: str, owner_id: Optional[str] = None) -> bool:
         """
         Todo sil
         
         Args:
             todo_id (str): Todo ID'si
+            owner_id (str): Verilirse yalnızca bu kullanıcının todo'su silinir
         
         Returns:
-            bool: Silme başarılı mı?
+            bool: Silme başarılı mı? (todo yok veya başkasına aitse False)
         """
         try:
-            result = self.supabase.table('todos').delete().eq('id', todo_id).execute()
+            query = self.supabase.table('todos').delete().eq('id', todo_id)
+            if owner_id is not None:
+                query = query.eq('user_id', owner_id)
+            result = query.execute()
             return len(result.data) > 0
         except Exception as e:
             print(f"Todo silme hatası: {e}")
             return False
     
-    def toggle_todo_complete(self, todo_id: str) -> bool:
+    def toggle_todo_complete(self, todo_id: str, owner_id: Optional[str] = None) -> bool:
         """
         Todo tamamla/tamamlanmamış yap
         
         Args:
             todo_id (str): Todo ID'si
+            owner_id (str): Verilirse yalnızca bu kullanıcının todo'su güncellenir
         
         Returns:
-            bool: İşlem başarılı mı?
+            bool: İşlem başarılı mı? (todo yok veya başkasına aitse False)
         """
         try:
-            # Önce mevcut durumu al
-            result = self.supabase.table('todos').select('completed').eq('id', todo_id).execute()
-            if not result.data:
-                return False
-            
-            current_status = result.data[0]['completed']
-            new_status = not current_status
-            
-            # Durumu güncelle
-            update_result = self.supabase.table('todos').update({'completed': new_status}).eq('id', todo_id).execute()
-            return len(update_result.data) > 0
+            # Okuma ve yazma tek bir atomik UPDATE ... RETURNING ile yapılır
+            result = self.supabase.rpc(
+                'toggle_todo_complete', {'p_todo_id': todo_id, 'p_user_id': owner_id}
+            ).execute()
+            return len(result.data) > 0
         except Exception as e:
             print(f"Todo durum güncelleme hatası: {e}")
             return False
     
+    def create_todos_bulk(self, user_id: str, todos: List[Dict], chunk_size: int = None) -> List[Optional[Dict]]:
+        """
+        Birden fazla todo'yu toplu oluştur
+        
+        Her parça tek bir çok satırlı INSERT isteği olarak gönderilir.
+        
+        Args:
+            user_id (str): Kullanıcı ID'si
+            todos (list): 'text' ve isteğe bağlı 'priority' içeren sözlükler
+            chunk_size (int): İstek başına satır sayısı
+        
+        Returns:
+            list: Girişlerle aynı sırada oluşturulan todo'lar (başarısızsa None)
+        """
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = []
+        
+        for chunk in chunked(todos, chunk_size):
+            rows = [{
+                'user_id': user_id,
+                'text': todo['text'],
+                'priority': todo.get('priority', 'orta'),
+                'completed': todo.get('completed', False)
+            } for todo in chunk]
+            
+            try:
+                result = self.supabase.table('todos').insert(rows).execute()
+                created = result.data or []
+                results.extend(created + [None] * (len(chunk) - len(created)))
+            except Exception as e:
+                print(f"Toplu todo oluşturma hatası: {e}")
+                results.extend([None] * len(chunk))
+        
+        return results
+    
+    def update_todos_bulk(self, updates: Dict[str, Dict], chunk_size: int = None) -> Dict[str, bool]:
+        """
+        Birden fazla todo'yu toplu güncelle
+        
+        Aynı değişiklikleri alan todo'lar gruplanır ve her grup
+        id listesi üzerinden (id IN ...) tek istekte güncellenir.
+        
+        Args:
+            updates (dict): Todo ID'si -> güncellenecek alanlar
+            chunk_size (int): İstek başına id sayısı
+        
+        Returns:
+            dict: Todo ID'si -> güncelleme başarılı mı?
+        """
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = {todo_id: False for todo_id in updates}
+        
+        for patch, todo_ids in group_updates(updates):
+            for chunk in chunked(todo_ids, chunk_size):
+                try:
+                    result = self.supabase.table('todos').update(patch).in_('id', chunk).execute()
+                    for row in result.data or []:
+                        results[row['id']] = True
+                except Exception as e:
+                    print(f"Toplu todo güncelleme hatası: {e}")
+        
+        return results
+    
+    def delete_todos_bulk(self, todo_ids: List[str], chunk_size: int = None) -> Dict[str, bool]:
+        """
+        Birden fazla todo'yu toplu sil
+        
+        Args:
+            todo_ids (list): Silinecek todo ID'leri
+            chunk_size (int): İstek başına id sayısı
+        
+        Returns:
+            dict: Todo ID'si -> silme başarılı mı?
+        """
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = {todo_id: False for todo_id in todo_ids}
+        
+        for chunk in chunked(list(todo_ids), chunk_size):
+            try:
+                result = self.supabase.table('todos').delete().in_('id', chunk).execute()
+                for row in result.data or []:
+                    results[row['id']] = True
+            except Exception as e:
+                print(f"Toplu todo silme hatası: {e}")
+        
+        return results
+    
     def get_todos_by_priority(self, user_id: str, priority: str) -> List[Dict]:
         """
         Önceliğe göre todo'ları getir
@@ -186,6 +288,27 @@ class DatabaseManager:
             print(f"Öncelik bazlı todo getirme hatası: {e}")
             return []
     
+    def _fetch_statistics_row(self, user_id: str) -> Dict:
+        """
+        İstatistik satırını getir
+        
+        Önce trigger ile güncel tutulan user_todo_stats sayaçları okunur
+        (birincil anahtar araması). Kullanıcının sayaç satırı henüz yoksa
+        todo_statistics aggregate sorgusuna düşülür.
+        
+        Args:
+            user_id (str): Kullanıcı ID'si
+        
+        Returns:
+            dict: Ham sayaç değerleri
+        """
+        result = self.supabase.rpc('todo_statistics_cached', {'p_user_id': user_id}).execute()
+        if result.data:
+            return result.data[0]
+        
+        result = self.supabase.rpc('todo_statistics', {'p_user_id': user_id}).execute()
+        return result.data[0] if result.data else {}
+    
     def get_todo_statistics(self, user_id: str) -> Dict:
         """
         Kullanıcının todo istatistiklerini hesapla
@@ -197,16 +320,17 @@ class DatabaseManager:
             dict: İstatistik verileri
         """
         try:
-            todos = self.get_user_todos(user_id)
+            # Sayımlar veritabanında yapılır (user_todo_stats / todo_statistics)
+            row = self._fetch_statistics_row(user_id)
             
-            total = len(todos)
-            completed = len([todo for todo in todos if todo.get('completed', False)])
+            total = row.get('total') or 0
+            completed = row.get('completed') or 0
             pending = total - completed
             
             # Öncelik bazlı istatistikler
-            high_priority = len([todo for todo in todos if todo.get('priority') == 'yüksek'])
-            medium_priority = len([todo for todo in todos if todo.get('priority') == 'orta'])
-            low_priority = len([todo for todo in todos if todo.get('priority') == 'düşük'])
+            high_priority = row.get('high_priority') or 0
+            medium_priority = row.get('medium_priority') or 0
+            low_priority = row.get('low_priority') or 0
             
             return {
                 'total': total,
@@ -229,5 +353,30 @@ class DatabaseManager:
                 'low_priority': 0
             }
 
+def create_db_manager():
+    """
+    Yapılandırmaya göre veritabanı yöneticisi oluştur
+    
+    DATABASE_BACKEND ortam değişkeni:
+        'supabase' (varsayılan): PostgREST üzerinden Supabase istemcisi
+        'postgres': DATABASE_URL ile havuzlanmış doğrudan bağlantı
+        'sqlite': SQLITE_PATH dosyasında yerel veritabanı
+        'fake': bellek içi sahte Supabase istemcisi (ağsız test/benchmark)
+    
+    Returns:
+        DatabaseManager arayüzünü sağlayan nesne
+    """
+    backend = os.getenv('DATABASE_BACKEND', 'supabase').lower()
+    if backend == 'postgres':
+        from postgres_database import PostgresDatabaseManager
+        return PostgresDatabaseManager()
+    if backend == 'sqlite':
+        from sqlite_database import SQLiteDatabaseManager
+        return SQLiteDatabaseManager()
+    if backend == 'fake':
+        from fake_supabase import FakeSupabaseClient
+        return DatabaseManager(client=FakeSupabaseClient())
+    return DatabaseManager()
+
 # Global veritabanı yöneticisi
-db_manager = DatabaseManager()
+db_manager = create_db_manager()
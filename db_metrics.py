@@ -0,0 +1,263 @@
+"""
+Veritabanı Çağrı Ölçümü
+İstek başına gidiş-dönüş sayısı, süresi ve tekrarlanan sorgular
+
+Supabase istemcisi InstrumentedClient ile sarılır; her execute() süresiyle
+birlikte o anki isteğin kaydına yazılır. Asenkron PostgREST istemcisi de
+aynı şekilde sarılabilir: execute() coroutine döndürdüğünde süre await
+tamamlanınca ölçülür. İstek bitince route bazında
+histogramlar güncellenir, sorgu bütçesi aşılırsa veya aynı sorgu tekrar
+edilirse (N+1) uyarı loglanır. Debug modunda Server-Timing başlığı eklenir
+ve /debug/db-stats route'u histogramları döndürür.
+
+Örnek:
+    db_metrics = DBMetrics(app)
+    supabase = db_metrics.instrument(supabase)
+"""
+
+import contextvars
+import inspect
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from flask import Flask, abort, current_app, g, jsonify, request
+
+logger = logging.getLogger(__name__)
+
+# İstek başına izin verilen sorgu sayısı (aşılırsa uyarı)
+DB_QUERY_BUDGET = int(os.environ.get('DB_QUERY_BUDGET', '5'))
+
+# Histogram kova üst sınırları
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21)
+DB_TIME_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# O anki isteğin sorgu kaydı; PageLoader bağlamı kopyaladığından havuz thread'lerinde de görünür
+_current_log: contextvars.ContextVar = contextvars.ContextVar('db_query_log', default=None)
+
+
+class QueryLog:
+    """Bir isteğin veritabanı çağrıları: (imza, etiket, süre) listesi"""
+
+    def __init__(self):
+        self.queries: List[tuple] = []
+
+    def add(self, signature: str, label: str, elapsed: float):
+        # list.append atomik; havuz thread'lerinden eşzamanlı eklenebilir
+        self.queries.append((signature, label, elapsed))
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def total_time(self) -> float:
+        return sum(elapsed for _, _, elapsed in self.queries)
+
+    def duplicates(self) -> Dict[str, int]:
+        """Birden fazla çalışan sorgular: etiket -> tekrar sayısı"""
+        counts = Counter(signature for signature, _, _ in self.queries)
+        labels = {signature: label for signature, label, _ in self.queries}
+        return {labels[signature]: count for signature, count in counts.items() if count > 1}
+
+
+class _InstrumentedQuery:
+    """Sorgu oluşturucu zincirini izleyen vekil; execute() ölçülür"""
+
+    def __init__(self, builder: Any, steps: tuple, metrics: 'DBMetrics'):
+        self._builder = builder
+        self._steps = steps
+        self._metrics = metrics
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._builder, name)
+        if name == 'execute':
+            return self._execute
+        if not callable(attr):
+            return attr
+
+        def chained(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if hasattr(result, 'execute'):
+                return _InstrumentedQuery(result, self._steps + ((name, args, tuple(sorted(kwargs.items()))),),
+                                          self._metrics)
+            return result
+
+        return chained
+
+    def _execute(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = self._builder.execute(*args, **kwargs)
+        except Exception:
+            self._metrics.record(self._steps, time.perf_counter() - start)
+            raise
+        if inspect.isawaitable(result):
+            return self._await(result, start)
+        self._metrics.record(self._steps, time.perf_counter() - start)
+        return result
+
+    async def _await(self, awaitable, start: float):
+        try:
+            return await awaitable
+        finally:
+            self._metrics.record(self._steps, time.perf_counter() - start)
+
+
+class InstrumentedClient:
+    """Supabase istemcisi vekili: table()/from_()/rpc() zincirlerini ölçer"""
+
+    def __init__(self, client: Any, metrics: 'DBMetrics'):
+        self._client = client
+        self._metrics = metrics
+
+    def table(self, name: str) -> _InstrumentedQuery:
+        return _InstrumentedQuery(self._client.table(name), (('table', (name,), ()),), self._metrics)
+
+    from_ = table
+
+    def rpc(self, name: str, params: Optional[Dict] = None, *args, **kwargs) -> _InstrumentedQuery:
+        steps = (('rpc', (name, tuple(sorted((params or {}).items()))), ()),)
+        return _InstrumentedQuery(self._client.rpc(name, params, *args, **kwargs), steps, self._metrics)
+
+    def __getattr__(self, name: str):
+        return getattr(self._client, name)
+
+
+def _label(steps: tuple) -> str:
+    """Log ve başlıklar için kısa sorgu adı (ör. 'todos select.eq.order')"""
+    kind, args, _ = steps[0]
+    return f"{args[0]} {'.'.join(step[0] for step in steps[1:]) or kind}"
+
+
+def _bucket(value: float, bounds: tuple) -> str:
+    for bound in bounds:
+        if value <= bound:
+            return f"<={bound}"
+    return f">{bounds[-1]}"
+
+
+class DBMetrics:
+    """
+    Flask eklentisi: istek başına veritabanı çağrılarını toplar
+
+    Args:
+        app (Flask): Uygulama (sonradan init_app ile de verilebilir)
+        budget (int): İstek başına sorgu bütçesi (varsayılan DB_QUERY_BUDGET)
+    """
+
+    def __init__(self, app: Flask = None, budget: int = None):
+        self.budget = budget if budget is not None else DB_QUERY_BUDGET
+        self._routes: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask):
+        """İstek kancalarını ve debug route'unu kaydet"""
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        app.teardown_request(self._reset_request)
+        app.add_url_rule('/debug/db-stats', 'db_stats', self._stats_view)
+        app.extensions['db_metrics'] = self
+
+    def instrument(self, client: Any) -> Any:
+        """İstemciyi ölçen vekille sar (None ise olduğu gibi döner)"""
+        if client is None or isinstance(client, InstrumentedClient):
+            return client
+        return InstrumentedClient(client, self)
+
+    def record(self, steps: tuple, elapsed: float):
+        """Çağrıyı o anki isteğin kaydına ekle (istek dışında yok sayılır)"""
+        log = _current_log.get()
+        if log is not None:
+            log.add(repr(steps), _label(steps), elapsed)
+
+    # İstek kancaları
+    def _start_request(self):
+        log = QueryLog()
+        g.db_query_log = log
+        g._db_query_log_token = _current_log.set(log)
+
+    def _finish_request(self, response):
+        log = g.get('db_query_log')
+        if log is None:
+            return response
+
+        route = request.endpoint or request.path
+        self._observe(route, log)
+
+        if log.count > self.budget:
+            logger.warning("%s: %d veritabanı çağrısı (bütçe %d), toplam %.1f ms",
+                           route, log.count, self.budget, log.total_time * 1000)
+        for label, count in log.duplicates().items():
+            logger.warning("%s: aynı sorgu %d kez çalıştı: %s", route, count, label)
+
+        if self._debug():
+            response.headers['Server-Timing'] = self._server_timing(log)
+        return response
+
+    def _reset_request(self, exc=None):
+        token = g.pop('_db_query_log_token', None)
+        if token is not None:
+            _current_log.reset(token)
+
+    def _debug(self) -> bool:
+        return current_app.debug
+
+    def _server_timing(self, log: QueryLog) -> str:
+        """Server-Timing başlığı: toplam DB süresi ve sayfa yükleme süreleri"""
+        entries = [f'db;dur={log.total_time * 1000:.1f};desc="{log.count} queries"']
+        for name, elapsed in (g.get('page_load_timings') or {}).items():
+            entries.append(f'load-{name};dur={elapsed * 1000:.1f}')
+        return ', '.join(entries)
+
+    # Histogramlar
+    def _observe(self, route: str, log: QueryLog):
+        with self._lock:
+            stats = self._routes.setdefault(route, {
+                'requests': 0,
+                'queries': 0,
+                'db_time_ms': 0.0,
+                'max_queries': 0,
+                'over_budget': 0,
+                'query_count_histogram': Counter(),
+                'db_time_histogram': Counter()
+            })
+            db_ms = log.total_time * 1000
+            stats['requests'] += 1
+            stats['queries'] += log.count
+            stats['db_time_ms'] += db_ms
+            stats['max_queries'] = max(stats['max_queries'], log.count)
+            stats['over_budget'] += log.count > self.budget
+            stats['query_count_histogram'][_bucket(log.count, QUERY_COUNT_BUCKETS)] += 1
+            stats['db_time_histogram'][_bucket(db_ms, DB_TIME_BUCKETS_MS)] += 1
+
+    def route_stats(self) -> Dict[str, Dict]:
+        """Route -> istek sayısı, ortalama sorgu/süre ve histogramlar"""
+        with self._lock:
+            return {
+                route: {
+                    'requests': stats['requests'],
+                    'avg_queries': round(stats['queries'] / stats['requests'], 2),
+                    'avg_db_time_ms': round(stats['db_time_ms'] / stats['requests'], 2),
+                    'max_queries': stats['max_queries'],
+                    'over_budget': stats['over_budget'],
+                    'query_count_histogram': dict(stats['query_count_histogram']),
+                    'db_time_histogram': dict(stats['db_time_histogram'])
+                }
+                for route, stats in self._routes.items()
+            }
+
+    def reset(self):
+        """Histogramları sıfırla"""
+        with self._lock:
+            self._routes.clear()
+
+    def _stats_view(self):
+        if not self._debug():
+            abort(404)
+        return jsonify({'budget': self.budget, 'routes': self.route_stats()})
@@ -0,0 +1,119 @@
+"""
+Bitiş Tarihi İndeksi
+Tamamlanmamış todo'ların bitiş tarihine göre sıralı indeksi
+
+Todo'lar (bitiş zamanı, sıra, anahtar) demetleri halinde sıralı bir listede
+tutulur. Süresi geçmiş todo'lar listenin `now` öncesindeki kısmıdır; sayısı
+tek bir bisect ile bulunur. Zamanlar epoch saniyesi olarak saklandığından
+saat dilimli ve dilimsiz datetime değerleri birlikte kullanılabilir.
+
+Örnek:
+    index = DueDateIndex()
+    index.add(todo.id, todo.due_date, todo)
+    index.overdue_count()
+    index.due_within(timedelta(days=1))
+"""
+
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from itertools import count
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+# Formdan gelen datetime-local değeri (api/main.py)
+FORM_DATE_FORMAT = '%Y-%m-%dT%H:%M'
+
+
+def parse_due_date(value: Union[str, datetime, None]) -> Optional[datetime]:
+    """Bitiş tarihini datetime'a çevir (form biçimi veya ISO metin; geçersizse None)"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.strptime(value, FORM_DATE_FORMAT)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _epoch(value: Union[datetime, float, None]) -> Optional[float]:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return value.timestamp()
+
+
+class DueDateIndex:
+    """
+    Bitiş zamanına göre sıralı anahtar indeksi
+
+    Tamamlanan veya bitiş tarihi kaldırılan todo'lar indeksten çıkarılmalıdır
+    (remove); indeks yalnızca hâlâ süresi dolabilecek kayıtları tutar.
+    """
+
+    def __init__(self):
+        self._entries: List[Tuple[float, int, Hashable]] = []
+        self._positions: Dict[Hashable, Tuple[float, int]] = {}
+        self._values: Dict[Hashable, Any] = {}
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def add(self, key: Hashable, due_date: Union[str, datetime, float, None], value: Any = None):
+        """Kaydı ekle veya bitiş zamanını güncelle (due_date boşsa kayıt çıkarılır)"""
+        due = _epoch(parse_due_date(due_date) if isinstance(due_date, str) else due_date)
+        if due is None:
+            self.remove(key)
+            return
+        current = self._positions.get(key)
+        self._values[key] = value
+        if current is not None:
+            if current[0] == due:
+                return
+            self._discard(key, current)
+        entry = (due, next(self._sequence), key)
+        insort(self._entries, entry)
+        self._positions[key] = entry[:2]
+
+    def remove(self, key: Hashable) -> bool:
+        """Kaydı çıkar"""
+        current = self._positions.pop(key, None)
+        if current is None:
+            return False
+        self._discard(key, current)
+        del self._values[key]
+        return True
+
+    def _discard(self, key: Hashable, position: Tuple[float, int]):
+        del self._entries[bisect_left(self._entries, (*position, key))]
+
+    def clear(self):
+        self._entries.clear()
+        self._positions.clear()
+        self._values.clear()
+
+    def _cutoff(self, moment: Union[datetime, float, None]) -> int:
+        """`moment` öncesindeki kayıt sayısı"""
+        moment = time.time() if moment is None else _epoch(moment)
+        return bisect_left(self._entries, (moment,))
+
+    def overdue_count(self, now: Union[datetime, float, None] = None) -> int:
+        """Süresi geçmiş kayıt sayısı"""
+        return self._cutoff(now)
+
+    def overdue(self, now: Union[datetime, float, None] = None) -> List[Any]:
+        """Süresi geçmiş kayıtlar, en eski bitiş önce"""
+        return [self._values[key] for _, _, key in self._entries[:self._cutoff(now)]]
+
+    def due_within(self, window: timedelta, now: Union[datetime, float, None] = None) -> List[Any]:
+        """Şimdiden `window` sonrasına kadar süresi dolacak kayıtlar, en yakın bitiş önce"""
+        start = time.time() if now is None else _epoch(now)
+        end = start + window.total_seconds()
+        return [self._values[key] for _, _, key in self._entries[self._cutoff(start):self._cutoff(end)]]
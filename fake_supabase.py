@@ -0,0 +1,397 @@
+"""
+Sahte Supabase İstemcisi
+Ağ olmadan test ve benchmark için bellek içi PostgREST taklidi
+
+Uygulamanın kullandığı sorgu oluşturucu yüzeyini uygular:
+table().select/insert/update/delete, eq/neq/lt/lte/gt/gte/in_,
+order/limit/single/maybe_single/text_search, execute() ve rpc().
+Her execute() bir gidiş-dönüş sayılır; istenirse yapay gecikme eklenir.
+
+Örnek:
+    client = FakeSupabaseClient(latency=0.005)
+    manager = DatabaseManager(client=client)
+    manager.get_user_todos(user_id)
+    assert client.call_count == 1
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from search_index import word_similarity
+from utils import search_todos
+
+# insert sırasında doldurulan varsayılan sütunlar (üretim şemasındaki DEFAULT'lar)
+TABLE_DEFAULTS = {
+    'users': {'email': None, 'is_active': True, 'last_login': None},
+    'todos': {
+        'category_id': None, 'description': None, 'priority': 'orta', 'status': 'pending',
+        'completed': False, 'due_date': None, 'tags': None
+    },
+    'categories': {'color': '#007bff'},
+    'weather_history': {'temperature': None, 'description': None, 'humidity': None, 'icon': None},
+}
+
+# updated_at sütunu olan tablolar (trigger karşılığı)
+TABLES_WITH_UPDATED_AT = {'users', 'todos'}
+
+
+class FakeAPIError(Exception):
+    """postgrest.APIError karşılığı"""
+
+
+class FakeResponse:
+    """execute() sonucu (postgrest APIResponse karşılığı)"""
+
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+    def __repr__(self):
+        return f"FakeResponse(data={self.data!r}, count={self.count!r})"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _as_filter_value(value) -> str:
+    """Değeri PostgREST'in URL'de gönderdiği metne çevir"""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _as_comparable(value):
+    """Sıralama/karşılaştırma için değer (sayı, zaman veya metin)"""
+    if value is None or isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    text = _as_filter_value(value)
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    except ValueError:
+        return text
+
+
+def _to_json(payload):
+    """Gönderilecek veriyi JSON'dan geçir (gerçek istemci gibi serileştirilemeyen değerde hata verir)"""
+    return json.loads(json.dumps(payload))
+
+
+def _copy_row(row: Dict) -> Dict:
+    """Satırın kopyası (listeler dahil), çağıranın değişiklikleri depoya yansımaz"""
+    return {key: list(value) if isinstance(value, list) else value for key, value in row.items()}
+
+
+class FakeQueryBuilder:
+    """Tek tablo üzerindeki sorgu zinciri"""
+
+    def __init__(self, client: 'FakeSupabaseClient', table: str):
+        self.client = client
+        self.table = table
+        self.operation = 'select'
+        self.columns: Optional[List[str]] = None
+        self.payload: Union[Dict, List[Dict], None] = None
+        self.filters: List[Callable[[Dict], bool]] = []
+        self.orders: List[tuple] = []
+        self.row_limit: Optional[int] = None
+        self.single_mode: Optional[str] = None
+        self.count_mode: Optional[str] = None
+
+    # İşlem türleri
+    def select(self, *columns: str, count: Optional[str] = None) -> 'FakeQueryBuilder':
+        self.operation = 'select'
+        names = [name.strip() for column in columns for name in column.split(',')]
+        self.columns = None if not names or '*' in names else names
+        self.count_mode = count
+        return self
+
+    def insert(self, json: Union[Dict, List[Dict]], **kwargs) -> 'FakeQueryBuilder':
+        self.operation = 'insert'
+        self.payload = _to_json(json)
+        return self
+
+    def update(self, json: Dict, **kwargs) -> 'FakeQueryBuilder':
+        self.operation = 'update'
+        self.payload = _to_json(json)
+        return self
+
+    def delete(self, **kwargs) -> 'FakeQueryBuilder':
+        self.operation = 'delete'
+        return self
+
+    # Filtreler
+    def eq(self, column: str, value) -> 'FakeQueryBuilder':
+        expected = _as_filter_value(value)
+        self.filters.append(lambda row: _as_filter_value(row.get(column)) == expected)
+        return self
+
+    def neq(self, column: str, value) -> 'FakeQueryBuilder':
+        expected = _as_filter_value(value)
+        self.filters.append(lambda row: _as_filter_value(row.get(column)) != expected)
+        return self
+
+    def _compare(self, column: str, value, predicate: Callable[[Any, Any], bool]) -> 'FakeQueryBuilder':
+        expected = _as_comparable(value)
+
+        def matches(row):
+            actual = _as_comparable(row.get(column))
+            if actual is None or expected is None:
+                return False
+            try:
+                return predicate(actual, expected)
+            except TypeError:
+                return predicate(_as_filter_value(row.get(column)), _as_filter_value(value))
+
+        self.filters.append(matches)
+        return self
+
+    def lt(self, column: str, value) -> 'FakeQueryBuilder':
+        return self._compare(column, value, lambda a, b: a < b)
+
+    def lte(self, column: str, value) -> 'FakeQueryBuilder':
+        return self._compare(column, value, lambda a, b: a <= b)
+
+    def gt(self, column: str, value) -> 'FakeQueryBuilder':
+        return self._compare(column, value, lambda a, b: a > b)
+
+    def gte(self, column: str, value) -> 'FakeQueryBuilder':
+        return self._compare(column, value, lambda a, b: a >= b)
+
+    def in_(self, column: str, values) -> 'FakeQueryBuilder':
+        expected = {_as_filter_value(value) for value in values}
+        self.filters.append(lambda row: _as_filter_value(row.get(column)) in expected)
+        return self
+
+    def text_search(self, column: str, query: str, options: Optional[Dict] = None) -> 'FakeQueryBuilder':
+        """Tam metin arama: sorgudaki tüm kelimeler sütunda geçmeli (büyük/küçük harf duyarsız)"""
+        terms = [term.casefold() for term in re.findall(r'\w+', query)]
+
+        def matches(row):
+            words = re.findall(r'\w+', str(row.get(column) or '').casefold())
+            return all(any(word.startswith(term) for word in words) for term in terms)
+
+        self.filters.append(matches)
+        return self
+
+    # Sonuç biçimi
+    def order(self, column: str, desc: bool = False, **kwargs) -> 'FakeQueryBuilder':
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, size: int, **kwargs) -> 'FakeQueryBuilder':
+        self.row_limit = size
+        return self
+
+    def single(self) -> 'FakeQueryBuilder':
+        self.single_mode = 'single'
+        return self
+
+    def maybe_single(self) -> 'FakeQueryBuilder':
+        self.single_mode = 'maybe_single'
+        return self
+
+    def execute(self) -> FakeResponse:
+        """Sorguyu çalıştır (bir gidiş-dönüş)"""
+        self.client._record('table', self.table, self.operation)
+        with self.client.lock:
+            rows = getattr(self, f"_execute_{self.operation}")()
+
+        count = len(rows) if self.count_mode else None
+        if self.columns is not None:
+            rows = [{column: row.get(column) for column in self.columns} for row in rows]
+
+        if self.single_mode:
+            if len(rows) > 1 or (not rows and self.single_mode == 'single'):
+                raise FakeAPIError(f"JSON object requested, multiple (or no) rows returned ({len(rows)})")
+            return FakeResponse(rows[0] if rows else None, count)
+        return FakeResponse(rows, count)
+
+    def _matching(self) -> List[Dict]:
+        return [row for row in self.client.tables.setdefault(self.table, [])
+                if all(matches(row) for matches in self.filters)]
+
+    def _execute_select(self) -> List[Dict]:
+        rows = self._matching()
+        for column, desc in reversed(self.orders):
+            # Postgres varsayılanı: artan sırada NULL'lar sonda, azalan sırada başta
+            rows.sort(key=lambda row: (True, 0) if row.get(column) is None
+                      else (False, _as_comparable(row.get(column))), reverse=desc)
+        if self.row_limit is not None:
+            rows = rows[:self.row_limit]
+        return [_copy_row(row) for row in rows]
+
+    def _execute_insert(self) -> List[Dict]:
+        payload = self.payload if isinstance(self.payload, list) else [self.payload]
+        now = _now()
+        created = []
+        for values in payload:
+            row = {'id': str(uuid.uuid4()), **TABLE_DEFAULTS.get(self.table, {}), 'created_at': now}
+            if self.table in TABLES_WITH_UPDATED_AT:
+                row['updated_at'] = now
+            row.update(_copy_row(values))
+            self.client.tables.setdefault(self.table, []).append(row)
+            created.append(_copy_row(row))
+        return created
+
+    def _execute_update(self) -> List[Dict]:
+        rows = self._matching()
+        for row in rows:
+            row.update(_copy_row(self.payload))
+            if self.table in TABLES_WITH_UPDATED_AT:
+                row['updated_at'] = _now()
+        return [_copy_row(row) for row in rows]
+
+    def _execute_delete(self) -> List[Dict]:
+        rows = self._matching()
+        deleted = {id(row) for row in rows}
+        self.client.tables[self.table] = [row for row in self.client.tables[self.table] if id(row) not in deleted]
+        return [_copy_row(row) for row in rows]
+
+
+class FakeRpcCall:
+    """rpc() sonucu; execute() ile çalışır"""
+
+    def __init__(self, client: 'FakeSupabaseClient', name: str, params: Dict):
+        self.client = client
+        self.name = name
+        self.params = params or {}
+
+    def execute(self) -> FakeResponse:
+        self.client._record('rpc', self.name, 'call')
+        handler = self.client.rpc_handlers.get(self.name)
+        if handler is None:
+            raise FakeAPIError(f"Could not find the function public.{self.name}")
+        with self.client.lock:
+            return FakeResponse(handler(self.client, **self.params))
+
+
+def _todo_statistics(client: 'FakeSupabaseClient', p_user_id: str) -> List[Dict]:
+    """todo_statistics SQL fonksiyonunun karşılığı"""
+    todos = [todo for todo in client.tables.get('todos', []) if _as_filter_value(todo.get('user_id')) == str(p_user_id)]
+    now = _as_comparable(_now())
+    return [{
+        'total': len(todos),
+        'completed': sum(1 for todo in todos if todo.get('completed')),
+        'pending': sum(1 for todo in todos if not todo.get('completed')),
+        'overdue': sum(1 for todo in todos
+                       if not todo.get('completed') and todo.get('due_date')
+                       and _as_comparable(todo['due_date']) < now),
+        'high_priority': sum(1 for todo in todos if todo.get('priority') == 'yüksek'),
+        'medium_priority': sum(1 for todo in todos if todo.get('priority') == 'orta'),
+        'low_priority': sum(1 for todo in todos if todo.get('priority') == 'düşük'),
+        'in_progress': sum(1 for todo in todos if todo.get('status') == 'in_progress'),
+        'cancelled': sum(1 for todo in todos if todo.get('status') == 'cancelled'),
+    }]
+
+
+def _toggle_todo_complete(client: 'FakeSupabaseClient', p_todo_id, p_user_id=None) -> List[Dict]:
+    """toggle_todo_complete SQL fonksiyonunun karşılığı"""
+    for todo in client.tables.get('todos', []):
+        if _as_filter_value(todo.get('id')) != _as_filter_value(p_todo_id):
+            continue
+        if p_user_id is not None and _as_filter_value(todo.get('user_id')) != _as_filter_value(p_user_id):
+            continue
+        todo['completed'] = not todo.get('completed')
+        todo['status'] = 'completed' if todo['completed'] else 'pending'
+        todo['updated_at'] = _now()
+        return [_copy_row(todo)]
+    return []
+
+
+def _search_todos(client: 'FakeSupabaseClient', p_user_id, p_query: str,
+                  p_limit: int = 20, p_offset: int = 0) -> List[Dict]:
+    """search_todos SQL fonksiyonunun karşılığı (ağırlıklı kelime eşleşmesi)"""
+    todos = [todo for todo in client.tables.get('todos', [])
+             if _as_filter_value(todo.get('user_id')) == _as_filter_value(p_user_id)]
+    return [_copy_row(todo) for todo in search_todos(todos, p_query, p_limit, p_offset)]
+
+
+def _fuzzy_search_todos(client: 'FakeSupabaseClient', p_user_id, p_query: str, p_threshold: float = 0.3,
+                        p_limit: int = 20, p_offset: int = 0) -> List[Dict]:
+    """fuzzy_search_todos SQL fonksiyonunun karşılığı (trigram benzerliği)"""
+    scored = []
+    for todo in client.tables.get('todos', []):
+        if _as_filter_value(todo.get('user_id')) != _as_filter_value(p_user_id):
+            continue
+        score = word_similarity(p_query, todo.get('text') or '')
+        if score >= p_threshold:
+            scored.append((score, str(todo.get('created_at') or ''), todo))
+    scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    return [_copy_row(todo) for _, _, todo in scored[p_offset:p_offset + p_limit]]
+
+
+class FakeSupabaseClient:
+    """
+    Bellek içi Supabase istemcisi
+
+    Args:
+        latency (float | callable): execute() başına saniye cinsinden gecikme
+            veya (tür, hedef, işlem) alıp gecikme döndüren fonksiyon
+        tables (dict): Başlangıç verisi: tablo adı -> satır listesi
+    """
+
+    def __init__(self, latency: Union[float, Callable[[str, str, str], float]] = 0.0,
+                 tables: Optional[Dict[str, List[Dict]]] = None):
+        self.latency = latency
+        self.tables: Dict[str, List[Dict]] = {name: [dict(row) for row in rows]
+                                              for name, rows in (tables or {}).items()}
+        self.rpc_handlers: Dict[str, Callable] = {
+            'todo_statistics': _todo_statistics,
+            'todo_statistics_cached': _todo_statistics,
+            'toggle_todo_complete': _toggle_todo_complete,
+            'search_todos': _search_todos,
+            'fuzzy_search_todos': _fuzzy_search_todos,
+        }
+        self.lock = threading.RLock()
+        self.calls: List[tuple] = []
+        self._calls_lock = threading.Lock()
+
+    def table(self, name: str) -> FakeQueryBuilder:
+        return FakeQueryBuilder(self, name)
+
+    from_ = table
+
+    def rpc(self, name: str, params: Optional[Dict] = None) -> FakeRpcCall:
+        return FakeRpcCall(self, name, params)
+
+    def register_rpc(self, name: str, handler: Callable):
+        """SQL fonksiyonu karşılığı ekle: handler(client, **params) -> satır listesi"""
+        self.rpc_handlers[name] = handler
+
+    # Gidiş-dönüş sayımı
+    def _record(self, kind: str, target: str, operation: str):
+        with self._calls_lock:
+            self.calls.append((kind, target, operation))
+        delay = self.latency(kind, target, operation) if callable(self.latency) else self.latency
+        if delay:
+            time.sleep(delay)
+
+    @property
+    def call_count(self) -> int:
+        """Toplam execute() sayısı"""
+        return len(self.calls)
+
+    def call_counts(self) -> Counter:
+        """(tür, hedef, işlem) -> çağrı sayısı"""
+        with self._calls_lock:
+            return Counter(self.calls)
+
+    def reset_calls(self):
+        """Çağrı sayaçlarını sıfırla"""
+        with self._calls_lock:
+            self.calls.clear()
@@ -3,14 +3,34 @@ Veri Modelleri
 Python Flask Uygulaması için veri modelleri
 """
 
+import sys
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
+# Todo zaman damgalarının gösterim biçimi
+DATE_FORMAT = '%d.%m.%Y %H:%M'
+
+
+def _format_timestamp(timestamp: Optional[int]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp).strftime(DATE_FORMAT) if timestamp is not None else None
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[int]:
+    return int(datetime.strptime(value, DATE_FORMAT).timestamp()) if value else None
+
+
 class Todo:
     """
     Todo sınıfı - Görev modeli
+    
+    Bellekte çok sayıda todo tutulabildiği için __slots__ kullanılır ve
+    zaman damgaları biçimlendirilmiş metin yerine epoch saniyesi olarak
+    saklanır; created_at/updated_at erişimde biçimlendirilir.
     """
     
+    __slots__ = ('id', 'text', 'priority', 'completed', '_created', '_updated')
+    
     def __init__(self, text: str, priority: str = 'orta', todo_id: int = None):
         """
         Todo nesnesi oluştur
@@ -22,10 +42,28 @@ class Todo:
         """
         self.id = todo_id
         self.text = text
-        self.priority = priority
+        self.priority = sys.intern(priority) if type(priority) is str else priority
         self.completed = False
-        self.created_at = datetime.now().strftime('%d.%m.%Y %H:%M')
-        self.updated_at = None
+        self._created = int(time.time())
+        self._updated = None
+    
+    @property
+    def created_at(self) -> Optional[str]:
+        """Oluşturulma zamanı ('%d.%m.%Y %H:%M')"""
+        return _format_timestamp(self._created)
+    
+    @created_at.setter
+    def created_at(self, value: Optional[str]):
+        self._created = _parse_timestamp(value)
+    
+    @property
+    def updated_at(self) -> Optional[str]:
+        """Son güncelleme zamanı ('%d.%m.%Y %H:%M') veya None"""
+        return _format_timestamp(self._updated)
+    
+    @updated_at.setter
+    def updated_at(self, value: Optional[str]):
+        self._updated = _parse_timestamp(value)
     
     def to_dict(self) -> Dict:
         """
@@ -46,7 +84,7 @@ class Todo:
     def toggle_complete(self):
         """Todo'yu tamamla/tamamlanmamış yap"""
         self.completed = not self.completed
-        self.updated_at = datetime.now().strftime('%d.%m.%Y %H:%M')
+        self._updated = int(time.time())
     
     def update_text(self, new_text: str):
         """
@@ -56,7 +94,7 @@ class Todo:
             new_text (str): Yeni metin
         """
         self.text = new_text
-        self.updated_at = datetime.now().strftime('%d.%m.%Y %H:%M')
+        self._updated = int(time.time())
     
     def update_priority(self, new_priority: str):
         """
@@ -65,8 +103,8 @@ class Todo:
         Args:
             new_priority (str): Yeni öncelik
         """
-        self.priority = new_priority
-        self.updated_at = datetime.now().strftime('%d.%m.%Y %H:%M')
+        self.priority = sys.intern(new_priority) if type(new_priority) is str else new_priority
+        self._updated = int(time.time())
 
 class WeatherData:
     """
@@ -111,13 +149,25 @@ class WeatherData:
 class TodoManager:
     """
     Todo yönetim sınıfı
+    
+    Todo'lar ID ile sözlükte tutulur (ekleme sırası korunur), öncelik için
+    ayrıca bir indeks vardır. Öncelik değişiklikleri indeksin güncel kalması
+    için update_priority ile yapılmalıdır.
     """
     
     def __init__(self):
         """Todo yöneticisi oluştur"""
-        self.todos: List[Todo] = []
+        self._todos: Dict[int, Todo] = {}
+        self._by_priority: Dict[str, Dict[int, Todo]] = {}
+        # update_priority ile sona eklenip ID sırası bozulan öncelik kovaları
+        self._unsorted: set = set()
         self.next_id = 1
     
+    @property
+    def todos(self) -> List[Todo]:
+        """Tüm todo'lar, ekleme sırasıyla (geriye dönük uyumluluk için)"""
+        return list(self._todos.values())
+    
     def add_todo(self, text: str, priority: str = 'orta') -> Todo:
         """
         Yeni todo ekle
@@ -130,7 +180,8 @@ class TodoManager:
             Todo: Eklenen todo nesnesi
         """
         todo = Todo(text, priority, self.next_id)
-        self.todos.append(todo)
+        self._todos[todo.id] = todo
+        self._by_priority.setdefault(priority, {})[todo.id] = todo
         self.next_id += 1
         return todo
     
@@ -144,10 +195,29 @@ class TodoManager:
         Returns:
             Todo: Todo nesnesi veya None
         """
-        for todo in self.todos:
-            if todo.id == todo_id:
-                return todo
-        return None
+        return self._todos.get(todo_id)
+    
+    def update_priority(self, todo_id: int, priority: str) -> Optional[Todo]:
+        """
+        Todo önceliğini güncelle ve indeksi taşı
+        
+        Args:
+            todo_id (int): Todo ID'si
+            priority (str): Yeni öncelik
+        
+        Returns:
+            Todo: Güncellenen todo veya None
+        """
+        todo = self._todos.get(todo_id)
+        if todo is None:
+            return None
+        self._unindex(todo)
+        todo.update_priority(priority)
+        bucket = self._by_priority.setdefault(priority, {})
+        if bucket and next(reversed(bucket)) > todo.id:
+            self._unsorted.add(priority)
+        bucket[todo.id] = todo
+        return todo
     
     def delete_todo(self, todo_id: int) -> bool:
         """
@@ -159,11 +229,19 @@ class TodoManager:
         Returns:
             bool: Silme başarılı mı?
         """
-        for i, todo in enumerate(self.todos):
-            if todo.id == todo_id:
-                del self.todos[i]
-                return True
-        return False
+        todo = self._todos.pop(todo_id, None)
+        if todo is None:
+            return False
+        self._unindex(todo)
+        return True
+    
+    def _unindex(self, todo: Todo):
+        """Todo'yu öncelik indeksinden çıkar"""
+        bucket = self._by_priority.get(todo.priority)
+        if bucket is not None:
+            bucket.pop(todo.id, None)
+            if not bucket:
+                del self._by_priority[todo.priority]
     
     def get_all_todos(self) -> List[Dict]:
         """
@@ -172,7 +250,7 @@ class TodoManager:
         Returns:
             list: Todo sözlükleri listesi
         """
-        return [todo.to_dict() for todo in self.todos]
+        return [todo.to_dict() for todo in self._todos.values()]
     
     def get_todos_by_priority(self, priority: str) -> List[Dict]:
         """
@@ -184,5 +262,9 @@ class TodoManager:
         Returns:
             list: Filtrelenmiş todo listesi
         """
-        filtered_todos = [todo for todo in self.todos if todo.priority == priority]
-        return [todo.to_dict() for todo in filtered_todos]
+        bucket = self._by_priority.get(priority, {})
+        if priority in self._unsorted:
+            # ID'ler artan olduğundan ID sırası ekleme sırasıdır
+            bucket = self._by_priority[priority] = dict(sorted(bucket.items()))
+            self._unsorted.discard(priority)
+        return [todo.to_dict() for todo in bucket.values()]
@@ -0,0 +1,151 @@
+"""
+Sayfa Yükleme Yardımcısı
+Bir view'in birbirinden bağımsız engelleyici çağrılarını paylaşılan,
+sınırlı bir thread havuzunda eşzamanlı çalıştırır
+
+Her çağrının kendi süre sınırı (deadline) vardır; süresi dolan çağrı
+için varsayılan değer kullanılır ve sayfa beklemeden render edilir.
+Süreler toplanır, en uzun süren çağrı (kritik yol) loglanır.
+"""
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+from flask import g, has_app_context
+
+logger = logging.getLogger(__name__)
+
+# Varsayılan süre sınırları (saniye)
+WEATHER_DEADLINE = float(os.environ.get('WEATHER_DEADLINE_SECONDS', '3.0'))
+DB_DEADLINE = float(os.environ.get('DB_DEADLINE_SECONDS', '5.0'))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Süreç genelinde paylaşılan thread havuzunu getir (ilk kullanımda oluşturulur)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(os.environ.get('PAGE_LOADER_WORKERS', '16')),
+                    thread_name_prefix='page-loader'
+                )
+    return _executor
+
+
+def _timed_call(func: Callable, args: tuple, kwargs: dict):
+    """Çağrıyı çalıştır, (sonuç, süre) döndür"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+class PageLoader:
+    """
+    Bir isteğin bağımsız yüklemelerini toplayan yardımcı
+
+    submit() ile havuza gönderilen çağrılar arka planda çalışırken
+    run() ile view thread'inde (istek bağlamı gerektiren) çağrılar
+    yapılabilir; gather() tüm sonuçları toplar.
+
+    Örnek:
+        loader = PageLoader('index')
+        loader.submit('weather', get_weather, city, deadline=WEATHER_DEADLINE)
+        todos = loader.run('todos', get_user_todos)
+        weather = loader.gather()['weather']
+    """
+
+    def __init__(self, name: str, executor: ThreadPoolExecutor = None):
+        """
+        Args:
+            name (str): Sayfa adı (loglarda kullanılır)
+            executor (ThreadPoolExecutor): Havuz (varsayılan paylaşılan havuz)
+        """
+        self.name = name
+        self.executor = executor or get_executor()
+        self.started_at = time.perf_counter()
+        self.results: Dict[str, Any] = {}
+        self.timings: Dict[str, float] = {}
+        self.timed_out = set()
+        self._pending: Dict[str, tuple] = {}
+
+    def submit(self, name: str, func: Callable, *args, deadline: Optional[float] = None,
+               default: Any = None, **kwargs):
+        """
+        Çağrıyı havuzda başlat
+
+        Args:
+            name (str): Sonucun adı
+            func (callable): Çağrılacak fonksiyon (istek bağlamına erişmemeli;
+                context değişkenleri kopyalanır, ör. db_metrics sorgu kaydı)
+            deadline (float): Gönderimden itibaren en fazla bekleme süresi (saniye)
+            default: Süre dolarsa veya hata olursa kullanılacak değer
+        """
+        context = contextvars.copy_context()
+        future = self.executor.submit(context.run, _timed_call, func, args, kwargs)
+        self._pending[name] = (future, time.perf_counter(), deadline, default)
+
+    def run(self, name: str, func: Callable, *args, **kwargs) -> Any:
+        """Çağrıyı view thread'inde çalıştır ve süresini kaydet"""
+        result, elapsed = _timed_call(func, args, kwargs)
+        self.results[name] = result
+        self.timings[name] = elapsed
+        return result
+
+    def gather(self) -> Dict[str, Any]:
+        """
+        Havuzdaki çağrıları bekle ve tüm sonuçları döndür
+
+        Returns:
+            dict: Ad -> sonuç
+        """
+        for name, (future, submitted_at, deadline, default) in self._pending.items():
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - (time.perf_counter() - submitted_at))
+            try:
+                result, elapsed = future.result(timeout=timeout)
+                self.results[name] = result
+                self.timings[name] = elapsed
+            except FutureTimeoutError:
+                future.cancel()
+                self.timed_out.add(name)
+                self.results[name] = default
+                self.timings[name] = time.perf_counter() - submitted_at
+            except Exception as e:
+                logger.warning("%s: %s yüklenemedi: %s", self.name, name, e)
+                self.results[name] = default
+                self.timings[name] = time.perf_counter() - submitted_at
+        self._pending.clear()
+        self._report()
+        return self.results
+
+    def critical_path(self) -> Optional[str]:
+        """En uzun süren çağrının adı"""
+        if not self.timings:
+            return None
+        return max(self.timings, key=self.timings.get)
+
+    def _report(self):
+        """Süreleri logla ve istek bağlamına (g.page_load_timings) kaydet"""
+        total = time.perf_counter() - self.started_at
+        critical = self.critical_path()
+        if has_app_context():
+            g.page_load_timings = dict(self.timings)
+        logger.info(
+            "%s: toplam %.1f ms, kritik yol %s (%.1f ms); %s%s",
+            self.name,
+            total * 1000,
+            critical,
+            self.timings.get(critical, 0.0) * 1000,
+            ', '.join(f"{name} {elapsed * 1000:.1f} ms" for name, elapsed in self.timings.items()),
+            f"; süresi dolan: {', '.join(sorted(self.timed_out))}" if self.timed_out else ''
+        )
@@ -0,0 +1,631 @@
+"""
+Doğrudan Postgres Veritabanı Yönetimi
+PostgREST (HTTP/JSON) yerine havuzlanmış psycopg2 bağlantıları
+
+DatabaseManager ve AdvancedDatabaseManager ile aynı arayüzü sunar;
+DATABASE_BACKEND=postgres ile seçilir ve DATABASE_URL kullanır.
+Sık çalışan sorgular bağlantı başına bir kez PREPARE edilir, büyük
+listeler sunucu tarafı cursor ile parça parça okunabilir.
+"""
+
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional
+
+from advanced_models import User, Category, Todo, WeatherRecord, Priority, Status
+from utils import chunked, group_updates
+
+try:
+    import psycopg2
+    import psycopg2.extras
+    import psycopg2.pool
+    from psycopg2 import sql
+
+    class _PreparingConnection(psycopg2.extensions.connection):
+        """Bağlantıda hazırlanmış (PREPARE) sorgu adlarını tutan bağlantı"""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.prepared = set()
+except ImportError:
+    psycopg2 = None
+
+
+# Hazırlanmış sorgular: ad -> SQL ($n parametreleri)
+STATEMENTS = {
+    'user_by_username': "SELECT * FROM users WHERE username = $1",
+    'user_insert': "INSERT INTO users (username, email) VALUES ($1, $2) RETURNING *",
+    'user_insert_active': "INSERT INTO users (username, email, is_active) VALUES ($1, $2, TRUE) RETURNING *",
+    'todo_insert': (
+        "INSERT INTO todos (user_id, text, priority, completed) "
+        "VALUES ($1, $2, $3, FALSE) RETURNING *"
+    ),
+    'todo_insert_full': (
+        "INSERT INTO todos (user_id, text, description, priority, status, completed, due_date, tags, category_id) "
+        "VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9) RETURNING *"
+    ),
+    'todos_by_user': "SELECT * FROM todos WHERE user_id = $1 ORDER BY created_at DESC",
+    'todos_by_priority': "SELECT * FROM todos WHERE user_id = $1 AND priority = $2 ORDER BY created_at DESC",
+    'todos_by_category': "SELECT * FROM todos WHERE user_id = $1 AND category_id = $2 ORDER BY created_at DESC",
+    'todos_overdue': "SELECT * FROM todos WHERE user_id = $1 AND due_date < NOW() AND completed = FALSE",
+    'todos_search': "SELECT * FROM search_todos($1, $2, $3, $4)",
+    'todos_fuzzy_search': "SELECT * FROM fuzzy_search_todos($1, $2, $3, $4, $5)",
+    'todo_delete': "DELETE FROM todos WHERE id = $1 AND ($2::uuid IS NULL OR user_id = $2) RETURNING id",
+    'todo_toggle': "SELECT * FROM toggle_todo_complete($1, $2)",
+    'todo_statistics_cached': "SELECT * FROM todo_statistics_cached($1)",
+    'todo_statistics': "SELECT * FROM todo_statistics($1)",
+    'category_insert': "INSERT INTO categories (user_id, name, color) VALUES ($1, $2, $3) RETURNING *",
+    'categories_by_user': "SELECT * FROM categories WHERE user_id = $1",
+    'weather_insert': (
+        "INSERT INTO weather_history (user_id, city, temperature, description, humidity, icon) "
+        "VALUES ($1, $2, $3, $4, $5, $6) RETURNING *"
+    ),
+}
+
+
+def _serialize_row(row: Dict) -> Dict:
+    """Satırı PostgREST'in döndürdüğü JSON biçimine çevir"""
+    data = {}
+    for key, value in row.items():
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, Decimal):
+            value = float(value)
+        data[key] = value
+    return data
+
+
+class _PostgresBackend:
+    """
+    Bağlantı havuzu ve sorgu yardımcıları
+
+    İki yönetici sınıfın ortak altyapısı.
+    """
+
+    def __init__(self, dsn: str = None):
+        """Bağlantı havuzunu başlat"""
+        if psycopg2 is None:
+            raise ImportError("postgres backend için psycopg2 gerekli!")
+
+        self.dsn = dsn or os.getenv('DATABASE_URL')
+        if not self.dsn:
+            raise ValueError("DATABASE_URL environment variable gerekli!")
+
+        self.pool = psycopg2.pool.ThreadedConnectionPool(
+            int(os.getenv('DB_POOL_MIN', '1')),
+            int(os.getenv('DB_POOL_MAX', '10')),
+            self.dsn,
+            connection_factory=_PreparingConnection
+        )
+
+        # Toplu işlemlerde tek istekte gönderilecek satır sayısı
+        self.bulk_chunk_size = int(os.getenv('DB_BULK_CHUNK_SIZE', '500'))
+
+    @contextmanager
+    def _cursor(self):
+        """Havuzdan bağlantı al, işlem sonunda commit/rollback yap ve geri ver"""
+        conn = self.pool.getconn()
+        try:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                yield cur
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn, close=bool(conn.closed))
+
+    def _execute(self, cur, name: str, params: tuple = ()):
+        """Hazırlanmış sorguyu çalıştır (bağlantıda ilk kullanımda PREPARE edilir)"""
+        conn = cur.connection
+        if name not in conn.prepared:
+            cur.execute(f"PREPARE {name} AS {STATEMENTS[name]}")
+            conn.prepared.add(name)
+        if params:
+            cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        else:
+            cur.execute(f"EXECUTE {name}")
+
+    def _query(self, name: str, *params) -> List[Dict]:
+        """Hazırlanmış sorguyu çalıştır ve tüm satırları döndür"""
+        with self._cursor() as cur:
+            self._execute(cur, name, params)
+            return cur.fetchall() if cur.description else []
+
+    def _iter_rows(self, query: str, params: tuple, batch_size: int) -> Iterator[Dict]:
+        """Sunucu tarafı (isimli) cursor ile satırları parça parça oku"""
+        conn = self.pool.getconn()
+        try:
+            with conn.cursor(name=f"cur_{uuid.uuid4().hex}",
+                             cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                cur.itersize = batch_size
+                cur.execute(query, params)
+                for row in cur:
+                    yield row
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn, close=bool(conn.closed))
+
+    def _update_rows(self, todo_ids: List[str], fields: Dict, owner_id: Optional[str] = None) -> List[str]:
+        """Verilen todo'lara aynı alan değişikliklerini uygula, güncellenen ID'leri döndür"""
+        if not fields or not todo_ids:
+            return []
+
+        assignments = sql.SQL(', ').join(
+            sql.SQL('{} = %s').format(sql.Identifier(column)) for column in fields
+        )
+        query = sql.SQL('UPDATE todos SET {} WHERE id = ANY(%s::uuid[])').format(assignments)
+        params = list(fields.values()) + [list(todo_ids)]
+        if owner_id is not None:
+            query += sql.SQL(' AND user_id = %s')
+            params.append(owner_id)
+        query += sql.SQL(' RETURNING id')
+
+        with self._cursor() as cur:
+            cur.execute(query, params)
+            return [str(row['id']) for row in cur.fetchall()]
+
+    def _insert_todo_rows(self, rows: List[Dict]) -> List[Dict]:
+        """Çok satırlı INSERT (tek istek) ve eklenen satırlar"""
+        columns = list(rows[0].keys())
+        query = sql.SQL('INSERT INTO todos ({}) VALUES %s RETURNING *').format(
+            sql.SQL(', ').join(sql.Identifier(column) for column in columns)
+        )
+        with self._cursor() as cur:
+            return psycopg2.extras.execute_values(
+                cur, query.as_string(cur), [tuple(row[c] for c in columns) for row in rows],
+                page_size=len(rows), fetch=True
+            )
+
+    def _fetch_statistics_row(self, user_id: str) -> Dict:
+        """Sayaç tablosundan istatistik satırı, yoksa aggregate sorgu"""
+        rows = self._query('todo_statistics_cached', user_id)
+        if rows:
+            return rows[0]
+        rows = self._query('todo_statistics', user_id)
+        return rows[0] if rows else {}
+
+    def delete_todo(self, todo_id: str, owner_id: Optional[str] = None) -> bool:
+        """Todo sil (owner_id verilirse yalnızca o kullanıcının todo'su)"""
+        try:
+            return len(self._query('todo_delete', todo_id, owner_id)) > 0
+        except Exception as e:
+            print(f"Todo silme hatası: {e}")
+            return False
+
+    def delete_todos_bulk(self, todo_ids: List[str], chunk_size: int = None) -> Dict[str, bool]:
+        """Todo'ları parça parça id = ANY(...) ile toplu sil"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = {todo_id: False for todo_id in todo_ids}
+
+        for chunk in chunked(list(todo_ids), chunk_size):
+            try:
+                with self._cursor() as cur:
+                    cur.execute("DELETE FROM todos WHERE id = ANY(%s::uuid[]) RETURNING id", (chunk,))
+                    for row in cur.fetchall():
+                        results[str(row['id'])] = True
+            except Exception as e:
+                print(f"Toplu todo silme hatası: {e}")
+
+        return results
+
+    def close(self):
+        """Havuzdaki tüm bağlantıları kapat"""
+        self.pool.closeall()
+
+
+class PostgresDatabaseManager(_PostgresBackend):
+    """
+    DatabaseManager arayüzünün doğrudan Postgres karşılığı
+
+    Satırlar DatabaseManager'daki gibi sözlük olarak döner
+    (tarih alanları ISO metin).
+    """
+
+    def create_user(self, username: str, email: str) -> Dict:
+        """Yeni kullanıcı oluştur"""
+        try:
+            rows = self._query('user_insert', username, email)
+            return _serialize_row(rows[0]) if rows else None
+        except Exception as e:
+            print(f"Kullanıcı oluşturma hatası: {e}")
+            return None
+
+    def get_user_by_username(self, username: str) -> Optional[Dict]:
+        """Kullanıcı adına göre kullanıcı getir"""
+        try:
+            rows = self._query('user_by_username', username)
+            return _serialize_row(rows[0]) if rows else None
+        except Exception as e:
+            print(f"Kullanıcı getirme hatası: {e}")
+            return None
+
+    def create_todo(self, user_id: str, text: str, priority: str = 'orta') -> Dict:
+        """Yeni todo oluştur"""
+        try:
+            rows = self._query('todo_insert', user_id, text, priority)
+            return _serialize_row(rows[0]) if rows else None
+        except Exception as e:
+            print(f"Todo oluşturma hatası: {e}")
+            return None
+
+    def get_user_todos(self, user_id: str) -> List[Dict]:
+        """Kullanıcının todo'larını getir"""
+        try:
+            return [_serialize_row(row) for row in self._query('todos_by_user', user_id)]
+        except Exception as e:
+            print(f"Todo'ları getirme hatası: {e}")
+            return []
+
+    def iter_user_todos(self, user_id: str, batch_size: int = 1000) -> Iterator[Dict]:
+        """Kullanıcının todo'larını sunucu tarafı cursor ile parça parça getir"""
+        query = "SELECT * FROM todos WHERE user_id = %s ORDER BY created_at DESC"
+        for row in self._iter_rows(query, (user_id,), batch_size):
+            yield _serialize_row(row)
+
+    def update_todo(self, todo_id: str, owner_id: Optional[str] = None, **kwargs) -> bool:
+        """Todo güncelle (owner_id verilirse yalnızca o kullanıcının todo'su)"""
+        try:
+            return len(self._update_rows([todo_id], kwargs, owner_id)) > 0
+        except Exception as e:
+            print(f"Todo güncelleme hatası: {e}")
+            return False
+
+    def toggle_todo_complete(self, todo_id: str, owner_id: Optional[str] = None) -> bool:
+        """Todo tamamla/tamamlanmamış yap (tek atomik UPDATE)"""
+        try:
+            return len(self._query('todo_toggle', todo_id, owner_id)) > 0
+        except Exception as e:
+            print(f"Todo durum güncelleme hatası: {e}")
+            return False
+
+    def create_todos_bulk(self, user_id: str, todos: List[Dict], chunk_size: int = None) -> List[Optional[Dict]]:
+        """Todo'ları parça parça çok satırlı INSERT ile oluştur (giriş sırasıyla)"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = []
+
+        for chunk in chunked(todos, chunk_size):
+            rows = [{
+                'user_id': user_id,
+                'text': todo['text'],
+                'priority': todo.get('priority', 'orta'),
+                'completed': todo.get('completed', False)
+            } for todo in chunk]
+
+            try:
+                created = [_serialize_row(row) for row in self._insert_todo_rows(rows)]
+                results.extend(created + [None] * (len(chunk) - len(created)))
+            except Exception as e:
+                print(f"Toplu todo oluşturma hatası: {e}")
+                results.extend([None] * len(chunk))
+
+        return results
+
+    def update_todos_bulk(self, updates: Dict[str, Dict], chunk_size: int = None) -> Dict[str, bool]:
+        """Aynı değişikliği alan todo'ları gruplayıp id = ANY(...) ile toplu güncelle"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = {todo_id: False for todo_id in updates}
+
+        for patch, todo_ids in group_updates(updates):
+            for chunk in chunked(todo_ids, chunk_size):
+                try:
+                    for todo_id in self._update_rows(chunk, patch):
+                        results[todo_id] = True
+                except Exception as e:
+                    print(f"Toplu todo güncelleme hatası: {e}")
+
+        return results
+
+    def get_todos_by_priority(self, user_id: str, priority: str) -> List[Dict]:
+        """Önceliğe göre todo'ları getir"""
+        try:
+            return [_serialize_row(row) for row in self._query('todos_by_priority', user_id, priority)]
+        except Exception as e:
+            print(f"Öncelik bazlı todo getirme hatası: {e}")
+            return []
+
+    def get_todo_statistics(self, user_id: str) -> Dict:
+        """Kullanıcının todo istatistiklerini getir"""
+        try:
+            row = self._fetch_statistics_row(user_id)
+            total = row.get('total') or 0
+            completed = row.get('completed') or 0
+            return {
+                'total': total,
+                'completed': completed,
+                'pending': total - completed,
+                'completion_rate': round((completed / total * 100), 1) if total > 0 else 0,
+                'high_priority': row.get('high_priority') or 0,
+                'medium_priority': row.get('medium_priority') or 0,
+                'low_priority': row.get('low_priority') or 0
+            }
+        except Exception as e:
+            print(f"İstatistik hesaplama hatası: {e}")
+            return {
+                'total': 0,
+                'completed': 0,
+                'pending': 0,
+                'completion_rate': 0,
+                'high_priority': 0,
+                'medium_priority': 0,
+                'low_priority': 0
+            }
+
+
+class PostgresAdvancedDatabaseManager(_PostgresBackend):
+    """
+    AdvancedDatabaseManager arayüzünün doğrudan Postgres karşılığı
+
+    Satırlar advanced_models nesnelerine çevrilerek döner.
+    """
+
+    # Kullanıcı işlemleri
+    def create_user(self, username: str, email: str) -> Optional[User]:
+        """Yeni kullanıcı oluştur"""
+        try:
+            rows = self._query('user_insert_active', username, email)
+            return self._to_user(rows[0]) if rows else None
+        except Exception as e:
+            print(f"Kullanıcı oluşturma hatası: {e}")
+            return None
+
+    def get_user_by_username(self, username: str) -> Optional[User]:
+        """Kullanıcı adına göre kullanıcı getir"""
+        try:
+            rows = self._query('user_by_username', username)
+            return self._to_user(rows[0]) if rows else None
+        except Exception as e:
+            print(f"Kullanıcı getirme hatası: {e}")
+            return None
+
+    @staticmethod
+    def _to_user(row: Dict) -> User:
+        return User(
+            id=str(row['id']),
+            username=row['username'],
+            email=row['email'],
+            is_active=row['is_active'],
+            last_login=row.get('last_login'),
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+
+    # Kategori işlemleri
+    def create_category(self, user_id: str, name: str, color: str = '#007bff') -> Optional[Category]:
+        """Yeni kategori oluştur"""
+        try:
+            rows = self._query('category_insert', user_id, name, color)
+            return Category.from_dict(rows[0]) if rows else None
+        except Exception as e:
+            print(f"Kategori oluşturma hatası: {e}")
+            return None
+
+    def get_user_categories(self, user_id: str) -> List[Category]:
+        """Kullanıcının kategorilerini getir"""
+        try:
+            return [Category.from_dict(row) for row in self._query('categories_by_user', user_id)]
+        except Exception as e:
+            print(f"Kategoriler getirme hatası: {e}")
+            return []
+
+    # Todo işlemleri
+    def create_todo(self, user_id: str, text: str, **kwargs) -> Optional[Todo]:
+        """Yeni todo oluştur"""
+        try:
+            priority = kwargs.get('priority', 'orta')
+            status = kwargs.get('status', 'pending')
+            rows = self._query(
+                'todo_insert_full',
+                user_id,
+                text,
+                kwargs.get('description'),
+                priority.value if isinstance(priority, Priority) else priority,
+                status.value if isinstance(status, Status) else status,
+                kwargs.get('completed', False),
+                kwargs.get('due_date'),
+                kwargs.get('tags', []),
+                kwargs.get('category_id')
+            )
+            return Todo.from_dict(rows[0]) if rows else None
+        except Exception as e:
+            print(f"Todo oluşturma hatası: {e}")
+            return None
+
+    def get_user_todos(self, user_id: str) -> List[Todo]:
+        """Kullanıcının todo'larını getir"""
+        try:
+            return [Todo.from_dict(row) for row in self._query('todos_by_user', user_id)]
+        except Exception as e:
+            print(f"Todo'ları getirme hatası: {e}")
+            return []
+
+    def iter_user_todos(self, user_id: str, batch_size: int = 1000) -> Iterator[Todo]:
+        """Kullanıcının todo'larını sunucu tarafı cursor ile parça parça getir"""
+        query = "SELECT * FROM todos WHERE user_id = %s ORDER BY created_at DESC"
+        for row in self._iter_rows(query, (user_id,), batch_size):
+            yield Todo.from_dict(row)
+
+    def get_todos_by_priority(self, user_id: str, priority: str) -> List[Todo]:
+        """Önceliğe göre todo'ları getir"""
+        try:
+            return [Todo.from_dict(row) for row in self._query('todos_by_priority', user_id, priority)]
+        except Exception as e:
+            print(f"Öncelik bazlı todo getirme hatası: {e}")
+            return []
+
+    def get_todos_by_category(self, user_id: str, category_id: str) -> List[Todo]:
+        """Kategoriye göre todo'ları getir"""
+        try:
+            return [Todo.from_dict(row) for row in self._query('todos_by_category', user_id, category_id)]
+        except Exception as e:
+            print(f"Kategori bazlı todo getirme hatası: {e}")
+            return []
+
+    def update_todo(self, todo_id: str, owner_id: Optional[str] = None, **kwargs) -> bool:
+        """Todo güncelle (owner_id verilirse yalnızca o kullanıcının todo'su)"""
+        try:
+            # Enum değerlerini string'e çevir
+            if 'priority' in kwargs and isinstance(kwargs['priority'], Priority):
+                kwargs['priority'] = kwargs['priority'].value
+            if 'status' in kwargs and isinstance(kwargs['status'], Status):
+                kwargs['status'] = kwargs['status'].value
+
+            return len(self._update_rows([todo_id], kwargs, owner_id)) > 0
+        except Exception as e:
+            print(f"Todo güncelleme hatası: {e}")
+            return False
+
+    def toggle_todo_complete(self, todo_id: str, owner_id: Optional[str] = None) -> bool:
+        """Todo tamamla/tamamlanmamış yap (tek atomik UPDATE)"""
+        try:
+            return len(self._query('todo_toggle', todo_id, owner_id)) > 0
+        except Exception as e:
+            print(f"Todo durum güncelleme hatası: {e}")
+            return False
+
+    # Toplu işlemler
+    def create_todos_bulk(self, user_id: str, todos: List[Dict], chunk_size: int = None) -> List[Optional[Todo]]:
+        """Todo'ları parça parça çok satırlı INSERT ile oluştur (giriş sırasıyla)"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = []
+
+        for chunk in chunked(todos, chunk_size):
+            rows = []
+            for todo in chunk:
+                priority = todo.get('priority', 'orta')
+                status = todo.get('status', 'pending')
+                rows.append({
+                    'user_id': user_id,
+                    'text': todo['text'],
+                    'description': todo.get('description'),
+                    'priority': priority.value if isinstance(priority, Priority) else priority,
+                    'status': status.value if isinstance(status, Status) else status,
+                    'completed': todo.get('completed', False),
+                    'due_date': todo.get('due_date'),
+                    'tags': todo.get('tags', []),
+                    'category_id': todo.get('category_id')
+                })
+
+            try:
+                created = [Todo.from_dict(row) for row in self._insert_todo_rows(rows)]
+                results.extend(created + [None] * (len(chunk) - len(created)))
+            except Exception as e:
+                print(f"Toplu todo oluşturma hatası: {e}")
+                results.extend([None] * len(chunk))
+
+        return results
+
+    def update_todos_bulk(self, updates: Dict[str, Dict], chunk_size: int = None) -> Dict[str, bool]:
+        """Aynı değişikliği alan todo'ları gruplayıp id = ANY(...) ile toplu güncelle"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = {todo_id: False for todo_id in updates}
+
+        for patch, todo_ids in group_updates(updates):
+            for chunk in chunked(todo_ids, chunk_size):
+                try:
+                    for todo_id in self._update_rows(chunk, patch):
+                        results[todo_id] = True
+                except Exception as e:
+                    print(f"Toplu todo güncelleme hatası: {e}")
+
+        return results
+
+    def search_todos(self, user_id: str, query: str, limit: int = 20, offset: int = 0) -> List[Todo]:
+        """Todo'ları ara (text, description ve tags üzerinde, en alakalı önce)"""
+        if not query or not query.strip():
+            return []
+        try:
+            return [Todo.from_dict(row) for row in self._query('todos_search', user_id, query, limit, offset)]
+        except Exception as e:
+            print(f"Todo arama hatası: {e}")
+            return []
+
+    def fuzzy_search_todos(self, user_id: str, query: str, threshold: float = 0.3,
+                           limit: int = 20, offset: int = 0) -> List[Todo]:
+        """Yazım hatası toleranslı arama (pg_trgm, Türkçe karakter katlamalı)"""
+        if not query or not query.strip():
+            return []
+        try:
+            return [Todo.from_dict(row) for row in
+                    self._query('todos_fuzzy_search', user_id, query, threshold, limit, offset)]
+        except Exception as e:
+            print(f"Bulanık arama hatası: {e}")
+            return []
+
+    def get_overdue_todos(self, user_id: str) -> List[Todo]:
+        """Süresi geçmiş todo'ları getir"""
+        try:
+            return [Todo.from_dict(row) for row in self._query('todos_overdue', user_id)]
+        except Exception as e:
+            print(f"Süresi geçmiş todo getirme hatası: {e}")
+            return []
+
+    def get_todo_statistics(self, user_id: str) -> Dict:
+        """Gelişmiş istatistikler"""
+        try:
+            row = self._fetch_statistics_row(user_id)
+            total = row.get('total') or 0
+            completed = row.get('completed') or 0
+            return {
+                'total': total,
+                'completed': completed,
+                'pending': total - completed,
+                'overdue': row.get('overdue') or 0,
+                'completion_rate': round((completed / total * 100), 1) if total > 0 else 0,
+                'high_priority': row.get('high_priority') or 0,
+                'medium_priority': row.get('medium_priority') or 0,
+                'low_priority': row.get('low_priority') or 0,
+                'in_progress': row.get('in_progress') or 0,
+                'cancelled': row.get('cancelled') or 0
+            }
+        except Exception as e:
+            print(f"İstatistik hesaplama hatası: {e}")
+            return {
+                'total': 0,
+                'completed': 0,
+                'pending': 0,
+                'overdue': 0,
+                'completion_rate': 0,
+                'high_priority': 0,
+                'medium_priority': 0,
+                'low_priority': 0,
+                'in_progress': 0,
+                'cancelled': 0
+            }
+
+    def save_weather_record(self, user_id: str, city: str, weather_data: Dict) -> Optional[WeatherRecord]:
+        """Hava durumu kaydı oluştur"""
+        try:
+            rows = self._query(
+                'weather_insert',
+                user_id,
+                city,
+                weather_data.get('temperature'),
+                weather_data.get('description'),
+                weather_data.get('humidity'),
+                weather_data.get('icon')
+            )
+            if not rows:
+                return None
+            row = rows[0]
+            return WeatherRecord(
+                id=str(row['id']),
+                user_id=str(row['user_id']),
+                city=row['city'],
+                temperature=float(row['temperature']) if row['temperature'] is not None else None,
+                description=row['description'],
+                humidity=row['humidity'],
+                icon=row['icon'],
+                created_at=row['created_at']
+            )
+        except Exception as e:
+            print(f"Hava durumu kaydı oluşturma hatası: {e}")
+            return None
@@ -0,0 +1,66 @@
+"""
+İstek Kapsamlı Veri Bağlamı
+Tek bir sayfa isteğinde aynı satırların tekrar çekilmesini önler
+"""
+
+from flask import g, has_app_context
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class RequestDataContext:
+    """
+    İstek boyunca yapılan okumaları saklayan identity map
+
+    Okumalar (tablo, filtre) anahtarıyla saklanır; aynı istekte aynı okuma
+    ikinci kez veritabanına gitmez. Bir tabloya yazıldığında o tabloya ait
+    tüm okumalar (türetilmiş görünümler dahil) geçersiz kılınır.
+    """
+
+    def __init__(self):
+        """Boş bağlam oluştur"""
+        self._reads: Dict[Tuple[str, Tuple], Any] = {}
+
+    @staticmethod
+    def _key(table: str, filters: Dict) -> Tuple[str, Tuple]:
+        """Filtreleri sıralı ve hashlenebilir bir anahtara çevir"""
+        return table, tuple(sorted(filters.items()))
+
+    def fetch(self, table: str, loader: Callable[[], Any], **filters) -> Any:
+        """
+        Okumayı sakla veya saklanmış sonucu döndür
+
+        Args:
+            table (str): Tablo adı
+            loader (callable): Veri yoksa çağrılacak yükleyici
+            **filters: Okumanın filtreleri (anahtarın parçası)
+
+        Returns:
+            Yükleyicinin (ilk çağrıdaki) sonucu
+        """
+        key = self._key(table, filters)
+        if key not in self._reads:
+            self._reads[key] = loader()
+        return self._reads[key]
+
+    def peek(self, table: str, **filters) -> Optional[Any]:
+        """Okuma daha önce yapıldıysa sonucunu, yapılmadıysa None döndür"""
+        return self._reads.get(self._key(table, filters))
+
+    def invalidate(self, table: str):
+        """Tabloya ait tüm okumaları geçersiz kıl"""
+        for key in [key for key in self._reads if key[0] == table]:
+            del self._reads[key]
+
+
+def get_request_context() -> RequestDataContext:
+    """
+    Mevcut isteğin veri bağlamını getir (flask.g üzerinde)
+
+    Uygulama bağlamı dışında her çağrıda yeni, boş bir bağlam döner;
+    yani saklama yapılmaz.
+    """
+    if not has_app_context():
+        return RequestDataContext()
+    if 'data_context' not in g:
+        g.data_context = RequestDataContext()
+    return g.data_context
@@ -0,0 +1,268 @@
+"""
+Bulanık Arama İndeksi
+Türkçe karakter katlamalı trigram benzerliği (pg_trgm karşılığı)
+
+Kullanıcılar ı/i, ş/s, ğ/g gibi karakterleri sık karıştırır; metinler
+karşılaştırılmadan önce fold_turkish ile katlanır. Benzerlik pg_trgm'deki
+word_similarity gibi hesaplanır: sorgunun trigramlarından metnin ardışık
+kelimelerinde bulunanların oranı. TrigramIndex bellek içi ve SQLite
+yollarında tam tarama yerine trigram listelerinden aday üretir.
+
+InvertedIndex ise tam metin araması içindir: casefold edilmiş kelimelerden
+kayıt anahtarlarına giden listeler ve önek eşleşmesi için sıralı kelime listesi.
+"""
+
+import re
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from itertools import count
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+
+# Varsayılan benzerlik eşiği (pg_trgm.word_similarity_threshold varsayılanı 0.6; yazım
+# hatalarını yakalamak için daha düşük)
+DEFAULT_THRESHOLD = 0.3
+
+_FOLD_TABLE = str.maketrans('ıİIşŞğĞüÜöÖçÇâÂîÎûÛ', 'iiisSgGuUoOcCaAiIuU')
+
+
+def fold_turkish(text: Optional[str]) -> str:
+    """Türkçe karakterleri ASCII karşılıklarına katla ve küçük harfe çevir (SQL turkish_fold ile aynı)"""
+    return (text or '').translate(_FOLD_TABLE).lower()
+
+
+def _words(text: Optional[str]) -> List[str]:
+    return re.findall(r'\w+', fold_turkish(text))
+
+
+def _word_trigrams(word: str) -> FrozenSet[str]:
+    """Kelimenin trigramları (pg_trgm gibi başta iki, sonda bir boşlukla)"""
+    padded = f"  {word} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def trigrams(text: Optional[str]) -> FrozenSet[str]:
+    """Metindeki tüm kelimelerin trigram kümesi"""
+    result = set()
+    for word in _words(text):
+        result |= _word_trigrams(word)
+    return frozenset(result)
+
+
+def _best_window(query_trigrams: FrozenSet[str], word_sets: List[FrozenSet[str]], width: int) -> float:
+    """Sorgu trigramlarının, metnin ardışık `width` kelimesinde bulunan en yüksek oranı"""
+    if not query_trigrams or not word_sets:
+        return 0.0
+    best = 0
+    for start in range(max(1, len(word_sets) - width + 1)):
+        window = frozenset().union(*word_sets[start:start + width])
+        best = max(best, len(query_trigrams & window))
+    return best / len(query_trigrams)
+
+
+def word_similarity(query: str, text: str) -> float:
+    """
+    Sorgunun metne benzerliği (0-1)
+
+    Örnek:
+        word_similarity('alisveris', 'Market alışverişi')  # 0.9
+    """
+    query_words = _words(query)
+    return _best_window(trigrams(query), [_word_trigrams(word) for word in _words(text)], len(query_words) or 1)
+
+
+class TrigramIndex:
+    """
+    Trigram -> anahtar listeleri tutan bellek içi indeks
+
+    Arama yalnızca sorguyla yeterli sayıda trigram paylaşan kayıtları
+    puanlar; paylaşılan trigram oranı eşiğin altındaki kayıtlar benzerlik
+    hesaplanmadan elenir.
+
+    Örnek:
+        index = TrigramIndex()
+        index.add(todo['id'], todo['text'], todo)
+        [index.get(key) for key, score in index.search('alisveris')]
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, set] = defaultdict(set)
+        self._docs: Dict[Hashable, Tuple[List[FrozenSet[str]], Any, int]] = {}
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._docs
+
+    def add(self, key: Hashable, text: str, value: Any = None):
+        """Kaydı ekle (varsa metnini güncelle)"""
+        if key in self._docs:
+            self.remove(key)
+        word_sets = [_word_trigrams(word) for word in _words(text)]
+        self._docs[key] = (word_sets, value, next(self._sequence))
+        for trigram in frozenset().union(*word_sets):
+            self._postings[trigram].add(key)
+
+    def remove(self, key: Hashable) -> bool:
+        """Kaydı çıkar"""
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return False
+        for trigram in frozenset().union(*doc[0]):
+            keys = self._postings.get(trigram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[trigram]
+        return True
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Kayıtla birlikte saklanan değer"""
+        doc = self._docs.get(key)
+        return doc[1] if doc is not None else default
+
+    def clear(self):
+        self._postings.clear()
+        self._docs.clear()
+
+    def search(self, query: str, threshold: float = DEFAULT_THRESHOLD,
+               limit: Optional[int] = None, offset: int = 0) -> List[Tuple[Hashable, float]]:
+        """
+        Benzer kayıtları bul
+
+        Returns:
+            list: (anahtar, benzerlik) listesi; en benzer önce, eşitlikte en son eklenen önce
+        """
+        query_trigrams = trigrams(query)
+        if not query_trigrams:
+            return []
+        width = len(_words(query)) or 1
+
+        shared = Counter()
+        for trigram in query_trigrams:
+            for key in self._postings.get(trigram, ()):
+                shared[key] += 1
+
+        matches = []
+        for key, shared_count in shared.items():
+            # Paylaşılan trigram oranı benzerliğin üst sınırıdır
+            if shared_count / len(query_trigrams) < threshold:
+                continue
+            word_sets, _, sequence = self._docs[key]
+            score = _best_window(query_trigrams, word_sets, width)
+            if score >= threshold:
+                matches.append((score, sequence, key))
+
+        matches.sort(reverse=True)
+        matches = matches[offset:offset + limit] if limit is not None else matches[offset:]
+        return [(key, score) for score, _, key in matches]
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Metni casefold edilmiş kelimelere böl ('İ'nin bıraktığı birleşik noktayı atarak)"""
+    return re.findall(r'\w+', (text or '').casefold().replace('\u0307', ''))
+
+
+class InvertedIndex:
+    """
+    Kelime -> anahtar listeleri tutan artımlı tam metin indeksi
+
+    Sorgudaki her kelime, indeksteki bir kelimenin öneki olmalıdır. Önekle
+    başlayan kelimeler sıralı listede bisect ile bulunduğundan arama süresi
+    kayıt sayısıyla değil eşleşme sayısıyla orantılıdır.
+
+    Örnek:
+        index = InvertedIndex()
+        index.add(todo.id, [todo.text, todo.description, *todo.tags], todo)
+        [index.get(key) for key in index.search('mark süt')]
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._tokens: List[str] = []
+        self._docs: Dict[Hashable, Tuple[FrozenSet[str], Any, int]] = {}
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._docs
+
+    def add(self, key: Hashable, texts: Iterable[Optional[str]], value: Any = None):
+        """Kaydı ekle; varsa kelimeleri güncellenir, ekleme sırası korunur"""
+        tokens = frozenset(token for text in texts for token in tokenize(text))
+        old = self._docs.get(key)
+        if old is not None:
+            sequence = old[2]
+            self._unlink(key, old[0] - tokens)
+            new_tokens = tokens - old[0]
+        else:
+            sequence = next(self._sequence)
+            new_tokens = tokens
+        self._docs[key] = (tokens, value, sequence)
+        for token in new_tokens:
+            keys = self._postings.get(token)
+            if keys is None:
+                keys = self._postings[token] = set()
+                insort(self._tokens, token)
+            keys.add(key)
+
+    def remove(self, key: Hashable) -> bool:
+        """Kaydı çıkar"""
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return False
+        self._unlink(key, doc[0])
+        return True
+
+    def _unlink(self, key: Hashable, tokens: Iterable[str]):
+        for token in tokens:
+            keys = self._postings.get(token)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._postings[token]
+                del self._tokens[bisect_left(self._tokens, token)]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Kayıtla birlikte saklanan değer"""
+        doc = self._docs.get(key)
+        return doc[1] if doc is not None else default
+
+    def clear(self):
+        self._postings.clear()
+        self._tokens.clear()
+        self._docs.clear()
+
+    def _prefix_keys(self, prefix: str) -> Set[Hashable]:
+        """Öneki taşıyan tüm kelimelerin anahtarları"""
+        keys: Set[Hashable] = set()
+        position = bisect_left(self._tokens, prefix)
+        while position < len(self._tokens) and self._tokens[position].startswith(prefix):
+            keys |= self._postings[self._tokens[position]]
+            position += 1
+        return keys
+
+    def search(self, query: str, limit: Optional[int] = None, offset: int = 0) -> List[Hashable]:
+        """
+        Sorgudaki tüm kelimelerle eşleşen kayıtları bul
+
+        Returns:
+            list: Anahtarlar, ekleme sırasıyla
+        """
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return []
+
+        matches = None
+        for term in terms:
+            keys = self._prefix_keys(term)
+            matches = keys if matches is None else matches & keys
+            if not matches:
+                return []
+
+        ordered = sorted(matches, key=lambda key: self._docs[key][2])
+        return ordered[offset:offset + limit] if limit is not None else ordered[offset:]
@@ -0,0 +1,841 @@
+"""
+SQLite Veritabanı Yönetimi
+Supabase yerine yerel, kalıcı ve tek düğümlü depolama
+
+DatabaseManager ve AdvancedDatabaseManager ile aynı arayüzü sunar;
+DATABASE_BACKEND=sqlite ile seçilir ve SQLITE_PATH dosyasını kullanır.
+WAL modunda çalışır (okuyucular yazıcıyı beklemez), her thread kendi
+bağlantısını kullanır, arama FTS5 tam metin indeksi ile yapılır.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional
+
+from advanced_models import User, Category, Todo, WeatherRecord, Priority, Status, _parse_datetime
+from search_index import fold_turkish, word_similarity
+from utils import chunked, group_updates
+
+# Üretim şemasının SQLite karşılığı (UUID/TIMESTAMPTZ -> TEXT, TEXT[] -> JSON metin)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    username TEXT UNIQUE NOT NULL,
+    email TEXT,
+    is_active INTEGER DEFAULT 1,
+    last_login TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS categories (
+    id TEXT PRIMARY KEY,
+    user_id TEXT REFERENCES users(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    color TEXT DEFAULT '#007bff',
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS todos (
+    id TEXT PRIMARY KEY,
+    user_id TEXT REFERENCES users(id) ON DELETE CASCADE,
+    category_id TEXT REFERENCES categories(id) ON DELETE SET NULL,
+    text TEXT NOT NULL,
+    description TEXT,
+    priority TEXT DEFAULT 'orta',
+    status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'in_progress', 'completed', 'cancelled')),
+    completed INTEGER DEFAULT 0,
+    due_date TEXT,
+    tags TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS weather_history (
+    id TEXT PRIMARY KEY,
+    user_id TEXT REFERENCES users(id) ON DELETE CASCADE,
+    city TEXT NOT NULL,
+    temperature REAL,
+    description TEXT,
+    humidity INTEGER,
+    icon TEXT,
+    created_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_todos_status ON todos(status);
+CREATE INDEX IF NOT EXISTS idx_todos_due_date ON todos(due_date);
+CREATE INDEX IF NOT EXISTS idx_categories_user_id ON categories(user_id);
+CREATE INDEX IF NOT EXISTS idx_weather_user_city ON weather_history(user_id, city);
+CREATE INDEX IF NOT EXISTS idx_todos_user_created ON todos(user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_todos_user_priority_created ON todos(user_id, priority, created_at);
+CREATE INDEX IF NOT EXISTS idx_todos_user_category ON todos(user_id, category_id);
+CREATE INDEX IF NOT EXISTS idx_todos_user_due_open ON todos(user_id, due_date) WHERE completed = 0;
+"""
+
+# Todo'ların tam metin indeksi (todos tablosunu içerik olarak kullanır)
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS todos_fts USING fts5(
+    text, description, tags,
+    content='todos', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS todos_fts_insert AFTER INSERT ON todos BEGIN
+    INSERT INTO todos_fts(rowid, text, description, tags)
+    VALUES (new.rowid, new.text, new.description, new.tags);
+END;
+
+CREATE TRIGGER IF NOT EXISTS todos_fts_delete AFTER DELETE ON todos BEGIN
+    INSERT INTO todos_fts(todos_fts, rowid, text, description, tags)
+    VALUES ('delete', old.rowid, old.text, old.description, old.tags);
+END;
+
+CREATE TRIGGER IF NOT EXISTS todos_fts_update AFTER UPDATE OF text, description, tags ON todos BEGIN
+    INSERT INTO todos_fts(todos_fts, rowid, text, description, tags)
+    VALUES ('delete', old.rowid, old.text, old.description, old.tags);
+    INSERT INTO todos_fts(rowid, text, description, tags)
+    VALUES (new.rowid, new.text, new.description, new.tags);
+END;
+"""
+
+# Bulanık arama için katlanmış todo metninin trigram indeksi (içeriksiz FTS5,
+# turkish_fold her bağlantıda Python fonksiyonu olarak tanımlanır)
+TRIGRAM_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS todos_trgm USING fts5(
+    folded, content='', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS todos_trgm_insert AFTER INSERT ON todos BEGIN
+    INSERT INTO todos_trgm(rowid, folded) VALUES (new.rowid, turkish_fold(new.text));
+END;
+
+CREATE TRIGGER IF NOT EXISTS todos_trgm_delete AFTER DELETE ON todos BEGIN
+    INSERT INTO todos_trgm(todos_trgm, rowid, folded) VALUES ('delete', old.rowid, turkish_fold(old.text));
+END;
+
+CREATE TRIGGER IF NOT EXISTS todos_trgm_update AFTER UPDATE OF text ON todos BEGIN
+    INSERT INTO todos_trgm(todos_trgm, rowid, folded) VALUES ('delete', old.rowid, turkish_fold(old.text));
+    INSERT INTO todos_trgm(rowid, folded) VALUES (new.rowid, turkish_fold(new.text));
+END;
+"""
+
+# update_todo ile değiştirilebilecek sütunlar
+TODO_COLUMNS = {'category_id', 'text', 'description', 'priority', 'status', 'completed', 'due_date', 'tags'}
+
+STATISTICS_QUERY = """
+SELECT
+    COUNT(*) AS total,
+    COALESCE(SUM(completed = 1), 0) AS completed,
+    COALESCE(SUM(completed = 0), 0) AS pending,
+    COALESCE(SUM(completed = 0 AND due_date IS NOT NULL AND due_date < ?), 0) AS overdue,
+    COALESCE(SUM(priority = 'yüksek'), 0) AS high_priority,
+    COALESCE(SUM(priority = 'orta'), 0) AS medium_priority,
+    COALESCE(SUM(priority = 'düşük'), 0) AS low_priority,
+    COALESCE(SUM(status = 'in_progress'), 0) AS in_progress,
+    COALESCE(SUM(status = 'cancelled'), 0) AS cancelled
+FROM todos
+WHERE user_id = ?
+"""
+
+
+def _now() -> str:
+    """Şu anki zaman (UTC, ISO metin)"""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _to_timestamp(value) -> Optional[str]:
+    """datetime veya ISO metni UTC ISO metne çevir (metin sıralaması = zaman sıralaması)"""
+    value = _parse_datetime(value)
+    if value is None:
+        return None
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _to_column(column: str, value):
+    """Python değerini SQLite sütun değerine çevir"""
+    if isinstance(value, (Priority, Status)):
+        return value.value
+    if column == 'completed':
+        return int(bool(value))
+    if column == 'due_date':
+        return _to_timestamp(value)
+    if column == 'tags':
+        return json.dumps(list(value or []), ensure_ascii=False)
+    return value
+
+
+def _row_to_dict(row: sqlite3.Row) -> Dict:
+    """Satırı Supabase'in döndürdüğü JSON biçimine çevir"""
+    data = dict(row)
+    if 'completed' in data:
+        data['completed'] = bool(data['completed'])
+    if 'is_active' in data:
+        data['is_active'] = bool(data['is_active'])
+    if 'tags' in data:
+        data['tags'] = json.loads(data['tags']) if data['tags'] else []
+    return data
+
+
+def _trigram_expression(query: str) -> Optional[str]:
+    """Katlanmış sorgunun trigramlarını FTS5 OR ifadesine çevir (3 harften kısa sorguda None)"""
+    grams = {word[i:i + 3] for word in fold_turkish(query).split() for i in range(len(word) - 2)}
+    if not grams:
+        return None
+    return ' OR '.join('"{}"'.format(gram.replace('"', '""')) for gram in sorted(grams))
+
+
+def _match_expression(query: str) -> str:
+    """Arama metnini FTS5 ifadesine çevir (her kelime önek olarak, hepsi zorunlu)"""
+    return ' '.join('"{}"*'.format(token.replace('"', '""')) for token in query.split())
+
+
+class _SQLiteBackend:
+    """
+    Thread başına bağlantı ve sorgu yardımcıları
+
+    İki yönetici sınıfın ortak altyapısı.
+    """
+
+    def __init__(self, path: str = None):
+        """Veritabanı dosyasını aç ve şemayı oluştur"""
+        self.path = path or os.getenv('SQLITE_PATH', 'todo.db')
+        self._uri = False
+        if self.path == ':memory:':
+            # Bellek içi veritabanını thread bağlantıları arasında paylaş
+            self.path = f"file:todo-{uuid.uuid4().hex}?mode=memory&cache=shared"
+            self._uri = True
+
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+        # Toplu işlemlerde tek sorguda kullanılacak satır sayısı
+        self.bulk_chunk_size = int(os.getenv('DB_BULK_CHUNK_SIZE', '500'))
+
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+        try:
+            conn.executescript(FTS_SCHEMA)
+            self.fts_enabled = True
+        except sqlite3.OperationalError:
+            # FTS5 olmadan derlenmiş SQLite: arama LIKE ile yapılır
+            self.fts_enabled = False
+        try:
+            created = not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'todos_trgm'").fetchone()
+            conn.executescript(TRIGRAM_SCHEMA)
+            if created:
+                # Tablo sonradan eklendiyse mevcut todo'ları indeksle
+                conn.execute("INSERT INTO todos_trgm(rowid, folded) SELECT rowid, turkish_fold(text) FROM todos")
+            self.trigram_enabled = True
+        except sqlite3.OperationalError:
+            # trigram tokenizer yok (SQLite < 3.34): bulanık arama kullanıcının todo'larını tarar
+            self.trigram_enabled = False
+
+    def _connection(self) -> sqlite3.Connection:
+        """Bu thread'in bağlantısını getir (ilk kullanımda açılır)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, uri=self._uri, isolation_level=None,
+                                   check_same_thread=False, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.create_function('turkish_fold', 1, fold_turkish, deterministic=True)
+            if not self._uri:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Yazma işlemi (BEGIN IMMEDIATE ... COMMIT/ROLLBACK)"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _query(self, query: str, params: tuple = ()) -> List[Dict]:
+        """Okuma sorgusunu çalıştır ve tüm satırları döndür"""
+        return [_row_to_dict(row) for row in self._connection().execute(query, params)]
+
+    def _iter_rows(self, query: str, params: tuple, batch_size: int) -> Iterator[Dict]:
+        """Satırları parça parça oku"""
+        cursor = self._connection().execute(query, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield _row_to_dict(row)
+        finally:
+            cursor.close()
+
+    def _select_by_ids(self, conn: sqlite3.Connection, table: str, ids: List[str]) -> Dict[str, Dict]:
+        """ID listesine göre satırları getir: id -> satır"""
+        placeholders = ', '.join('?' * len(ids))
+        rows = conn.execute(f"SELECT * FROM {table} WHERE id IN ({placeholders})", ids)
+        return {row['id']: _row_to_dict(row) for row in rows}
+
+    def _insert(self, table: str, row: Dict) -> Dict:
+        """Tek satır ekle ve eklenen satırı döndür"""
+        row = {'id': str(uuid.uuid4()), **row}
+        columns = ', '.join(row)
+        with self._transaction() as conn:
+            conn.execute(
+                f"INSERT INTO {table} ({columns}) VALUES ({', '.join('?' * len(row))})",
+                tuple(row.values())
+            )
+            return self._select_by_ids(conn, table, [row['id']])[row['id']]
+
+    def _insert_todo_rows(self, rows: List[Dict]) -> List[Dict]:
+        """Todo'ları tek işlemde ekle, eklenen satırları giriş sırasıyla döndür"""
+        now = _now()
+        rows = [{
+            'id': str(uuid.uuid4()),
+            **{column: _to_column(column, value) for column, value in row.items()},
+            'created_at': now,
+            'updated_at': now
+        } for row in rows]
+        columns = list(rows[0].keys())
+
+        with self._transaction() as conn:
+            conn.executemany(
+                f"INSERT INTO todos ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                [tuple(row[c] for c in columns) for row in rows]
+            )
+            created = self._select_by_ids(conn, 'todos', [row['id'] for row in rows])
+        return [created[row['id']] for row in rows]
+
+    def _update_rows(self, todo_ids: List[str], fields: Dict, owner_id: Optional[str] = None) -> List[str]:
+        """Verilen todo'lara aynı alan değişikliklerini uygula, güncellenen ID'leri döndür"""
+        if not fields or not todo_ids:
+            return []
+
+        unknown = set(fields) - TODO_COLUMNS
+        if unknown:
+            raise ValueError(f"Bilinmeyen todo alanları: {', '.join(sorted(unknown))}")
+
+        values = {column: _to_column(column, value) for column, value in fields.items()}
+        values['updated_at'] = _now()
+        assignments = ', '.join(f"{column} = ?" for column in values)
+        where = f"id IN ({', '.join('?' * len(todo_ids))})"
+        params = list(todo_ids)
+        if owner_id is not None:
+            where += " AND user_id = ?"
+            params.append(owner_id)
+
+        with self._transaction() as conn:
+            updated = [row['id'] for row in conn.execute(f"SELECT id FROM todos WHERE {where}", params)]
+            if updated:
+                conn.execute(f"UPDATE todos SET {assignments} WHERE {where}", list(values.values()) + params)
+        return updated
+
+    def _fetch_statistics_row(self, user_id: str) -> Dict:
+        """Tek aggregate sorgu ile istatistik satırı"""
+        row = self._connection().execute(STATISTICS_QUERY, (_now(), user_id)).fetchone()
+        return dict(row) if row else {}
+
+    def _toggle(self, todo_id: str, owner_id: Optional[str]) -> bool:
+        """Tamamlanma durumunu tek UPDATE ile tersine çevir"""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE todos SET completed = 1 - completed, "
+                "status = CASE WHEN completed = 1 THEN 'pending' ELSE 'completed' END, "
+                "updated_at = ? WHERE id = ? AND (? IS NULL OR user_id = ?)",
+                (_now(), todo_id, owner_id, owner_id)
+            )
+            return cursor.rowcount > 0
+
+    def _find_user(self, username: str) -> Optional[Dict]:
+        rows = self._query("SELECT * FROM users WHERE username = ?", (username,))
+        return rows[0] if rows else None
+
+    def _insert_user(self, username: str, email: str) -> Dict:
+        now = _now()
+        return self._insert('users', {
+            'username': username,
+            'email': email,
+            'is_active': 1,
+            'created_at': now,
+            'updated_at': now
+        })
+
+    def delete_todo(self, todo_id: str, owner_id: Optional[str] = None) -> bool:
+        """Todo sil (owner_id verilirse yalnızca o kullanıcının todo'su)"""
+        try:
+            with self._transaction() as conn:
+                cursor = conn.execute(
+                    "DELETE FROM todos WHERE id = ? AND (? IS NULL OR user_id = ?)",
+                    (todo_id, owner_id, owner_id)
+                )
+                return cursor.rowcount > 0
+        except Exception as e:
+            print(f"Todo silme hatası: {e}")
+            return False
+
+    def delete_todos_bulk(self, todo_ids: List[str], chunk_size: int = None) -> Dict[str, bool]:
+        """Todo'ları parça parça id IN (...) ile toplu sil"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = {todo_id: False for todo_id in todo_ids}
+
+        for chunk in chunked(list(todo_ids), chunk_size):
+            try:
+                placeholders = ', '.join('?' * len(chunk))
+                with self._transaction() as conn:
+                    existing = [row['id'] for row in conn.execute(
+                        f"SELECT id FROM todos WHERE id IN ({placeholders})", chunk)]
+                    conn.execute(f"DELETE FROM todos WHERE id IN ({placeholders})", chunk)
+                for todo_id in existing:
+                    results[todo_id] = True
+            except Exception as e:
+                print(f"Toplu todo silme hatası: {e}")
+
+        return results
+
+    def close(self):
+        """Açılan tüm bağlantıları kapat"""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class SQLiteDatabaseManager(_SQLiteBackend):
+    """
+    DatabaseManager arayüzünün SQLite karşılığı
+
+    Satırlar DatabaseManager'daki gibi sözlük olarak döner
+    (tarih alanları ISO metin).
+    """
+
+    def create_user(self, username: str, email: str) -> Dict:
+        """Yeni kullanıcı oluştur"""
+        try:
+            return self._insert_user(username, email)
+        except Exception as e:
+            print(f"Kullanıcı oluşturma hatası: {e}")
+            return None
+
+    def get_user_by_username(self, username: str) -> Optional[Dict]:
+        """Kullanıcı adına göre kullanıcı getir"""
+        try:
+            return self._find_user(username)
+        except Exception as e:
+            print(f"Kullanıcı getirme hatası: {e}")
+            return None
+
+    def create_todo(self, user_id: str, text: str, priority: str = 'orta') -> Dict:
+        """Yeni todo oluştur"""
+        try:
+            return self._insert_todo_rows([{
+                'user_id': user_id,
+                'text': text,
+                'priority': priority,
+                'completed': False
+            }])[0]
+        except Exception as e:
+            print(f"Todo oluşturma hatası: {e}")
+            return None
+
+    def get_user_todos(self, user_id: str) -> List[Dict]:
+        """Kullanıcının todo'larını getir"""
+        try:
+            return self._query("SELECT * FROM todos WHERE user_id = ? ORDER BY created_at DESC", (user_id,))
+        except Exception as e:
+            print(f"Todo'ları getirme hatası: {e}")
+            return []
+
+    def iter_user_todos(self, user_id: str, batch_size: int = 1000) -> Iterator[Dict]:
+        """Kullanıcının todo'larını parça parça getir"""
+        query = "SELECT * FROM todos WHERE user_id = ? ORDER BY created_at DESC"
+        yield from self._iter_rows(query, (user_id,), batch_size)
+
+    def update_todo(self, todo_id: str, owner_id: Optional[str] = None, **kwargs) -> bool:
+        """Todo güncelle (owner_id verilirse yalnızca o kullanıcının todo'su)"""
+        try:
+            return len(self._update_rows([todo_id], kwargs, owner_id)) > 0
+        except Exception as e:
+            print(f"Todo güncelleme hatası: {e}")
+            return False
+
+    def toggle_todo_complete(self, todo_id: str, owner_id: Optional[str] = None) -> bool:
+        """Todo tamamla/tamamlanmamış yap (tek atomik UPDATE)"""
+        try:
+            return self._toggle(todo_id, owner_id)
+        except Exception as e:
+            print(f"Todo durum güncelleme hatası: {e}")
+            return False
+
+    def create_todos_bulk(self, user_id: str, todos: List[Dict], chunk_size: int = None) -> List[Optional[Dict]]:
+        """Todo'ları parça parça tek işlemde oluştur (giriş sırasıyla)"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = []
+
+        for chunk in chunked(todos, chunk_size):
+            rows = [{
+                'user_id': user_id,
+                'text': todo['text'],
+                'priority': todo.get('priority', 'orta'),
+                'completed': todo.get('completed', False)
+            } for todo in chunk]
+
+            try:
+                results.extend(self._insert_todo_rows(rows))
+            except Exception as e:
+                print(f"Toplu todo oluşturma hatası: {e}")
+                results.extend([None] * len(chunk))
+
+        return results
+
+    def update_todos_bulk(self, updates: Dict[str, Dict], chunk_size: int = None) -> Dict[str, bool]:
+        """Aynı değişikliği alan todo'ları gruplayıp id IN (...) ile toplu güncelle"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = {todo_id: False for todo_id in updates}
+
+        for patch, todo_ids in group_updates(updates):
+            for chunk in chunked(todo_ids, chunk_size):
+                try:
+                    for todo_id in self._update_rows(chunk, patch):
+                        results[todo_id] = True
+                except Exception as e:
+                    print(f"Toplu todo güncelleme hatası: {e}")
+
+        return results
+
+    def get_todos_by_priority(self, user_id: str, priority: str) -> List[Dict]:
+        """Önceliğe göre todo'ları getir"""
+        try:
+            return self._query(
+                "SELECT * FROM todos WHERE user_id = ? AND priority = ? ORDER BY created_at DESC",
+                (user_id, priority)
+            )
+        except Exception as e:
+            print(f"Öncelik bazlı todo getirme hatası: {e}")
+            return []
+
+    def get_todo_statistics(self, user_id: str) -> Dict:
+        """Kullanıcının todo istatistiklerini getir"""
+        try:
+            row = self._fetch_statistics_row(user_id)
+            total = row.get('total') or 0
+            completed = row.get('completed') or 0
+            return {
+                'total': total,
+                'completed': completed,
+                'pending': total - completed,
+                'completion_rate': round((completed / total * 100), 1) if total > 0 else 0,
+                'high_priority': row.get('high_priority') or 0,
+                'medium_priority': row.get('medium_priority') or 0,
+                'low_priority': row.get('low_priority') or 0
+            }
+        except Exception as e:
+            print(f"İstatistik hesaplama hatası: {e}")
+            return {
+                'total': 0,
+                'completed': 0,
+                'pending': 0,
+                'completion_rate': 0,
+                'high_priority': 0,
+                'medium_priority': 0,
+                'low_priority': 0
+            }
+
+
+class SQLiteAdvancedDatabaseManager(_SQLiteBackend):
+    """
+    AdvancedDatabaseManager arayüzünün SQLite karşılığı
+
+    Satırlar advanced_models nesnelerine çevrilerek döner.
+    """
+
+    # Kullanıcı işlemleri
+    def create_user(self, username: str, email: str) -> Optional[User]:
+        """Yeni kullanıcı oluştur"""
+        try:
+            return self._to_user(self._insert_user(username, email))
+        except Exception as e:
+            print(f"Kullanıcı oluşturma hatası: {e}")
+            return None
+
+    def get_user_by_username(self, username: str) -> Optional[User]:
+        """Kullanıcı adına göre kullanıcı getir"""
+        try:
+            row = self._find_user(username)
+            return self._to_user(row) if row else None
+        except Exception as e:
+            print(f"Kullanıcı getirme hatası: {e}")
+            return None
+
+    @staticmethod
+    def _to_user(row: Dict) -> User:
+        return User(
+            id=row['id'],
+            username=row['username'],
+            email=row['email'],
+            is_active=row['is_active'],
+            last_login=_parse_datetime(row.get('last_login')),
+            created_at=_parse_datetime(row['created_at']),
+            updated_at=_parse_datetime(row['updated_at'])
+        )
+
+    # Kategori işlemleri
+    def create_category(self, user_id: str, name: str, color: str = '#007bff') -> Optional[Category]:
+        """Yeni kategori oluştur"""
+        try:
+            return Category.from_dict(self._insert('categories', {
+                'user_id': user_id,
+                'name': name,
+                'color': color,
+                'created_at': _now()
+            }))
+        except Exception as e:
+            print(f"Kategori oluşturma hatası: {e}")
+            return None
+
+    def get_user_categories(self, user_id: str) -> List[Category]:
+        """Kullanıcının kategorilerini getir"""
+        try:
+            return [Category.from_dict(row) for row in self._query(
+                "SELECT * FROM categories WHERE user_id = ?", (user_id,))]
+        except Exception as e:
+            print(f"Kategoriler getirme hatası: {e}")
+            return []
+
+    # Todo işlemleri
+    def create_todo(self, user_id: str, text: str, **kwargs) -> Optional[Todo]:
+        """Yeni todo oluştur"""
+        try:
+            return Todo.from_dict(self._insert_todo_rows([self._todo_row(user_id, text, kwargs)])[0])
+        except Exception as e:
+            print(f"Todo oluşturma hatası: {e}")
+            return None
+
+    @staticmethod
+    def _todo_row(user_id: str, text: str, fields: Dict) -> Dict:
+        return {
+            'user_id': user_id,
+            'text': text,
+            'description': fields.get('description'),
+            'priority': fields.get('priority', 'orta'),
+            'status': fields.get('status', 'pending'),
+            'completed': fields.get('completed', False),
+            'due_date': fields.get('due_date'),
+            'tags': fields.get('tags', []),
+            'category_id': fields.get('category_id')
+        }
+
+    def get_user_todos(self, user_id: str) -> List[Todo]:
+        """Kullanıcının todo'larını getir"""
+        try:
+            return [Todo.from_dict(row) for row in self._query(
+                "SELECT * FROM todos WHERE user_id = ? ORDER BY created_at DESC", (user_id,))]
+        except Exception as e:
+            print(f"Todo'ları getirme hatası: {e}")
+            return []
+
+    def iter_user_todos(self, user_id: str, batch_size: int = 1000) -> Iterator[Todo]:
+        """Kullanıcının todo'larını parça parça getir"""
+        query = "SELECT * FROM todos WHERE user_id = ? ORDER BY created_at DESC"
+        for row in self._iter_rows(query, (user_id,), batch_size):
+            yield Todo.from_dict(row)
+
+    def get_todos_by_priority(self, user_id: str, priority: str) -> List[Todo]:
+        """Önceliğe göre todo'ları getir"""
+        try:
+            return [Todo.from_dict(row) for row in self._query(
+                "SELECT * FROM todos WHERE user_id = ? AND priority = ? ORDER BY created_at DESC",
+                (user_id, _to_column('priority', priority)))]
+        except Exception as e:
+            print(f"Öncelik bazlı todo getirme hatası: {e}")
+            return []
+
+    def get_todos_by_category(self, user_id: str, category_id: str) -> List[Todo]:
+        """Kategoriye göre todo'ları getir"""
+        try:
+            return [Todo.from_dict(row) for row in self._query(
+                "SELECT * FROM todos WHERE user_id = ? AND category_id = ? ORDER BY created_at DESC",
+                (user_id, category_id))]
+        except Exception as e:
+            print(f"Kategori bazlı todo getirme hatası: {e}")
+            return []
+
+    def update_todo(self, todo_id: str, owner_id: Optional[str] = None, **kwargs) -> bool:
+        """Todo güncelle (owner_id verilirse yalnızca o kullanıcının todo'su)"""
+        try:
+            return len(self._update_rows([todo_id], kwargs, owner_id)) > 0
+        except Exception as e:
+            print(f"Todo güncelleme hatası: {e}")
+            return False
+
+    def toggle_todo_complete(self, todo_id: str, owner_id: Optional[str] = None) -> bool:
+        """Todo tamamla/tamamlanmamış yap (tek atomik UPDATE)"""
+        try:
+            return self._toggle(todo_id, owner_id)
+        except Exception as e:
+            print(f"Todo durum güncelleme hatası: {e}")
+            return False
+
+    # Toplu işlemler
+    def create_todos_bulk(self, user_id: str, todos: List[Dict], chunk_size: int = None) -> List[Optional[Todo]]:
+        """Todo'ları parça parça tek işlemde oluştur (giriş sırasıyla)"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = []
+
+        for chunk in chunked(todos, chunk_size):
+            rows = [self._todo_row(user_id, todo['text'], todo) for todo in chunk]
+            try:
+                results.extend(Todo.from_dict(row) for row in self._insert_todo_rows(rows))
+            except Exception as e:
+                print(f"Toplu todo oluşturma hatası: {e}")
+                results.extend([None] * len(chunk))
+
+        return results
+
+    def update_todos_bulk(self, updates: Dict[str, Dict], chunk_size: int = None) -> Dict[str, bool]:
+        """Aynı değişikliği alan todo'ları gruplayıp id IN (...) ile toplu güncelle"""
+        chunk_size = chunk_size or self.bulk_chunk_size
+        results = {todo_id: False for todo_id in updates}
+
+        for patch, todo_ids in group_updates(updates):
+            for chunk in chunked(todo_ids, chunk_size):
+                try:
+                    for todo_id in self._update_rows(chunk, patch):
+                        results[todo_id] = True
+                except Exception as e:
+                    print(f"Toplu todo güncelleme hatası: {e}")
+
+        return results
+
+    def search_todos(self, user_id: str, query: str, limit: int = 20, offset: int = 0) -> List[Todo]:
+        """Todo'ları ara (FTS5; text, description ve tags üzerinde, en alakalı önce)"""
+        if not query or not query.strip():
+            return []
+        try:
+            if self.fts_enabled:
+                # bm25 ağırlıkları üretimdeki A/B/C sırasına karşılık gelir
+                rows = self._query(
+                    "SELECT todos.* FROM todos_fts JOIN todos ON todos.rowid = todos_fts.rowid "
+                    "WHERE todos_fts MATCH ? AND todos.user_id = ? "
+                    "ORDER BY bm25(todos_fts, 10.0, 4.0, 1.0), todos.created_at DESC LIMIT ? OFFSET ?",
+                    (_match_expression(query), user_id, limit, offset)
+                )
+            else:
+                pattern = f"%{query}%"
+                rows = self._query(
+                    "SELECT * FROM todos WHERE user_id = ? AND (text LIKE ? OR description LIKE ? OR tags LIKE ?) "
+                    "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                    (user_id, pattern, pattern, pattern, limit, offset)
+                )
+            return [Todo.from_dict(row) for row in rows]
+        except Exception as e:
+            print(f"Todo arama hatası: {e}")
+            return []
+
+    def fuzzy_search_todos(self, user_id: str, query: str, threshold: float = 0.3,
+                           limit: int = 20, offset: int = 0) -> List[Todo]:
+        """Yazım hatası toleranslı arama (trigram adayları + benzerlik eşiği)"""
+        if not query or not query.strip():
+            return []
+        try:
+            expression = _trigram_expression(query) if self.trigram_enabled else None
+            if expression:
+                rows = self._query(
+                    "SELECT todos.* FROM todos_trgm JOIN todos ON todos.rowid = todos_trgm.rowid "
+                    "WHERE todos_trgm MATCH ? AND todos.user_id = ?",
+                    (expression, user_id)
+                )
+            else:
+                rows = self._query("SELECT * FROM todos WHERE user_id = ?", (user_id,))
+
+            scored = []
+            for row in rows:
+                score = word_similarity(query, row['text'])
+                if score >= threshold:
+                    scored.append((score, row['created_at'], row))
+            scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+            return [Todo.from_dict(row) for _, _, row in scored[offset:offset + limit]]
+        except Exception as e:
+            print(f"Bulanık arama hatası: {e}")
+            return []
+
+    def get_overdue_todos(self, user_id: str) -> List[Todo]:
+        """Süresi geçmiş todo'ları getir"""
+        try:
+            return [Todo.from_dict(row) for row in self._query(
+                "SELECT * FROM todos WHERE user_id = ? AND due_date < ? AND completed = 0",
+                (user_id, _now()))]
+        except Exception as e:
+            print(f"Süresi geçmiş todo getirme hatası: {e}")
+            return []
+
+    def get_todo_statistics(self, user_id: str) -> Dict:
+        """Gelişmiş istatistikler"""
+        try:
+            row = self._fetch_statistics_row(user_id)
+            total = row.get('total') or 0
+            completed = row.get('completed') or 0
+            return {
+                'total': total,
+                'completed': completed,
+                'pending': total - completed,
+                'overdue': row.get('overdue') or 0,
+                'completion_rate': round((completed / total * 100), 1) if total > 0 else 0,
+                'high_priority': row.get('high_priority') or 0,
+                'medium_priority': row.get('medium_priority') or 0,
+                'low_priority': row.get('low_priority') or 0,
+                'in_progress': row.get('in_progress') or 0,
+                'cancelled': row.get('cancelled') or 0
+            }
+        except Exception as e:
+            print(f"İstatistik hesaplama hatası: {e}")
+            return {
+                'total': 0,
+                'completed': 0,
+                'pending': 0,
+                'overdue': 0,
+                'completion_rate': 0,
+                'high_priority': 0,
+                'medium_priority': 0,
+                'low_priority': 0,
+                'in_progress': 0,
+                'cancelled': 0
+            }
+
+    def save_weather_record(self, user_id: str, city: str, weather_data: Dict) -> Optional[WeatherRecord]:
+        """Hava durumu kaydı oluştur"""
+        try:
+            row = self._insert('weather_history', {
+                'user_id': user_id,
+                'city': city,
+                'temperature': weather_data.get('temperature'),
+                'description': weather_data.get('description'),
+                'humidity': weather_data.get('humidity'),
+                'icon': weather_data.get('icon'),
+                'created_at': _now()
+            })
+            return WeatherRecord(
+                id=row['id'],
+                user_id=row['user_id'],
+                city=row['city'],
+                temperature=row['temperature'],
+                description=row['description'],
+                humidity=row['humidity'],
+                icon=row['icon'],
+                created_at=_parse_datetime(row['created_at'])
+            )
+        except Exception as e:
+            print(f"Hava durumu kaydı oluşturma hatası: {e}")
+            return None
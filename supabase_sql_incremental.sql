@@ -63,3 +63,361 @@ BEGIN
             FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
     END IF;
 END $$;
+
+-- Todo istatistikleri (tek sorgu, tek satır)
+-- Tüm sayaçlar FILTER ile tek geçişte hesaplanır; istemciye todo listesi taşınmaz.
+CREATE OR REPLACE FUNCTION todo_statistics(p_user_id UUID)
+RETURNS TABLE (
+    total BIGINT,
+    completed BIGINT,
+    pending BIGINT,
+    overdue BIGINT,
+    high_priority BIGINT,
+    medium_priority BIGINT,
+    low_priority BIGINT,
+    in_progress BIGINT,
+    cancelled BIGINT
+) AS $$
+    SELECT
+        COUNT(*),
+        COUNT(*) FILTER (WHERE COALESCE(completed, FALSE)),
+        COUNT(*) FILTER (WHERE NOT COALESCE(completed, FALSE)),
+        COUNT(*) FILTER (WHERE NOT COALESCE(completed, FALSE) AND due_date < NOW()),
+        COUNT(*) FILTER (WHERE priority = 'yüksek'),
+        COUNT(*) FILTER (WHERE priority = 'orta'),
+        COUNT(*) FILTER (WHERE priority = 'düşük'),
+        COUNT(*) FILTER (WHERE status = 'in_progress'),
+        COUNT(*) FILTER (WHERE status = 'cancelled')
+    FROM todos
+    WHERE user_id = p_user_id;
+$$ LANGUAGE sql STABLE;
+
+-- Kullanıcı başına todo sayaçları (trigger ile güncel tutulur)
+-- İstatistik kutusu her sayfa görüntülemede todo'ları taramak yerine
+-- bu tablodan birincil anahtar ile okunur.
+CREATE TABLE IF NOT EXISTS user_todo_stats (
+    user_id UUID PRIMARY KEY,
+    total BIGINT NOT NULL DEFAULT 0,
+    completed BIGINT NOT NULL DEFAULT 0,
+    high_priority BIGINT NOT NULL DEFAULT 0,
+    medium_priority BIGINT NOT NULL DEFAULT 0,
+    low_priority BIGINT NOT NULL DEFAULT 0,
+    in_progress BIGINT NOT NULL DEFAULT 0,
+    cancelled BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Tek bir todo satırının katkısını ekle (p_sign = 1) veya çıkar (p_sign = -1)
+CREATE OR REPLACE FUNCTION user_todo_stats_apply(
+    p_user_id UUID,
+    p_priority TEXT,
+    p_status TEXT,
+    p_completed BOOLEAN,
+    p_sign INTEGER
+)
+RETURNS VOID AS $$
+BEGIN
+    IF p_user_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO user_todo_stats AS s (
+        user_id, total, completed, high_priority, medium_priority,
+        low_priority, in_progress, cancelled
+    )
+    VALUES (
+        p_user_id,
+        p_sign,
+        CASE WHEN COALESCE(p_completed, FALSE) THEN p_sign ELSE 0 END,
+        CASE WHEN p_priority = 'yüksek' THEN p_sign ELSE 0 END,
+        CASE WHEN p_priority = 'orta' THEN p_sign ELSE 0 END,
+        CASE WHEN p_priority = 'düşük' THEN p_sign ELSE 0 END,
+        CASE WHEN p_status = 'in_progress' THEN p_sign ELSE 0 END,
+        CASE WHEN p_status = 'cancelled' THEN p_sign ELSE 0 END
+    )
+    ON CONFLICT (user_id) DO UPDATE SET
+        total = s.total + EXCLUDED.total,
+        completed = s.completed + EXCLUDED.completed,
+        high_priority = s.high_priority + EXCLUDED.high_priority,
+        medium_priority = s.medium_priority + EXCLUDED.medium_priority,
+        low_priority = s.low_priority + EXCLUDED.low_priority,
+        in_progress = s.in_progress + EXCLUDED.in_progress,
+        cancelled = s.cancelled + EXCLUDED.cancelled,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION user_todo_stats_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+       AND NEW.user_id IS NOT DISTINCT FROM OLD.user_id
+       AND NEW.priority IS NOT DISTINCT FROM OLD.priority
+       AND NEW.status IS NOT DISTINCT FROM OLD.status
+       AND NEW.completed IS NOT DISTINCT FROM OLD.completed THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM user_todo_stats_apply(OLD.user_id, OLD.priority, OLD.status, OLD.completed, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM user_todo_stats_apply(NEW.user_id, NEW.priority, NEW.status, NEW.completed, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'todos_user_stats') THEN
+        CREATE TRIGGER todos_user_stats
+            AFTER INSERT OR DELETE OR UPDATE OF user_id, priority, status, completed ON todos
+            FOR EACH ROW EXECUTE FUNCTION user_todo_stats_trigger();
+    END IF;
+END $$;
+
+-- Sayaçları todos tablosundan yeniden hesapla (sapma düzeltme)
+-- Düzeltilen/silinen satır sayısını döndürür.
+CREATE OR REPLACE FUNCTION reconcile_user_todo_stats()
+RETURNS INTEGER AS $$
+DECLARE
+    fixed INTEGER;
+    removed INTEGER;
+BEGIN
+    WITH actual AS (
+        SELECT
+            user_id,
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE COALESCE(completed, FALSE)) AS completed,
+            COUNT(*) FILTER (WHERE priority = 'yüksek') AS high_priority,
+            COUNT(*) FILTER (WHERE priority = 'orta') AS medium_priority,
+            COUNT(*) FILTER (WHERE priority = 'düşük') AS low_priority,
+            COUNT(*) FILTER (WHERE status = 'in_progress') AS in_progress,
+            COUNT(*) FILTER (WHERE status = 'cancelled') AS cancelled
+        FROM todos
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id
+    ), upserted AS (
+        INSERT INTO user_todo_stats AS s (
+            user_id, total, completed, high_priority, medium_priority,
+            low_priority, in_progress, cancelled
+        )
+        SELECT * FROM actual
+        ON CONFLICT (user_id) DO UPDATE SET
+            total = EXCLUDED.total,
+            completed = EXCLUDED.completed,
+            high_priority = EXCLUDED.high_priority,
+            medium_priority = EXCLUDED.medium_priority,
+            low_priority = EXCLUDED.low_priority,
+            in_progress = EXCLUDED.in_progress,
+            cancelled = EXCLUDED.cancelled,
+            updated_at = NOW()
+        WHERE (s.total, s.completed, s.high_priority, s.medium_priority,
+               s.low_priority, s.in_progress, s.cancelled)
+              IS DISTINCT FROM
+              (EXCLUDED.total, EXCLUDED.completed, EXCLUDED.high_priority, EXCLUDED.medium_priority,
+               EXCLUDED.low_priority, EXCLUDED.in_progress, EXCLUDED.cancelled)
+        RETURNING 1
+    )
+    SELECT COUNT(*) INTO fixed FROM upserted;
+
+    DELETE FROM user_todo_stats s
+    WHERE NOT EXISTS (SELECT 1 FROM todos t WHERE t.user_id = s.user_id);
+    GET DIAGNOSTICS removed = ROW_COUNT;
+
+    RETURN fixed + removed;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Mevcut veriler için ilk doldurma
+SELECT reconcile_user_todo_stats();
+
+-- Periyodik düzeltme (pg_cron eklentisi varsa her 15 dakikada bir)
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule('reconcile-user-todo-stats', '*/15 * * * *',
+                              'SELECT reconcile_user_todo_stats()');
+    END IF;
+END $$;
+
+-- Sayaç tablosundan istatistik (hızlı yol)
+-- overdue zamana bağlı olduğu için sayaçta tutulamaz; tamamlanmamış ve
+-- süresi geçmiş todo'lar her çağrıda NOW() ile ayrıca sayılır.
+-- Kullanıcının sayaç satırı yoksa hiç satır döndürmez (istemci todo_statistics'e düşer).
+CREATE OR REPLACE FUNCTION todo_statistics_cached(p_user_id UUID)
+RETURNS TABLE (
+    total BIGINT,
+    completed BIGINT,
+    pending BIGINT,
+    overdue BIGINT,
+    high_priority BIGINT,
+    medium_priority BIGINT,
+    low_priority BIGINT,
+    in_progress BIGINT,
+    cancelled BIGINT
+) AS $$
+    SELECT
+        s.total,
+        s.completed,
+        s.total - s.completed,
+        (SELECT COUNT(*) FROM todos t
+          WHERE t.user_id = p_user_id
+            AND NOT COALESCE(t.completed, FALSE)
+            AND t.due_date < NOW()),
+        s.high_priority,
+        s.medium_priority,
+        s.low_priority,
+        s.in_progress,
+        s.cancelled
+    FROM user_todo_stats s
+    WHERE s.user_id = p_user_id;
+$$ LANGUAGE sql STABLE;
+
+-- Todo tamamla/geri al (tek round trip, atomik)
+-- completed ve status aynı UPDATE içinde çevrilir; SELECT + UPDATE yarışı yoktur.
+-- p_user_id verilirse yalnızca o kullanıcının todo'su güncellenir.
+CREATE OR REPLACE FUNCTION toggle_todo_complete(p_todo_id UUID, p_user_id UUID DEFAULT NULL)
+RETURNS SETOF todos AS $$
+    UPDATE todos
+    SET completed = NOT COALESCE(completed, FALSE),
+        status = CASE WHEN COALESCE(completed, FALSE) THEN 'pending' ELSE 'completed' END
+    WHERE id = p_todo_id
+      AND (p_user_id IS NULL OR user_id = p_user_id)
+    RETURNING *;
+$$ LANGUAGE sql VOLATILE;
+
+-- Önbellek geçersiz kılma bildirimi (LISTEN todo_cache_invalidate)
+-- Değişen satırın user_id'si yayınlanır; worker'lar o kullanıcının
+-- önbelleğini tahliye eder. Aynı işlemdeki tekrarlı bildirimler
+-- Postgres tarafından tek bildirime indirilir.
+CREATE OR REPLACE FUNCTION notify_todo_cache_invalidate()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' AND OLD.user_id IS NOT NULL THEN
+        PERFORM pg_notify('todo_cache_invalidate', OLD.user_id::text);
+    END IF;
+    IF TG_OP <> 'DELETE' AND NEW.user_id IS NOT NULL
+       AND (TG_OP = 'INSERT' OR NEW.user_id IS DISTINCT FROM OLD.user_id) THEN
+        PERFORM pg_notify('todo_cache_invalidate', NEW.user_id::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'todos_cache_invalidate') THEN
+        CREATE TRIGGER todos_cache_invalidate
+            AFTER INSERT OR UPDATE OR DELETE ON todos
+            FOR EACH ROW EXECUTE FUNCTION notify_todo_cache_invalidate();
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'categories_cache_invalidate') THEN
+        CREATE TRIGGER categories_cache_invalidate
+            AFTER INSERT OR UPDATE OR DELETE ON categories
+            FOR EACH ROW EXECUTE FUNCTION notify_todo_cache_invalidate();
+    END IF;
+END $$;
+
+-- Kullanıcı odaklı bileşik indeksler
+-- Sık çalışan her todo sorgusu önce user_id ile filtreler, created_at ile sıralar
+-- (get_user_todos, get_todos_by_priority, get_todos_by_category, fetch_user_todos).
+-- Tek sütunlu status/due_date indeksleri bu sorgularda kullanılamaz; aşağıdaki
+-- indeksler sıralamayı da indeksten okuyarak sort adımını kaldırır.
+-- Büyük tablolarda Supabase SQL editörü dışında CREATE INDEX CONCURRENTLY tercih edin.
+-- Etkisi benchmarks/bench_indexes.py ile EXPLAIN ANALYZE üzerinden ölçülür.
+
+-- Kullanıcının todo listesi (artan sıralama da indeksin geriye taranmasıyla karşılanır)
+CREATE INDEX IF NOT EXISTS idx_todos_user_created ON todos(user_id, created_at DESC);
+
+-- Önceliğe göre liste
+CREATE INDEX IF NOT EXISTS idx_todos_user_priority_created ON todos(user_id, priority, created_at);
+
+-- Kategoriye göre liste
+CREATE INDEX IF NOT EXISTS idx_todos_user_category ON todos(user_id, category_id);
+
+-- Süresi geçmiş todo'lar: yalnızca tamamlanmamış satırlar indekslenir
+CREATE INDEX IF NOT EXISTS idx_todos_user_due_open ON todos(user_id, due_date) WHERE NOT completed;
+
+-- Planlayıcı istatistiklerini güncelle
+ANALYZE todos;
+
+-- Tam metin arama (text, description, tags)
+-- array_to_string IMMUTABLE olmadığından üretilen sütunda kullanılamaz;
+-- etiketler IMMUTABLE bir sarmalayıcı ile metne çevrilir.
+CREATE OR REPLACE FUNCTION todo_tags_text(p_tags TEXT[])
+RETURNS TEXT AS $$
+    SELECT COALESCE(array_to_string(p_tags, ' '), '');
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Ağırlıklar: başlık (A) > açıklama (B) > etiketler (C)
+ALTER TABLE todos ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('turkish', COALESCE(text, '')), 'A') ||
+        setweight(to_tsvector('turkish', COALESCE(description, '')), 'B') ||
+        setweight(to_tsvector('turkish', todo_tags_text(tags)), 'C')
+    ) STORED;
+
+-- user_id + tsvector tek GIN indekste (btree_gin): arama yalnızca kullanıcının
+-- eşleşen satırlarını okur, süre toplam todo sayısıyla büyümez.
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+CREATE INDEX IF NOT EXISTS idx_todos_user_search ON todos USING GIN (user_id, search_vector);
+
+-- Sıralı arama (en alakalı önce, eşitlikte en yeni önce)
+-- p_query web arama sözdizimini destekler: "tam ifade", veya (or), -hariç
+CREATE OR REPLACE FUNCTION search_todos(
+    p_user_id UUID,
+    p_query TEXT,
+    p_limit INTEGER DEFAULT 20,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS SETOF todos AS $$
+    SELECT t.*
+    FROM todos t, websearch_to_tsquery('turkish', p_query) AS q
+    WHERE t.user_id = p_user_id
+      AND t.search_vector @@ q
+    ORDER BY ts_rank_cd(t.search_vector, q) DESC, t.created_at DESC
+    LIMIT p_limit OFFSET p_offset;
+$$ LANGUAGE sql STABLE;
+
+-- Bulanık (yazım hatası toleranslı) arama: pg_trgm
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Türkçe karakter katlama (ı/İ -> i, ş -> s, ğ -> g, ü -> u, ö -> o, ç -> c)
+-- unaccent IMMUTABLE olmadığından indeks ifadesinde translate kullanılır;
+-- search_index.fold_turkish ile aynı sonucu verir.
+CREATE OR REPLACE FUNCTION turkish_fold(p_text TEXT)
+RETURNS TEXT AS $$
+    SELECT lower(translate(COALESCE(p_text, ''), 'ıİIşŞğĞüÜöÖçÇâÂîÎûÛ', 'iiisSgGuUoOcCaAiIuU'));
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Katlanmış metin üzerinde trigram GIN indeksi (user_id ile birlikte, btree_gin)
+CREATE INDEX IF NOT EXISTS idx_todos_user_text_trgm
+    ON todos USING GIN (user_id, turkish_fold(text) gin_trgm_ops);
+
+-- Benzerlik eşiğiyle bulanık arama (en benzer önce)
+-- <% operatörü eşiği pg_trgm.word_similarity_threshold ayarından okur;
+-- ayar yalnızca bu işlem için değiştirilir ve indeks kullanılabilir kalır.
+CREATE OR REPLACE FUNCTION fuzzy_search_todos(
+    p_user_id UUID,
+    p_query TEXT,
+    p_threshold REAL DEFAULT 0.3,
+    p_limit INTEGER DEFAULT 20,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS SETOF todos AS $$
+DECLARE
+    v_query TEXT := turkish_fold(p_query);
+BEGIN
+    PERFORM set_config('pg_trgm.word_similarity_threshold', p_threshold::text, true);
+    RETURN QUERY
+        SELECT t.*
+        FROM todos t
+        WHERE t.user_id = p_user_id
+          AND v_query <% turkish_fold(t.text)
+        ORDER BY word_similarity(v_query, turkish_fold(t.text)) DESC, t.created_at DESC
+        LIMIT p_limit OFFSET p_offset;
+END;
+$$ LANGUAGE plpgsql;
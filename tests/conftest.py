@@ -0,0 +1,17 @@
+"""
+Test ayarları
+Uygulamalar ağ olmadan, sahte Supabase istemcisi ve bellek içi depolarla çalışır
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# app.py -> database.create_db_manager() sahte istemciyi kullanır
+os.environ['DATABASE_BACKEND'] = 'fake'
+# api/main.py Supabase olmadan bellek içi USERS deposunu kullanır
+os.environ['SUPABASE_URL'] = ''
+os.environ['WEATHER_API_KEY'] = 'demo-key'
@@ -0,0 +1,170 @@
+"""
+Veritabanı yöneticisi davranış testleri
+AdvancedDatabaseManager arayüzünü uygulayan arka uçlar için ortak senaryolar
+
+Arka uç test modülleri DatabaseContract'ı miras alır ve 'db' fixture'ı
+(gelişmiş yönetici) sağlar. Kullanıcılar her testte benzersiz adla
+oluşturulur; paylaşılan veritabanlarında kayıtlar birbirine karışmaz.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from advanced_models import Priority, Status
+
+
+class DatabaseContract:
+    """Arka uçtan bağımsız davranış senaryoları"""
+
+    @pytest.fixture
+    def owner(self, db):
+        return db.create_user(f"sahip-{uuid.uuid4().hex[:8]}", 'sahip@example.com')
+
+    @pytest.fixture
+    def stranger(self, db):
+        return db.create_user(f"yabanci-{uuid.uuid4().hex[:8]}", 'yabanci@example.com')
+
+    def test_create_and_read_back(self, db, owner):
+        category = db.create_category(owner.id, 'İş', '#ff0000')
+        todo = db.create_todo(owner.id, 'Rapor yaz', description='Çeyrek raporu', priority='yüksek',
+                              tags=['iş', 'acil'], category_id=category.id)
+
+        assert db.get_user_by_username(owner.username).id == owner.id
+        assert [c.name for c in db.get_user_categories(owner.id)] == ['İş']
+        [stored] = db.get_user_todos(owner.id)
+        assert stored.id == todo.id
+        assert (stored.text, stored.description, stored.priority) == ('Rapor yaz', 'Çeyrek raporu', Priority.HIGH)
+        assert stored.tags == ['iş', 'acil']
+        assert [t.id for t in db.get_todos_by_priority(owner.id, 'yüksek')] == [todo.id]
+        assert db.get_todos_by_priority(owner.id, 'düşük') == []
+        assert [t.id for t in db.get_todos_by_category(owner.id, category.id)] == [todo.id]
+
+    def test_update_is_owner_scoped(self, db, owner, stranger):
+        todo = db.create_todo(owner.id, 'Süt al')
+
+        assert db.update_todo(todo.id, owner_id=stranger.id, text='Ele geçirildi') is False
+        assert db.get_user_todos(owner.id)[0].text == 'Süt al'
+
+        assert db.update_todo(todo.id, owner_id=owner.id, text='Süt ve ekmek al', priority=Priority.LOW) is True
+        [stored] = db.get_user_todos(owner.id)
+        assert (stored.text, stored.priority) == ('Süt ve ekmek al', Priority.LOW)
+
+    def test_toggle_is_owner_scoped(self, db, owner, stranger):
+        todo = db.create_todo(owner.id, 'Koş')
+
+        assert db.toggle_todo_complete(todo.id, owner_id=stranger.id) is False
+        assert db.get_user_todos(owner.id)[0].completed is False
+
+        assert db.toggle_todo_complete(todo.id, owner_id=owner.id) is True
+        [stored] = db.get_user_todos(owner.id)
+        assert (stored.completed, stored.status) == (True, Status.COMPLETED)
+
+        assert db.toggle_todo_complete(todo.id, owner_id=owner.id) is True
+        [stored] = db.get_user_todos(owner.id)
+        assert (stored.completed, stored.status) == (False, Status.PENDING)
+
+    def test_delete_is_owner_scoped(self, db, owner, stranger):
+        todo = db.create_todo(owner.id, 'Faturayı öde')
+
+        assert db.delete_todo(todo.id, owner_id=stranger.id) is False
+        assert len(db.get_user_todos(owner.id)) == 1
+
+        assert db.delete_todo(todo.id, owner_id=owner.id) is True
+        assert db.get_user_todos(owner.id) == []
+        assert db.delete_todo(todo.id, owner_id=owner.id) is False
+
+    def test_create_todos_bulk_keeps_input_order_across_chunks(self, db, owner):
+        payload = [{'text': f'todo {i}', 'priority': 'yüksek' if i % 2 else 'düşük', 'tags': [f't{i}']}
+                   for i in range(5)]
+
+        created = db.create_todos_bulk(owner.id, payload, chunk_size=2)
+
+        assert [t.text for t in created] == [p['text'] for p in payload]
+        assert [t.tags for t in created] == [p['tags'] for p in payload]
+        assert {t.id for t in db.get_user_todos(owner.id)} == {t.id for t in created}
+
+    def test_update_todos_bulk_groups_identical_patches(self, db, owner):
+        todos = db.create_todos_bulk(owner.id, [{'text': f'todo {i}'} for i in range(5)])
+        missing = str(uuid.uuid4())
+        updates = {t.id: {'priority': Priority.HIGH} for t in todos[:3]}
+        updates[todos[3].id] = {'status': Status.IN_PROGRESS, 'text': 'başladı'}
+        updates[missing] = {'priority': Priority.HIGH}
+
+        results = db.update_todos_bulk(updates, chunk_size=2)
+
+        assert results == {**{t.id: True for t in todos[:4]}, missing: False}
+        stored = {t.id: t for t in db.get_user_todos(owner.id)}
+        assert [stored[t.id].priority for t in todos[:3]] == [Priority.HIGH] * 3
+        assert (stored[todos[3].id].status, stored[todos[3].id].text) == (Status.IN_PROGRESS, 'başladı')
+        assert stored[todos[4].id].priority == Priority.MEDIUM
+
+    def test_delete_todos_bulk_reports_missing_ids(self, db, owner):
+        todos = db.create_todos_bulk(owner.id, [{'text': f'todo {i}'} for i in range(3)])
+        missing = str(uuid.uuid4())
+
+        results = db.delete_todos_bulk([todos[0].id, todos[2].id, missing], chunk_size=2)
+
+        assert results == {todos[0].id: True, todos[2].id: True, missing: False}
+        assert [t.id for t in db.get_user_todos(owner.id)] == [todos[1].id]
+
+    def test_search_ranks_text_above_description_and_tags(self, db, owner, stranger):
+        in_tags = db.create_todo(owner.id, 'Kira öde', tags=['market'])
+        in_description = db.create_todo(owner.id, 'Fatura öde', description='market')
+        in_text = db.create_todo(owner.id, 'market')
+        db.create_todo(owner.id, 'Kitap oku')
+        db.create_todo(stranger.id, 'market')
+
+        results = db.search_todos(owner.id, 'market')
+
+        assert [t.id for t in results] == [in_text.id, in_description.id, in_tags.id]
+        assert [t.id for t in db.search_todos(owner.id, 'market', limit=1, offset=1)] == [in_description.id]
+        assert db.search_todos(owner.id, '   ') == []
+
+    def test_fuzzy_search_tolerates_typos_and_turkish_letters(self, db, owner, stranger):
+        shopping = db.create_todo(owner.id, 'Market alışverişi')
+        db.create_todo(owner.id, 'Kitap oku')
+        db.create_todo(stranger.id, 'Market alışverişi')
+
+        assert [t.id for t in db.fuzzy_search_todos(owner.id, 'alisveris')] == [shopping.id]
+        assert [t.id for t in db.fuzzy_search_todos(owner.id, 'alışveirşi')] == [shopping.id]
+        assert db.fuzzy_search_todos(owner.id, 'zzzz') == []
+
+    def test_statistics_match_recount(self, db, owner, stranger):
+        past = datetime.now(timezone.utc) - timedelta(days=2)
+        future = datetime.now(timezone.utc) + timedelta(days=2)
+        todos = db.create_todos_bulk(owner.id, [
+            {'text': 'a', 'priority': 'yüksek', 'due_date': past},
+            {'text': 'b', 'priority': 'yüksek', 'due_date': future},
+            {'text': 'c', 'priority': 'orta', 'status': 'in_progress'},
+            {'text': 'd', 'priority': 'düşük', 'status': 'cancelled'},
+            {'text': 'e', 'priority': 'düşük', 'due_date': past},
+        ])
+        db.create_todo(stranger.id, 'başkasının', priority='yüksek')
+        db.toggle_todo_complete(todos[0].id, owner_id=owner.id)
+        db.update_todo(todos[1].id, owner_id=owner.id, priority='düşük')
+        db.update_todos_bulk({todos[2].id: {'priority': 'yüksek'}, todos[3].id: {'priority': 'yüksek'}})
+        db.delete_todo(todos[4].id, owner_id=owner.id)
+        db.create_todo(owner.id, 'f', priority='orta')
+
+        rows = db.get_user_todos(owner.id)
+        stats = db.get_todo_statistics(owner.id)
+
+        completed = sum(t.completed for t in rows)
+        assert stats['total'] == len(rows) == 5
+        assert stats['completed'] == completed
+        assert stats['pending'] == len(rows) - completed
+        assert stats['overdue'] == sum(t.is_overdue() for t in rows)
+        assert stats['high_priority'] == sum(t.priority == Priority.HIGH for t in rows)
+        assert stats['medium_priority'] == sum(t.priority == Priority.MEDIUM for t in rows)
+        assert stats['low_priority'] == sum(t.priority == Priority.LOW for t in rows)
+        assert stats['in_progress'] == sum(t.status == Status.IN_PROGRESS for t in rows)
+        assert stats['cancelled'] == sum(t.status == Status.CANCELLED for t in rows)
+
+    def test_iter_user_todos_matches_get_user_todos(self, db, owner):
+        db.create_todos_bulk(owner.id, [{'text': f'todo {i}'} for i in range(5)])
+
+        streamed = list(db.iter_user_todos(owner.id, batch_size=2))
+
+        assert sorted(t.id for t in streamed) == sorted(t.id for t in db.get_user_todos(owner.id))
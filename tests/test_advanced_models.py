@@ -0,0 +1,114 @@
+"""
+Todo modeli testleri
+Sıkıştırılmış Todo kaydı eski dataclass ile aynı genel arayüzü sunmalı
+"""
+
+import dataclasses
+from datetime import datetime, timedelta, timezone
+
+from advanced_models import Priority, Status, Todo, TodoManager
+
+
+def make_todo(**kwargs):
+    values = {
+        'id': 'todo-1',
+        'user_id': 'user-1',
+        'category_id': 'category-1',
+        'text': 'Süt al',
+        'description': 'Markete uğra',
+        'priority': Priority.HIGH,
+        'status': Status.IN_PROGRESS,
+        'due_date': datetime(2030, 5, 1, 12, 30),
+        'tags': ['ev', 'market'],
+        'created_at': datetime(2024, 1, 2, 3, 4, 5, 678901),
+        'updated_at': datetime(2024, 1, 3, tzinfo=timezone(timedelta(hours=3))),
+    }
+    values.update(kwargs)
+    return Todo(**values)
+
+
+def test_add_and_remove_tag():
+    todo = make_todo(tags=None)
+    assert todo.tags == []
+
+    todo.add_tag('ev')
+    todo.add_tag('ev')
+    todo.add_tag('iş')
+    assert todo.tags == ['ev', 'iş']
+
+    todo.remove_tag('ev')
+    todo.remove_tag('yok')
+    assert todo.tags == ['iş']
+    assert todo.to_dict()['tags'] == ['iş']
+
+
+def test_tags_list_mutations_are_kept():
+    todo = make_todo(tags=None)
+    todo.tags.append('ev')
+    todo.tags.extend(['iş', 'acil'])
+    todo.tags.remove('iş')
+    assert todo.tags == ['ev', 'acil']
+
+    tags = todo.tags
+    tags.insert(0, 'önce')
+    assert todo.tags is tags
+    assert todo.to_dict()['tags'] == ['önce', 'ev', 'acil']
+
+
+def test_untagged_todos_do_not_share_lists():
+    first, second = make_todo(tags=None), make_todo(tags=[])
+    first.tags.append('ev')
+    assert second.tags == []
+
+
+def test_to_dict_from_dict_round_trip():
+    todo = make_todo()
+    data = todo.to_dict()
+
+    assert data['priority'] == 'yüksek'
+    assert data['status'] == 'in_progress'
+    assert data['due_date'] == '2030-05-01T12:30:00'
+    assert data['created_at'] == '2024-01-02T03:04:05.678901'
+    assert data['updated_at'] == '2024-01-03T00:00:00+03:00'
+    assert Todo.from_dict(data) == todo
+    assert Todo.from_dict(data).to_dict() == data
+
+
+def test_equality():
+    todo = make_todo()
+    assert todo == make_todo()
+    assert todo != make_todo(text='Ekmek al')
+    assert todo != make_todo(tags=['ev'])
+    assert todo != make_todo(updated_at=datetime(2024, 1, 3))
+
+    other = make_todo()
+    other.tags.append('yeni')
+    assert todo != other
+    other.tags.remove('yeni')
+    assert todo == other
+
+
+def test_dataclass_helpers():
+    todo = make_todo()
+
+    assert dataclasses.is_dataclass(todo)
+    assert [field.name for field in dataclasses.fields(todo)] == list(Todo.FIELDS)
+    assert dataclasses.asdict(todo)['tags'] == ['ev', 'market']
+    assert dataclasses.asdict(todo)['due_date'] == datetime(2030, 5, 1, 12, 30)
+    assert dataclasses.astuple(todo)[0] == 'todo-1'
+
+    changed = dataclasses.replace(todo, text='Ekmek al', priority=Priority.LOW)
+    assert (changed.text, changed.priority) == ('Ekmek al', Priority.LOW)
+    assert changed.created_at == todo.created_at
+    assert dataclasses.replace(todo) == todo
+
+
+def test_manager_tag_updates_reindex_search():
+    manager = TodoManager()
+    todo = manager.create_todo('ali', 'Süt al')
+
+    manager.add_tag(todo.id, 'market')
+    assert manager.search_todos('ali', 'market') == [todo]
+
+    manager.remove_tag(todo.id, 'market')
+    assert manager.search_todos('ali', 'market') == []
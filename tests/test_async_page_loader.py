@@ -0,0 +1,112 @@
+"""
+Asenkron sayfa yükleme testleri
+AsyncPageLoader çağrılarının db_metrics istek kaydına yazılması
+"""
+
+import pytest
+from flask import Flask, g, jsonify
+
+from async_database import AsyncAdvancedDatabaseManager, AsyncPageLoader
+from db_metrics import DBMetrics
+from fake_supabase import FakeSupabaseClient
+from todo_cache import UserDataCache
+
+
+class AsyncFakeBuilder:
+    """FakeSupabaseClient sorgu zincirinin asenkron execute() karşılığı"""
+
+    def __init__(self, builder):
+        self._builder = builder
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+
+        def chained(*args, **kwargs):
+            return AsyncFakeBuilder(attr(*args, **kwargs))
+
+        return chained
+
+    async def execute(self):
+        return self._builder.execute()
+
+
+class AsyncFakeClient:
+    """AsyncPostgrestClient yerine sahte istemci"""
+
+    def __init__(self, fake):
+        self.fake = fake
+
+    def from_(self, name):
+        return AsyncFakeBuilder(self.fake.table(name))
+
+    table = from_
+
+    def rpc(self, name, params=None):
+        return AsyncFakeBuilder(self.fake.rpc(name, params))
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def fake():
+    return FakeSupabaseClient(tables={
+        'todos': [{'id': 1, 'user_id': 'u1', 'text': 'Süt al', 'priority': 'yüksek', 'completed': False}],
+        'categories': [{'id': 1, 'user_id': 'u1', 'name': 'Ev', 'color': '#007bff'}],
+    })
+
+
+@pytest.fixture
+def page_app(fake):
+    app = Flask(__name__)
+    metrics = DBMetrics(app)
+    cache = UserDataCache()
+    loader = AsyncPageLoader(
+        lambda: AsyncAdvancedDatabaseManager(client=metrics.instrument(AsyncFakeClient(fake))), timeout=5
+    )
+
+    @app.route('/advanced')
+    def advanced():
+        loaded = loader.load_advanced_page('u1', 'Istanbul', lambda city: None, stats_default={}, cache=cache)
+        return jsonify({
+            'todos': len(loaded['todos']),
+            'queries': sorted(label for _, label, _ in g.db_query_log.queries)
+        })
+
+    yield app
+    loader.close()
+
+
+def test_async_loads_are_recorded_in_the_request_log(page_app, fake):
+    response = page_app.test_client().get('/advanced')
+
+    assert response.json['todos'] == 1
+    assert response.json['queries'] == [
+        'categories select.eq.order',
+        'todo_statistics_cached rpc',
+        'todos select.eq.order',
+    ]
+    assert len(response.json['queries']) == fake.call_count
+    stats = page_app.extensions['db_metrics'].route_stats()['advanced']
+    assert (stats['requests'], stats['max_queries']) == (1, 3)
+
+
+def test_cached_lists_are_not_recorded(page_app):
+    client = page_app.test_client()
+    client.get('/advanced')
+
+    response = client.get('/advanced')
+
+    assert response.json['queries'] == ['todo_statistics_cached rpc']
+
+
+def test_loads_outside_a_request_are_not_recorded(fake):
+    metrics = DBMetrics()
+    loader = AsyncPageLoader(lambda: AsyncAdvancedDatabaseManager(client=metrics.instrument(AsyncFakeClient(fake))))
+    try:
+        rows = loader.run(lambda manager: manager.fetch_rows('todos', 'u1'))
+    finally:
+        loader.close()
+
+    assert [row['text'] for row in rows] == ['Süt al']
+    assert metrics.route_stats() == {}
@@ -0,0 +1,126 @@
+"""
+Toplu yazma testleri
+DatabaseManager ve AdvancedDatabaseManager *_bulk metotlarının parçalama, sıra ve hata davranışı
+"""
+
+import pytest
+
+from advanced_database import AdvancedDatabaseManager
+from advanced_models import Priority, Status
+from database import DatabaseManager
+from fake_supabase import FakeAPIError, FakeSupabaseClient
+from utils import group_updates
+
+USER_ID = 'user-1'
+
+
+def failing_on(operation, call_number):
+    """N'inci (1'den başlar) todos <operation> isteğinde hata veren gecikme fonksiyonu"""
+    seen = []
+
+    def latency(kind, target, op):
+        if (kind, target, op) == ('table', 'todos', operation):
+            seen.append(op)
+            if len(seen) == call_number:
+                raise FakeAPIError("parça başarısız")
+        return 0.0
+
+    return latency
+
+
+@pytest.fixture(params=[DatabaseManager, AdvancedDatabaseManager], ids=['database', 'advanced'])
+def manager_class(request):
+    return request.param
+
+
+def make_manager(manager_class, latency=0.0):
+    client = FakeSupabaseClient(latency=latency)
+    return manager_class(client=client), client
+
+
+def text_of(todo):
+    return todo['text'] if isinstance(todo, dict) else todo.text
+
+
+def id_of(todo):
+    return todo['id'] if isinstance(todo, dict) else todo.id
+
+
+def test_create_chunks_and_keeps_input_order(manager_class):
+    manager, client = make_manager(manager_class)
+    rows = [{'text': f"Todo {n}", 'priority': 'yüksek'} for n in range(5)]
+
+    created = manager.create_todos_bulk(USER_ID, rows, chunk_size=2)
+
+    assert [text_of(todo) for todo in created] == [f"Todo {n}" for n in range(5)]
+    assert client.call_counts() == {('table', 'todos', 'insert'): 3}
+    assert len(client.tables['todos']) == 5
+
+
+def test_create_failure_only_affects_its_chunk(manager_class):
+    manager, client = make_manager(manager_class, latency=failing_on('insert', 2))
+    rows = [{'text': f"Todo {n}"} for n in range(5)]
+
+    created = manager.create_todos_bulk(USER_ID, rows, chunk_size=2)
+
+    assert [todo is None for todo in created] == [False, False, True, True, False]
+    assert [text_of(created[n]) for n in (0, 1, 4)] == ['Todo 0', 'Todo 1', 'Todo 4']
+    assert client.call_count == 3
+
+
+def test_update_groups_equal_patches(manager_class):
+    manager, client = make_manager(manager_class)
+    todo_ids = [id_of(todo) for todo in manager.create_todos_bulk(USER_ID, [{'text': f"Todo {n}"} for n in range(5)])]
+    client.reset_calls()
+
+    updates = {todo_id: {'completed': True} for todo_id in todo_ids[:4]}
+    updates[todo_ids[4]] = {'priority': 'düşük'}
+    updates['missing'] = {'completed': True}
+    results = manager.update_todos_bulk(updates, chunk_size=2)
+
+    assert list(results) == list(updates)
+    assert results == {**{todo_id: True for todo_id in todo_ids}, 'missing': False}
+    # {'completed': True}: 5 id -> 3 parça; {'priority': 'düşük'}: 1 parça
+    assert client.call_counts() == {('table', 'todos', 'update'): 4}
+    rows = {row['id']: row for row in client.tables['todos']}
+    assert [rows[todo_id]['completed'] for todo_id in todo_ids] == [True, True, True, True, False]
+    assert rows[todo_ids[4]]['priority'] == 'düşük'
+
+
+def test_update_failure_only_affects_its_chunk(manager_class):
+    manager, client = make_manager(manager_class, latency=failing_on('update', 2))
+    todo_ids = [id_of(todo) for todo in manager.create_todos_bulk(USER_ID, [{'text': f"Todo {n}"} for n in range(5)])]
+
+    results = manager.update_todos_bulk({todo_id: {'completed': True} for todo_id in todo_ids}, chunk_size=2)
+
+    assert [results[todo_id] for todo_id in todo_ids] == [True, True, False, False, True]
+
+
+def test_delete_chunks_and_reports_per_id(manager_class):
+    manager, client = make_manager(manager_class, latency=failing_on('delete', 2))
+    todo_ids = [id_of(todo) for todo in manager.create_todos_bulk(USER_ID, [{'text': f"Todo {n}"} for n in range(5)])]
+    client.reset_calls()
+
+    results = manager.delete_todos_bulk(todo_ids + ['missing'], chunk_size=2)
+
+    assert list(results) == todo_ids + ['missing']
+    assert [results[todo_id] for todo_id in todo_ids] == [True, True, False, False, True]
+    assert results['missing'] is False
+    assert client.call_counts() == {('table', 'todos', 'delete'): 3}
+    assert sorted(row['id'] for row in client.tables['todos']) == sorted(todo_ids[2:4])
+
+
+def test_group_updates_keys_on_values_and_normalizes_enums():
+    groups = group_updates({
+        'a': {'priority': Priority.HIGH, 'completed': True},
+        'b': {'completed': True, 'priority': 'yüksek'},
+        'c': {'tags': ['iş']},
+        'd': {'tags': ['iş']},
+        'e': {'status': Status.IN_PROGRESS},
+    })
+
+    assert groups == [
+        ({'priority': 'yüksek', 'completed': True}, ['a', 'b']),
+        ({'tags': ['iş']}, ['c', 'd']),
+        ({'status': 'in_progress'}, ['e']),
+    ]
@@ -0,0 +1,130 @@
+"""
+Önbellek geçersiz kılma kanalı testleri
+Aynı kanala bağlı önbellekler arasında yazma yayını ve yankı atlama
+"""
+
+import pytest
+
+from cache_bus import InProcessInvalidationBus, create_invalidation_bus
+from todo_cache import UserDataCache
+
+
+class Loader:
+    """Çağrı sayan yükleyici"""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return list(self.value)
+
+
+def attached_caches(count=2):
+    bus = InProcessInvalidationBus()
+    caches = [UserDataCache() for _ in range(count)]
+    for cache in caches:
+        cache.attach_bus(bus)
+    return bus, caches
+
+
+def test_memory_backend_returns_in_process_bus():
+    assert isinstance(create_invalidation_bus('memory'), InProcessInvalidationBus)
+    with pytest.raises(ValueError):
+        create_invalidation_bus('redis')
+
+
+def test_write_through_one_cache_evicts_the_other():
+    bus, (writer, reader) = attached_caches()
+    rows = Loader([{'id': 1}])
+    writer.get('ali', 'todos', rows)
+    reader.get('ali', 'todos', rows)
+    assert rows.calls == 2
+
+    # api/main.finish_cache_write: kendi kopyasını yamala, diğerlerine yayınla
+    echo = bus.expect_echo('ali', writer)
+    writer.apply('ali', 'todos', lambda cached: cached + [{'id': 2}])
+    bus.publish('ali', source=writer, echo=echo)
+
+    rows.value = [{'id': 1}, {'id': 2}]
+    assert writer.get('ali', 'todos', rows) == [{'id': 1}, {'id': 2}]
+    assert rows.calls == 2
+    assert reader.get('ali', 'todos', rows) == [{'id': 1}, {'id': 2}]
+    assert rows.calls == 3
+
+
+def test_publish_only_evicts_the_written_user():
+    bus, (writer, reader) = attached_caches()
+    ali, ayse = Loader(['a']), Loader(['b'])
+    reader.get('ali', 'todos', ali)
+    reader.get('ayse', 'todos', ayse)
+
+    bus.publish('ali', source=writer)
+
+    reader.get('ali', 'todos', ali)
+    reader.get('ayse', 'todos', ayse)
+    assert (ali.calls, ayse.calls) == (2, 1)
+
+
+def test_publish_without_source_evicts_every_cache():
+    bus, caches = attached_caches(3)
+    rows = Loader(['a'])
+    for cache in caches:
+        cache.get('ali', 'todos', rows)
+
+    # sonucu belirsiz yazma (api/main.fail_cache_write)
+    bus.publish('ali')
+
+    for cache in caches:
+        cache.get('ali', 'todos', rows)
+    assert rows.calls == 6
+
+
+def test_none_clears_every_user():
+    bus, (cache,) = attached_caches(1)
+    rows = Loader(['a'])
+    cache.get('ali', 'todos', rows)
+    cache.get('ayse', 'todos', rows)
+
+    bus._dispatch(None)
+
+    assert cache.stats()['users'] == 0
+
+
+def test_failing_subscriber_does_not_block_others():
+    bus, (cache,) = attached_caches(1)
+    rows = Loader(['a'])
+    cache.get('ali', 'todos', rows)
+    bus.subscribe(lambda user_id: 1 / 0)
+    bus.subscribe(lambda user_id: None)
+
+    bus.publish('ali')
+
+    cache.get('ali', 'todos', rows)
+    assert rows.calls == 2
+
+
+def test_postgres_listener_skips_own_echo(monkeypatch):
+    pytest.importorskip('psycopg2')
+    from cache_bus import PostgresInvalidationBus
+
+    bus = PostgresInvalidationBus('postgresql://invalid.localhost/none', reconnect_delay=60)
+    try:
+        writer, other = object(), object()
+        echo = bus.expect_echo(7, writer)
+        bus.expect_echo(7, other)
+        # bildirim yükü metin olarak gelir; yankılar sırayla tüketilir
+        assert bus._take_echo('7') is writer
+        assert bus._take_echo('7') is other
+        assert bus._take_echo('7') is None
+
+        bus.cancel_echo(bus.expect_echo(7, writer))
+        assert bus._take_echo('7') is None
+
+        monkeypatch.setattr('cache_bus.ECHO_WINDOW', -1.0)
+        bus.expect_echo(7, writer)
+        assert bus._take_echo('7') is None
+        bus.cancel_echo(echo)
+    finally:
+        bus.close()
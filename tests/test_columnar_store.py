@@ -0,0 +1,174 @@
+"""
+Sütunlu depo testleri
+ColumnarTodoManager aynı işlem dizisinde advanced_models.TodoManager ile aynı
+sonuçları vermeli: kapasite büyümesi, silinen (ölü) satırlar ve compact() sonrası
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip('numpy')
+
+import columnar_store
+from advanced_models import Priority, Status, TodoManager, create_todo_manager
+from columnar_store import ColumnarTodoManager
+
+USERS = ('u1', 'u2', 'u3')
+CATEGORIES = ('iş', 'ev', None)
+WORDS = ('market', 'rapor', 'kitap', 'fatura', 'koşu', 'toplantı')
+QUERIES = ('market', 'rap', 'market ac', 'iş', 'yok')
+
+
+def random_due(rng):
+    if rng.random() < 0.2:
+        return None
+    due = datetime.now() + timedelta(hours=rng.uniform(-72, 72))
+    return due.astimezone(timezone.utc) if rng.random() < 0.3 else due
+
+
+class Pair:
+    """Aynı işlemleri iki yöneticiye uygular; sütunlu id'leri indeksli id'lere eşler"""
+
+    def __init__(self, columnar):
+        self.indexed = TodoManager()
+        self.columnar = columnar
+        self.ids = {}   # indeksli id -> sütunlu id
+
+    def create(self, user_id, text, **kwargs):
+        todo = self.indexed.create_todo(user_id, text, **kwargs)
+        self.ids[todo.id] = self.columnar.create_todo(user_id, text, **kwargs).id
+        return todo.id
+
+    def apply(self, method, todo_id, *args):
+        expected = getattr(self.indexed, method)(todo_id, *args)
+        actual = getattr(self.columnar, method)(self.ids[todo_id], *args)
+        assert (expected is None) == (actual is None), method
+
+    def delete(self, todo_id):
+        assert self.indexed.delete_todo(todo_id) is True
+        assert self.columnar.delete_todo(self.ids.pop(todo_id)) is True
+
+    def snapshot(self, todos, mapped=False):
+        rename = {columnar: indexed for indexed, columnar in self.ids.items()} if mapped else {}
+        return [(rename.get(t.id, t.id), t.user_id, t.text, t.description, t.priority, t.status,
+                 t.completed, t.due_date, list(t.tags), t.category_id) for t in todos]
+
+    def assert_same(self, query, *args):
+        expected = getattr(self.indexed, query)(*args)
+        actual = getattr(self.columnar, query)(*args)
+        assert self.snapshot(actual, mapped=True) == self.snapshot(expected), (query, args)
+
+    def assert_parity(self):
+        assert len(self.columnar) == len(self.indexed.todos)
+        for user_id in USERS + ('kimse',):
+            self.assert_same('get_user_todos', user_id)
+            for priority in Priority:
+                self.assert_same('get_todos_by_priority', user_id, priority)
+            for status in Status:
+                self.assert_same('get_todos_by_status', user_id, status)
+            for category_id in CATEGORIES:
+                self.assert_same('get_todos_by_category', user_id, category_id)
+            for query in QUERIES:
+                self.assert_same('search_todos', user_id, query)
+            self.assert_same('get_overdue_todos', user_id)
+            self.assert_same('get_todos_due_within', user_id, timedelta(days=2))
+            assert (self.columnar.get_todo_statistics(user_id)
+                    == self.indexed.get_todo_statistics(user_id)), user_id
+        for todo_id in list(self.ids)[:20]:
+            [expected] = self.snapshot([self.indexed.get_todo(todo_id)])
+            assert self.snapshot([self.columnar.get_todo(self.ids[todo_id])], mapped=True) == [expected]
+
+
+def run_random_operations(pair, rng, steps, compact_every=None):
+    for step in range(steps):
+        ids = list(pair.ids)
+        action = rng.random()
+        if action < 0.35 or not ids:
+            pair.create(rng.choice(USERS), f"{rng.choice(WORDS)} {step}",
+                        description=rng.choice(('', rng.choice(WORDS))),
+                        priority=rng.choice(list(Priority)), status=rng.choice(list(Status)),
+                        category_id=rng.choice(CATEGORIES), due_date=random_due(rng),
+                        tags=rng.sample(('iş', 'acil', 'market'), rng.randrange(3)))
+        elif action < 0.5:
+            pair.delete(rng.choice(ids))
+        else:
+            todo_id = rng.choice(ids)
+            method, args = rng.choice([
+                ('toggle_complete', ()),
+                ('update_status', (rng.choice(list(Status)),)),
+                ('update_priority', (rng.choice(list(Priority)),)),
+                ('update_category', (rng.choice(CATEGORIES),)),
+                ('update_due_date', (random_due(rng),)),
+                ('update_text', (f"{rng.choice(WORDS)} yeni {step}",)),
+                ('add_tag', (rng.choice(('iş', 'acil', 'fatura')),)),
+                ('remove_tag', (rng.choice(('iş', 'acil', 'market')),)),
+            ])
+            pair.apply(method, todo_id, *args)
+        if compact_every and step % compact_every == 0:
+            pair.columnar.compact()
+        if step % 50 == 0:
+            pair.assert_parity()
+    pair.assert_parity()
+
+
+def test_matches_indexed_manager_through_growth_and_deletes():
+    pair = Pair(ColumnarTodoManager(capacity=2))
+
+    run_random_operations(pair, random.Random(49), 600)
+
+    assert pair.columnar._dead > 0
+    assert len(pair.columnar._columns['alive']) > 2
+
+
+def test_matches_indexed_manager_across_explicit_compaction():
+    pair = Pair(ColumnarTodoManager(capacity=8))
+
+    run_random_operations(pair, random.Random(7), 400, compact_every=97)
+    pair.columnar.compact()
+
+    assert pair.columnar._dead == 0
+    assert pair.columnar._size == len(pair.columnar)
+    pair.assert_parity()
+
+
+def test_automatic_compaction_keeps_results(monkeypatch):
+    monkeypatch.setattr(columnar_store, 'COMPACT_MIN_ROWS', 32)
+    pair = Pair(ColumnarTodoManager(capacity=4))
+    rng = random.Random(3)
+    ids = [pair.create('u1', f"{rng.choice(WORDS)} {i}", priority=rng.choice(list(Priority)),
+                       category_id=rng.choice(CATEGORIES), due_date=random_due(rng)) for i in range(64)]
+
+    for todo_id in ids[::2]:
+        pair.delete(todo_id)
+
+    assert pair.columnar._dead <= pair.columnar._size * columnar_store.COMPACT_RATIO
+    assert pair.columnar._size < len(ids)
+    pair.assert_parity()
+    run_random_operations(pair, rng, 200)
+
+
+def test_reindex_todo_writes_direct_changes_back():
+    manager = ColumnarTodoManager()
+    todo = manager.create_todo('u1', 'Süt al')
+
+    todo.priority = Priority.HIGH
+    todo.add_tag('market')
+    manager.reindex_todo(todo)
+
+    assert [t.id for t in manager.get_todos_by_priority('u1', Priority.HIGH)] == [todo.id]
+    assert [t.id for t in manager.search_todos('u1', 'mark')] == [todo.id]
+
+
+def test_create_todo_manager_selects_backend(monkeypatch):
+    monkeypatch.delenv('TODO_STORE_BACKEND', raising=False)
+    assert type(create_todo_manager()) is TodoManager
+    assert type(create_todo_manager('columnar')) is ColumnarTodoManager
+
+    monkeypatch.setenv('TODO_STORE_BACKEND', 'columnar')
+    assert type(create_todo_manager()) is ColumnarTodoManager
+    assert type(create_todo_manager('indexed')) is TodoManager
+
+    with pytest.raises(ValueError):
+        create_todo_manager('bilinmeyen')
@@ -0,0 +1,87 @@
+"""
+Basit model testleri
+models.TodoManager öncelik indeksinin tam taramayla tutarlılığı ve REST API'de öncelik güncelleme
+"""
+
+import random
+
+import pytest
+
+import app as todo_app
+from models import TodoManager
+
+PRIORITIES = ('yüksek', 'orta', 'düşük')
+
+
+def assert_index_matches_scan(manager):
+    for priority in PRIORITIES:
+        assert manager.get_todos_by_priority(priority) == [
+            todo.to_dict() for todo in manager.todos if todo.priority == priority
+        ], priority
+
+
+def test_priority_index_matches_scan_after_interleaved_writes():
+    rng = random.Random(45)
+    manager = TodoManager()
+
+    for step in range(500):
+        ids = [todo.id for todo in manager.todos]
+        action = rng.random()
+        if action < 0.4 or not ids:
+            manager.add_todo(f"todo {step}", rng.choice(PRIORITIES))
+        elif action < 0.8:
+            manager.update_priority(rng.choice(ids), rng.choice(PRIORITIES))
+        else:
+            assert manager.delete_todo(rng.choice(ids)) is True
+        if step % 7 == 0:
+            assert_index_matches_scan(manager)
+
+    assert_index_matches_scan(manager)
+
+
+def test_priority_moves_keep_insertion_order():
+    manager = TodoManager()
+    first = manager.add_todo('bir', 'düşük')
+    second = manager.add_todo('iki', 'yüksek')
+    third = manager.add_todo('üç', 'yüksek')
+
+    manager.update_priority(third.id, 'düşük')
+    manager.update_priority(first.id, 'yüksek')
+    manager.update_priority(first.id, 'yüksek')
+
+    assert [t['id'] for t in manager.get_todos_by_priority('yüksek')] == [first.id, second.id]
+    assert [t['id'] for t in manager.get_todos_by_priority('düşük')] == [third.id]
+    assert manager.update_priority(99, 'orta') is None
+    assert manager.delete_todo(99) is False
+    assert_index_matches_scan(manager)
+
+
+@pytest.fixture
+def api(monkeypatch):
+    manager = TodoManager()
+    monkeypatch.setattr(todo_app, 'todo_manager', manager)
+    return todo_app.app.test_client(), manager
+
+
+def test_api_put_priority_moves_todo_between_buckets(api):
+    client, manager = api
+    ids = [client.post('/api/todos', json={'text': f'todo {i}', 'priority': 'orta'}).json['data']['id']
+           for i in range(4)]
+
+    response = client.put(f'/api/todos/{ids[1]}', json={'priority': 'yüksek', 'completed': True})
+    client.put(f'/api/todos/{ids[3]}', json={'priority': 'yüksek'})
+    client.put(f'/api/todos/{ids[0]}', json={'priority': 'yüksek', 'text': 'ilk'})
+    client.delete(f'/api/todos/{ids[3]}')
+
+    assert response.status_code == 200
+    assert (response.json['data']['priority'], response.json['data']['completed']) == ('yüksek', True)
+    assert [t['id'] for t in manager.get_todos_by_priority('yüksek')] == [ids[0], ids[1]]
+    assert [t['id'] for t in manager.get_todos_by_priority('orta')] == [ids[2]]
+    assert manager.get_todos_by_priority('yüksek')[0]['text'] == 'ilk'
+    assert_index_matches_scan(manager)
+
+
+def test_api_put_missing_todo_is_404(api):
+    client, _ = api
+
+    assert client.put('/api/todos/42', json={'priority': 'yüksek'}).status_code == 404
@@ -0,0 +1,212 @@
+"""
+Doğrudan Postgres arka ucu testleri
+Davranış senaryoları yalnızca DATABASE_URL verildiğinde gerçek veritabanında
+çalışır; sorgu hazırlama ve toplu güncelleme gruplaması sahte havuzla test edilir.
+"""
+
+import os
+import re
+
+import pytest
+
+import postgres_database
+from advanced_models import Priority, Status
+from database_contract import DatabaseContract
+from postgres_database import STATEMENTS, PostgresAdvancedDatabaseManager, PostgresDatabaseManager
+
+DATABASE_URL = os.environ.get('DATABASE_URL')
+
+requires_database = pytest.mark.skipif(
+    not DATABASE_URL or postgres_database.psycopg2 is None,
+    reason="DATABASE_URL ve psycopg2 gerekli"
+)
+
+
+# Sahte havuz: sorgular kaydedilir, veritabanına gidilmez
+class StubCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        if self.connection.fail_on and self.connection.fail_on in str(query):
+            raise RuntimeError('sorgu hatası')
+        self.connection.executed.append((query, params))
+        self.description = [('id',)]
+
+    def fetchall(self):
+        return list(self.connection.rows)
+
+
+class StubConnection:
+    def __init__(self, rows=(), fail_on=None):
+        self.prepared = set()
+        self.executed = []
+        self.rows = rows
+        self.fail_on = fail_on
+        self.closed = 0
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, **kwargs):
+        return StubCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class StubPool:
+    def __init__(self, connection):
+        self.connection = connection
+        self.returned = []
+
+    def getconn(self):
+        return self.connection
+
+    def putconn(self, conn, close=False):
+        self.returned.append((conn, close))
+
+
+def stub_manager(cls=PostgresAdvancedDatabaseManager, connection=None):
+    """Bağlantı açmadan yönetici (sahte havuz ile)"""
+    manager = cls.__new__(cls)
+    manager.pool = StubPool(connection or StubConnection())
+    manager.bulk_chunk_size = 500
+    return manager
+
+
+def test_statements_number_parameters_contiguously():
+    for name, statement in STATEMENTS.items():
+        numbers = sorted({int(n) for n in re.findall(r'\$(\d+)', statement)})
+        assert numbers == list(range(1, len(numbers) + 1)), name
+
+
+def test_execute_prepares_once_per_connection():
+    manager = stub_manager()
+    first, second = StubConnection(), StubConnection()
+
+    manager._execute(StubCursor(first), 'todos_by_priority', ('u1', 'yüksek'))
+    manager._execute(StubCursor(first), 'todos_by_priority', ('u1', 'düşük'))
+    manager._execute(StubCursor(second), 'todos_by_priority', ('u1', 'orta'))
+
+    assert first.executed == [
+        (f"PREPARE todos_by_priority AS {STATEMENTS['todos_by_priority']}", None),
+        ('EXECUTE todos_by_priority (%s, %s)', ('u1', 'yüksek')),
+        ('EXECUTE todos_by_priority (%s, %s)', ('u1', 'düşük')),
+    ]
+    assert first.prepared == {'todos_by_priority'}
+    assert [query for query, _ in second.executed][0].startswith('PREPARE todos_by_priority AS')
+
+
+def test_query_commits_and_returns_connection_to_pool():
+    pytest.importorskip('psycopg2')
+    connection = StubConnection(rows=[{'id': 't1'}])
+    manager = stub_manager(connection=connection)
+
+    assert manager._query('todos_by_user', 'u1') == [{'id': 't1'}]
+    assert (connection.commits, connection.rollbacks) == (1, 0)
+    assert manager.pool.returned == [(connection, False)]
+
+
+def test_query_error_rolls_back_and_returns_connection_to_pool():
+    pytest.importorskip('psycopg2')
+    connection = StubConnection(fail_on='EXECUTE')
+    manager = stub_manager(connection=connection)
+
+    assert manager.get_user_todos('u1') == []
+    assert (connection.commits, connection.rollbacks) == (0, 1)
+    assert manager.pool.returned == [(connection, False)]
+
+
+@pytest.mark.parametrize('cls', [PostgresDatabaseManager, PostgresAdvancedDatabaseManager])
+def test_update_todos_bulk_groups_identical_patches(cls):
+    manager = stub_manager(cls)
+    calls = []
+
+    def update_rows(todo_ids, fields, owner_id=None):
+        calls.append((list(todo_ids), fields))
+        if 'c' in todo_ids:
+            raise RuntimeError('parça hatası')
+        return list(todo_ids)
+
+    manager._update_rows = update_rows
+    updates = {
+        'a': {'priority': 'yüksek', 'completed': True},
+        'b': {'completed': True, 'priority': 'yüksek'},
+        'c': {'priority': 'yüksek', 'completed': True},
+        'd': {'text': 'yeni'},
+    }
+
+    results = manager.update_todos_bulk(updates, chunk_size=2)
+
+    assert calls == [
+        (['a', 'b'], {'priority': 'yüksek', 'completed': True}),
+        (['c'], {'priority': 'yüksek', 'completed': True}),
+        (['d'], {'text': 'yeni'}),
+    ]
+    assert results == {'a': True, 'b': True, 'c': False, 'd': True}
+
+
+def test_advanced_update_todos_bulk_groups_enums_with_their_values():
+    manager = stub_manager()
+    calls = []
+    manager._update_rows = lambda todo_ids, fields, owner_id=None: calls.append((list(todo_ids), fields)) or []
+
+    manager.update_todos_bulk({
+        'a': {'priority': Priority.HIGH, 'status': Status.IN_PROGRESS},
+        'b': {'priority': 'yüksek', 'status': 'in_progress'},
+    })
+
+    assert calls == [(['a', 'b'], {'priority': 'yüksek', 'status': 'in_progress'})]
+
+
+@requires_database
+class TestPostgresDatabase(DatabaseContract):
+    """DatabaseContract senaryoları gerçek Postgres üzerinde"""
+
+    @pytest.fixture
+    def db(self):
+        manager = PostgresAdvancedDatabaseManager(DATABASE_URL)
+        created = []
+        create_user = manager.create_user
+
+        def tracked_create_user(username, email):
+            user = create_user(username, email)
+            created.append(user.id)
+            return user
+
+        manager.create_user = tracked_create_user
+        yield manager
+        with manager._cursor() as cur:
+            cur.execute("DELETE FROM users WHERE id = ANY(%s::uuid[])", (created,))
+        manager.close()
+
+    def test_prepared_statements_are_reused(self, db, owner, monkeypatch):
+        monkeypatch.setenv('DB_POOL_MIN', '1')
+        monkeypatch.setenv('DB_POOL_MAX', '1')
+        single = PostgresAdvancedDatabaseManager(DATABASE_URL)
+        try:
+            single.create_todo(owner.id, 'hazırlanmış')
+            assert len(single.get_user_todos(owner.id)) == 1
+            assert len(single.get_user_todos(owner.id)) == 1
+
+            conn = single.pool.getconn()
+            try:
+                assert {'todo_insert_full', 'todos_by_user'} <= conn.prepared
+                with conn.cursor() as cur:
+                    cur.execute("SELECT name FROM pg_prepared_statements WHERE name = 'todos_by_user'")
+                    assert len(cur.fetchall()) == 1
+                conn.rollback()
+            finally:
+                single.pool.putconn(conn)
+        finally:
+            single.close()
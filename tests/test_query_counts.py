@@ -0,0 +1,108 @@
+"""
+Gidiş-dönüş sayısı testleri
+app.py yönlendirmelerinin FakeSupabaseClient üzerinde yaptığı sorgu sayıları (N+1 gerilemelerine karşı)
+"""
+
+import time
+
+import pytest
+
+import app as todo_app
+
+
+@pytest.fixture
+def fake():
+    """app.py'nin kullandığı sahte istemci (db_metrics vekili üzerinden)"""
+    client = todo_app.db_manager.supabase
+    client.tables.clear()
+    client.reset_calls()
+    return client
+
+
+@pytest.fixture
+def client(fake, monkeypatch):
+    monkeypatch.setattr(todo_app, 'get_weather_data', lambda city, api_key: None)
+    test_client = todo_app.app.test_client()
+    test_client.post('/login', data={'username': 'ali', 'email': 'ali@example.com'})
+    test_client.post('/add', data={'todo': 'Süt al', 'priority': 'yüksek'})
+    test_client.post('/add', data={'todo': 'Ekmek al', 'priority': 'orta'})
+    fake.reset_calls()
+    return test_client
+
+
+def calls(fake):
+    """(tür, hedef, işlem) -> sayı"""
+    return dict(fake.call_counts())
+
+
+def test_login_existing_user_is_one_query(fake, monkeypatch):
+    monkeypatch.setattr(todo_app, 'get_weather_data', lambda city, api_key: None)
+    todo_app.app.test_client().post('/login', data={'username': 'veli'})
+    fake.reset_calls()
+
+    response = todo_app.app.test_client().post('/login', data={'username': 'veli'})
+
+    assert response.status_code == 302
+    assert calls(fake) == {('table', 'users', 'select'): 1}
+
+
+def test_index_makes_two_queries(client, fake):
+    response = client.get('/')
+
+    assert response.status_code == 200
+    assert calls(fake) == {('table', 'todos', 'select'): 1, ('table', 'users', 'select'): 1}
+
+
+def test_index_with_priority_filter_makes_two_queries(client, fake):
+    response = client.get('/?filter=yüksek')
+
+    assert response.status_code == 200
+    assert fake.call_count == 2
+
+
+def test_add_is_one_insert(client, fake):
+    client.post('/add', data={'todo': 'Çay al', 'priority': 'düşük'})
+
+    assert calls(fake) == {('table', 'todos', 'insert'): 1}
+
+
+def test_complete_is_one_rpc(client, fake):
+    todo_id = fake.tables['todos'][0]['id']
+
+    client.get(f'/complete/{todo_id}')
+
+    assert calls(fake) == {('rpc', 'toggle_todo_complete', 'call'): 1}
+    assert fake.tables['todos'][0]['completed'] is True
+
+
+def test_delete_is_one_query(client, fake):
+    todo_id = fake.tables['todos'][0]['id']
+
+    client.get(f'/delete/{todo_id}')
+
+    assert calls(fake) == {('table', 'todos', 'delete'): 1}
+    assert len(fake.tables['todos']) == 1
+
+
+def test_query_count_does_not_grow_with_todos(client, fake):
+    for n in range(20):
+        client.post('/add', data={'todo': f"Todo {n}", 'priority': 'orta'})
+    fake.reset_calls()
+
+    client.get('/')
+
+    assert fake.call_count == 2
+
+
+def test_index_reads_run_concurrently(client, fake, monkeypatch):
+    monkeypatch.setattr(fake, 'latency', lambda kind, target, op: 0.2 if op == 'select' else 0.0)
+
+    start = time.perf_counter()
+    response = client.get('/?filter=yüksek')
+    elapsed = time.perf_counter() - start
+
+    assert response.status_code == 200
+    assert 'Süt al' in response.get_data(as_text=True)
+    assert 'Ekmek al' not in response.get_data(as_text=True)
+    assert calls(fake) == {('table', 'todos', 'select'): 1, ('table', 'users', 'select'): 1}
+    assert elapsed < 0.35
@@ -0,0 +1,127 @@
+"""
+SQLite arka ucu testleri
+DatabaseContract senaryoları tmp_path veritabanında, ayrıca WAL, FTS5/trigram
+indekslerinin trigger'larla güncel tutulması ve sözlük döndüren yönetici
+"""
+
+import sqlite3
+
+import pytest
+
+from database_contract import DatabaseContract
+from sqlite_database import SQLiteAdvancedDatabaseManager, SQLiteDatabaseManager
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'todo.db')
+
+
+class TestSQLiteDatabase(DatabaseContract):
+    """DatabaseContract senaryoları dosya veritabanında"""
+
+    @pytest.fixture
+    def db(self, db_path):
+        manager = SQLiteAdvancedDatabaseManager(db_path)
+        yield manager
+        manager.close()
+
+    def test_indexes_are_available(self, db):
+        assert db.fts_enabled is True
+        assert db.trigram_enabled is True
+
+    def test_connections_use_wal(self, db, db_path):
+        assert db._connection().execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        with sqlite3.connect(db_path) as other:
+            assert other.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+    def test_search_indexes_follow_updates_and_deletes(self, db, owner):
+        todo = db.create_todo(owner.id, 'Market alışverişi')
+
+        db.update_todo(todo.id, owner_id=owner.id, text='Kitap siparişi', tags=['okuma'])
+        assert db.search_todos(owner.id, 'market') == []
+        assert db.fuzzy_search_todos(owner.id, 'alisveris') == []
+        assert [t.id for t in db.search_todos(owner.id, 'kitap')] == [todo.id]
+        assert [t.id for t in db.search_todos(owner.id, 'okuma')] == [todo.id]
+        assert [t.id for t in db.fuzzy_search_todos(owner.id, 'siparis')] == [todo.id]
+
+        db.delete_todo(todo.id, owner_id=owner.id)
+        assert db.search_todos(owner.id, 'kitap') == []
+        assert db.fuzzy_search_todos(owner.id, 'siparis') == []
+
+    def test_trigram_index_is_built_for_existing_rows(self, db, owner, db_path):
+        todo = db.create_todo(owner.id, 'Market alışverişi')
+        conn = db._connection()
+        conn.executescript("DROP TABLE todos_trgm; DROP TRIGGER todos_trgm_insert; "
+                           "DROP TRIGGER todos_trgm_delete; DROP TRIGGER todos_trgm_update;")
+        db.close()
+
+        reopened = SQLiteAdvancedDatabaseManager(db_path)
+        try:
+            assert [t.id for t in reopened.fuzzy_search_todos(owner.id, 'alisveris')] == [todo.id]
+        finally:
+            reopened.close()
+
+    def test_update_rejects_unknown_columns(self, db, owner):
+        todo = db.create_todo(owner.id, 'Süt al')
+
+        assert db.update_todo(todo.id, owner_id=owner.id, user_id='baskasi') is False
+        assert db.get_user_todos(owner.id)[0].text == 'Süt al'
+
+    def test_data_survives_reopen(self, db, owner, db_path):
+        todo = db.create_todo(owner.id, 'Kalıcı')
+        db.close()
+
+        reopened = SQLiteAdvancedDatabaseManager(db_path)
+        try:
+            assert [t.id for t in reopened.get_user_todos(owner.id)] == [todo.id]
+        finally:
+            reopened.close()
+
+
+@pytest.fixture
+def simple(db_path):
+    manager = SQLiteDatabaseManager(db_path)
+    yield manager
+    manager.close()
+
+
+def test_simple_manager_is_owner_scoped(simple):
+    owner = simple.create_user('ali', 'ali@example.com')
+    stranger = simple.create_user('veli', 'veli@example.com')
+    todo = simple.create_todo(owner['id'], 'Süt al', 'yüksek')
+
+    assert simple.update_todo(todo['id'], owner_id=stranger['id'], text='x') is False
+    assert simple.toggle_todo_complete(todo['id'], owner_id=stranger['id']) is False
+    assert simple.delete_todo(todo['id'], owner_id=stranger['id']) is False
+    assert simple.get_user_todos(owner['id']) == [todo]
+
+    assert simple.toggle_todo_complete(todo['id'], owner_id=owner['id']) is True
+    assert simple.get_user_todos(owner['id'])[0]['completed'] is True
+    assert simple.delete_todo(todo['id'], owner_id=owner['id']) is True
+
+
+def test_simple_manager_bulk_writes_and_statistics(simple):
+    owner = simple.create_user('ali', 'ali@example.com')
+    created = simple.create_todos_bulk(owner['id'], [
+        {'text': f'todo {i}', 'priority': 'yüksek' if i < 2 else 'düşük'} for i in range(5)
+    ], chunk_size=2)
+    ids = [todo['id'] for todo in created]
+
+    assert [todo['text'] for todo in created] == [f'todo {i}' for i in range(5)]
+    assert simple.update_todos_bulk({ids[0]: {'completed': True}, ids[1]: {'completed': True},
+                                     ids[2]: {'priority': 'orta'}}, chunk_size=1) == {
+        ids[0]: True, ids[1]: True, ids[2]: True}
+    assert simple.delete_todos_bulk([ids[4], 'yok']) == {ids[4]: True, 'yok': False}
+
+    rows = simple.get_user_todos(owner['id'])
+    assert simple.get_todo_statistics(owner['id']) == {
+        'total': len(rows),
+        'completed': sum(row['completed'] for row in rows),
+        'pending': sum(not row['completed'] for row in rows),
+        'completion_rate': 50.0,
+        'high_priority': sum(row['priority'] == 'yüksek' for row in rows),
+        'medium_priority': sum(row['priority'] == 'orta' for row in rows),
+        'low_priority': sum(row['priority'] == 'düşük' for row in rows)
+    }
+    assert sorted(row['id'] for row in simple.get_todos_by_priority(owner['id'], 'yüksek')) == sorted(ids[:2])
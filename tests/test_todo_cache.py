@@ -0,0 +1,160 @@
+"""
+Okuma önbelleği testleri
+UserDataCache LRU sınırı, sürüm sayaçları, TTL, apply/bump ve aget
+"""
+
+import asyncio
+
+import pytest
+
+import todo_cache
+from todo_cache import UserDataCache
+
+
+class Loader:
+    """Çağrı sayan yükleyici"""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_read_through_caches_until_bump():
+    cache = UserDataCache()
+    loader = Loader(['a'])
+
+    assert cache.get('ali', 'todos', loader) == ['a']
+    assert cache.get('ali', 'todos', loader) == ['a']
+    assert loader.calls == 1
+    assert cache.stats() == {'users': 1, 'hits': 1, 'misses': 1}
+
+    cache.bump('ali', 'todos')
+    cache.get('ali', 'todos', loader)
+    assert loader.calls == 2
+
+
+def test_bump_is_per_kind():
+    cache = UserDataCache()
+    todos, categories = Loader([1]), Loader([2])
+    cache.get('ali', 'todos', todos)
+    cache.get('ali', 'categories', categories)
+
+    cache.bump('ali', 'categories')
+    cache.get('ali', 'todos', todos)
+    cache.get('ali', 'categories', categories)
+    assert (todos.calls, categories.calls) == (1, 2)
+
+    cache.bump('ali')
+    cache.get('ali', 'todos', todos)
+    assert todos.calls == 2
+
+
+def test_evicts_least_recently_used_user_at_capacity():
+    cache = UserDataCache(max_users=2)
+    loaders = {user: Loader([user]) for user in ('a', 'b', 'c')}
+    cache.get('a', 'todos', loaders['a'])
+    cache.get('b', 'todos', loaders['b'])
+    cache.get('a', 'todos', loaders['a'])  # a en son kullanılan
+
+    cache.get('c', 'todos', loaders['c'])  # b tahliye edilir
+    assert cache.stats()['users'] == 2
+
+    cache.get('a', 'todos', loaders['a'])
+    cache.get('b', 'todos', loaders['b'])
+    assert (loaders['a'].calls, loaders['b'].calls) == (1, 2)
+
+
+def test_load_racing_a_bump_is_not_stored():
+    cache = UserDataCache()
+
+    def stale_loader():
+        # Yükleme sürerken başka bir istek yazıp sürümü artırır
+        cache.bump('ali', 'todos')
+        return ['eski']
+
+    assert cache.get('ali', 'todos', stale_loader) == ['eski']
+
+    fresh = Loader(['yeni'])
+    assert cache.get('ali', 'todos', fresh) == ['yeni']
+    assert fresh.calls == 1
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(todo_cache.time, 'monotonic', lambda: now[0])
+    cache = UserDataCache(ttl=60)
+    loader = Loader(['a'])
+
+    cache.get('ali', 'todos', loader)
+    now[0] += 59
+    cache.get('ali', 'todos', loader)
+    assert loader.calls == 1
+
+    now[0] += 2
+    cache.get('ali', 'todos', loader)
+    assert loader.calls == 2
+
+
+def test_apply_patches_cached_list_without_reload():
+    cache = UserDataCache()
+    loader = Loader([{'id': 1}])
+    original = cache.get('ali', 'todos', loader)
+
+    cache.apply('ali', 'todos', lambda cached: cached + [{'id': 2}])
+
+    assert cache.get('ali', 'todos', loader) == [{'id': 1}, {'id': 2}]
+    assert loader.calls == 1
+    assert original == [{'id': 1}]
+
+
+def test_apply_without_cached_data_invalidates_pending_load():
+    cache = UserDataCache()
+
+    def loader():
+        cache.apply('ali', 'todos', lambda cached: cached + ['yazılan'])
+        return ['eski']
+
+    cache.get('ali', 'todos', loader)
+    fresh = Loader(['yeni'])
+    assert cache.get('ali', 'todos', fresh) == ['yeni']
+
+
+def test_evict_and_clear():
+    cache = UserDataCache()
+    loader = Loader([1])
+    cache.get('ali', 'todos', loader)
+    cache.get('veli', 'todos', loader)
+
+    cache.evict('ali')
+    assert cache.stats()['users'] == 1
+    cache.clear()
+    assert cache.stats()['users'] == 0
+
+
+def test_aget_matches_get():
+    cache = UserDataCache()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return ['a']
+
+    async def main():
+        first = await cache.aget('ali', 'todos', load)
+        second = await cache.aget('ali', 'todos', load)
+        return first, second
+
+    assert asyncio.run(main()) == (['a'], ['a'])
+    assert len(calls) == 1
+    assert cache.get('ali', 'todos', Loader(['b'])) == ['a']
+
+
+@pytest.mark.parametrize('kind', [None, 'todos'])
+def test_bump_unknown_user_is_noop(kind):
+    cache = UserDataCache()
+    cache.bump('yok', kind)
+    assert cache.stats()['users'] == 0
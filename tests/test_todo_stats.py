@@ -0,0 +1,159 @@
+"""
+İstatistik sayacı testleri
+Artımlı sayaçlar ve süresi geçmiş indeksi her değişiklikten sonra baştan hesaplananla aynı olmalı
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from advanced_models import Priority, Status, TodoManager
+from api import main as api_main
+from todo_stats import TodoStats
+
+PAST = datetime.now() - timedelta(days=3)
+FUTURE = datetime.now() + timedelta(days=3)
+
+
+def assert_consistent(manager, user_id):
+    """Sayaçlar, süresi geçmiş listesi ve sayısı tam taramayla aynı"""
+    assert manager.check_statistics(user_id) == []
+    todos = manager.get_user_todos(user_id)
+    overdue = sorted((todo for todo in todos if todo.is_overdue()), key=lambda todo: todo.due_date)
+    assert [todo.id for todo in manager.get_overdue_todos(user_id)] == [todo.id for todo in overdue]
+    stats = manager.get_todo_statistics(user_id)
+    assert stats['overdue'] == len(overdue)
+    assert stats['total'] == len(todos)
+    assert stats['completed'] == sum(1 for todo in todos if todo.completed)
+
+
+@pytest.fixture
+def manager():
+    manager = TodoManager()
+    manager.create_todo('ali', 'Süt al', priority=Priority.HIGH, due_date=PAST)
+    manager.create_todo('ali', 'Fatura öde', priority=Priority.LOW, due_date=FUTURE)
+    manager.create_todo('ali', 'Kitap oku')
+    manager.create_todo('veli', 'Koşu', due_date=PAST)
+    return manager
+
+
+def test_create(manager):
+    assert_consistent(manager, 'ali')
+    assert manager.get_todo_statistics('ali')['overdue'] == 1
+    assert manager.get_todo_statistics('ali')['high_priority'] == 1
+
+
+def test_toggle_removes_and_restores_overdue(manager):
+    overdue = manager.get_overdue_todos('ali')[0]
+
+    manager.toggle_complete(overdue.id)
+    assert_consistent(manager, 'ali')
+    assert manager.get_todo_statistics('ali')['overdue'] == 0
+
+    manager.toggle_complete(overdue.id)
+    assert_consistent(manager, 'ali')
+    assert manager.get_todo_statistics('ali')['overdue'] == 1
+
+
+def test_updates(manager):
+    todo_ids = [todo.id for todo in manager.get_user_todos('ali')]
+
+    manager.update_priority(todo_ids[0], Priority.LOW)
+    assert_consistent(manager, 'ali')
+    manager.update_status(todo_ids[1], Status.IN_PROGRESS)
+    assert_consistent(manager, 'ali')
+    manager.update_status(todo_ids[2], Status.COMPLETED)
+    assert_consistent(manager, 'ali')
+    manager.update_category(todo_ids[1], 'kategori')
+    manager.update_text(todo_ids[1], 'Faturayı öde')
+    manager.add_tag(todo_ids[1], 'ev')
+    assert_consistent(manager, 'ali')
+
+    stats = manager.get_todo_statistics('ali')
+    assert stats['low_priority'] == 2
+    assert stats['in_progress'] == 1
+
+
+def test_due_date_changes(manager):
+    todo_ids = [todo.id for todo in manager.get_user_todos('ali')]
+
+    manager.update_due_date(todo_ids[1], PAST - timedelta(days=1))
+    assert_consistent(manager, 'ali')
+    assert [todo.id for todo in manager.get_overdue_todos('ali')] == [todo_ids[1], todo_ids[0]]
+
+    manager.update_due_date(todo_ids[0], None)
+    assert_consistent(manager, 'ali')
+    manager.update_due_date(todo_ids[2], FUTURE)
+    assert_consistent(manager, 'ali')
+    assert [todo.id for todo in manager.get_todos_due_within('ali', timedelta(days=7))] == [todo_ids[2]]
+
+
+def test_delete(manager):
+    for todo in manager.get_user_todos('ali'):
+        manager.delete_todo(todo.id)
+        assert_consistent(manager, 'ali')
+    assert manager.get_todo_statistics('ali')['total'] == 0
+    assert_consistent(manager, 'veli')
+
+
+def test_check_reports_drift():
+    todos = [{'id': 1, 'priority': 'orta', 'completed': False}]
+    stats = TodoStats.from_todos(todos, key=lambda todo: todo['id'])
+    assert stats.check(todos, key=lambda todo: todo['id']) == []
+
+    todos[0]['completed'] = True
+    assert stats.check(todos, key=lambda todo: todo['id']) != []
+    stats.track(1, todos[0])
+    assert stats.check(todos, key=lambda todo: todo['id']) == []
+
+
+@pytest.fixture
+def memory_user(monkeypatch):
+    """api/main bellek içi deposunda oturum açmış istemci ve kullanıcı durumu"""
+    monkeypatch.setattr(api_main, 'get_weather', lambda city: None)
+    api_main.USERS.pop('istatistik', None)
+    client = api_main.app.test_client()
+    client.post('/login', data={'username': 'istatistik'})
+    return client, api_main.USERS['istatistik']
+
+
+def assert_memory_consistent(user_state):
+    assert api_main.check_memory_statistics(user_state) == []
+    now = datetime.now()
+    overdue = [todo['id'] for todo in user_state['todos'] if api_main.is_overdue(todo, now)]
+    assert sorted(todo['id'] for todo in api_main.filter_overdue(user_state['todos'], user_state)) == sorted(overdue)
+    stats = api_main.memory_todo_statistics(user_state)
+    assert stats['overdue'] == len(overdue)
+    assert stats['total'] == len(user_state['todos'])
+
+
+def test_memory_store_mutations(memory_user):
+    client, user_state = memory_user
+    past = PAST.strftime('%Y-%m-%dT%H:%M')
+    future = FUTURE.strftime('%Y-%m-%dT%H:%M')
+
+    client.post('/add_advanced_todo', data={'todo': 'Süt al', 'priority': 'yüksek', 'due_date': past})
+    client.post('/add_advanced_todo', data={'todo': 'Fatura öde', 'priority': 'düşük', 'due_date': future})
+    client.post('/add', data={'todo': 'Kitap oku', 'priority': 'orta'})
+    client.post('/api/todos', json={'text': 'Koşu', 'priority': 'yüksek'})
+    assert_memory_consistent(user_state)
+    assert api_main.memory_todo_statistics(user_state)['overdue'] == 1
+
+    client.get('/complete/1')
+    assert_memory_consistent(user_state)
+    assert api_main.memory_todo_statistics(user_state)['overdue'] == 0
+
+    client.get('/complete/1')
+    assert_memory_consistent(user_state)
+    assert api_main.memory_todo_statistics(user_state)['overdue'] == 1
+
+    client.get('/complete/3')
+    client.get('/delete/1')
+    assert_memory_consistent(user_state)
+    stats = api_main.memory_todo_statistics(user_state)
+    assert (stats['total'], stats['completed'], stats['overdue'], stats['high_priority']) == (3, 1, 0, 1)
+
+    for todo_id in (2, 3, 4):
+        client.get(f'/delete/{todo_id}')
+        assert_memory_consistent(user_state)
+    assert api_main.memory_todo_statistics(user_state)['total'] == 0
@@ -0,0 +1,86 @@
+"""
+Bellek içi kullanıcı deposu eşzamanlılık testi
+api/main.py USERS deposu çok thread altında tutarlı kalmalı (ID'ler tekil, indeksler ve sayaçlar listeyle aynı)
+"""
+
+import random
+import sys
+import threading
+
+import pytest
+
+from api import main as api_main
+from user_locks import StripedLock
+
+THREADS = 6
+OPS = 120
+USERNAMES = ['eszamanli-0', 'eszamanli-1']
+
+
+@pytest.fixture
+def fast_switching():
+    """Thread'ler arası geçişi sıklaştır: yarışlar küçük iş yükünde de ortaya çıksın"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def worker(seed, events, errors):
+    """Paylaşılan kullanıcılar adına todo ekle, tamamla ve sil"""
+    rng = random.Random(seed)
+    clients = {}
+    try:
+        for _ in range(OPS):
+            username = rng.choice(USERNAMES)
+            client = clients.get(username)
+            if client is None:
+                client = clients[username] = api_main.app.test_client()
+                client.post('/login', data={'username': username})
+            action = rng.random()
+            if action < 0.6:
+                response = client.post('/api/todos', json={'text': f"todo {seed}", 'priority': 'yüksek'})
+                assert response.status_code == 201
+                events.append((username, 'add', response.get_json()['data']['id']))
+                continue
+            todos = client.get('/api/todos').get_json()['data']
+            if not todos:
+                continue
+            todo_id = rng.choice(todos)['id']
+            if action < 0.8:
+                client.get(f'/complete/{todo_id}')
+            else:
+                client.get(f'/delete/{todo_id}')
+                events.append((username, 'delete', todo_id))
+    except Exception as e:
+        errors.append(repr(e))
+
+
+@pytest.mark.parametrize('stripes', [1, 64])
+def test_concurrent_users_stay_consistent(stripes, monkeypatch, fast_switching):
+    monkeypatch.setattr(api_main, 'get_weather', lambda city: None)
+    monkeypatch.setattr(api_main, 'USER_LOCKS', StripedLock(stripes))
+    for username in USERNAMES:
+        api_main.USERS.pop(username, None)
+
+    events, errors = [], []
+    threads = [threading.Thread(target=worker, args=(seed, events, errors)) for seed in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+    for username in USERNAMES:
+        user_state = api_main.USERS[username]
+        added = [todo_id for name, kind, todo_id in events if name == username and kind == 'add']
+        deleted = {todo_id for name, kind, todo_id in events if name == username and kind == 'delete'}
+        ids = [todo['id'] for todo in user_state['todos']]
+
+        assert len(added) == len(set(added))
+        assert len(ids) == len(set(ids))
+        assert len(ids) == len(added) - len(deleted)
+        assert set(ids) == set(added) - deleted
+        assert len(user_state['search_index']) == len(ids)
+        assert len(user_state['fulltext_index']) == len(ids)
+        assert api_main.check_memory_statistics(user_state) == []
@@ -0,0 +1,186 @@
+"""
+Kullanıcı Bazlı Okuma Önbelleği
+Todo ve kategori listeleri için sürüm sayaçlı, LRU tahliyeli önbellek
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class UserDataCache:
+    """
+    Kullanıcı başına read-through önbellek
+
+    Her kullanıcı için veri türü ('todos', 'categories') başına bir sürüm
+    tutulur. Yazma işlemleri sürümü artırır; sürümü eski olan veri bir daha
+    döndürülmez. Yükleme sırasında araya giren bir yazma varsa yüklenen
+    sonuç önbelleğe yazılmaz. Kullanıcı sayısı max_users ile sınırlıdır,
+    en uzun süre kullanılmayan kullanıcı tahliye edilir (LRU).
+
+    Başka worker'ların yazmaları bu önbelleği görmez; bunun için
+    attach_bus() ile bir geçersiz kılma kanalına (cache_bus) bağlanılır.
+    ttl, kanal olmadan kabul edilebilecek en uzun bayatlık süresidir.
+    """
+
+    def __init__(self, max_users: int = 1024, ttl: Optional[float] = None):
+        """
+        Önbellek oluştur
+
+        Args:
+            max_users (int): Bellekte tutulacak en fazla kullanıcı sayısı
+            ttl (float): Yüklenen verinin geçerlilik süresi (saniye, None = sınırsız)
+        """
+        self.max_users = max_users
+        self.ttl = ttl
+        self._entries: 'OrderedDict[str, Dict[str, List]]' = OrderedDict()
+        self._clock = itertools.count(1)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _slot(self, user_id: str, kind: str) -> List:
+        """[sürüm, veri, yüklendi mi, yüklenme zamanı] slotunu getir (kilit altında çağrılır)"""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            entry = self._entries[user_id] = {}
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(user_id)
+
+        slot = entry.get(kind)
+        if slot is None:
+            slot = entry[kind] = [next(self._clock), None, False, 0.0]
+        return slot
+
+    def _lookup(self, user_id: str, kind: str):
+        """(bulundu mu, veri veya yükleme öncesi sürüm)"""
+        with self._lock:
+            slot = self._slot(user_id, kind)
+            if slot[2] and (self.ttl is None or time.monotonic() - slot[3] < self.ttl):
+                self.hits += 1
+                return True, slot[1]
+            self.misses += 1
+            return False, slot[0]
+
+    def _store(self, user_id: str, kind: str, version: int, data: Any):
+        """Yüklenen veriyi, arada yazma olmadıysa sakla"""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            slot = entry.get(kind) if entry else None
+            if slot is not None and slot[0] == version:
+                slot[1], slot[2], slot[3] = data, True, time.monotonic()
+
+    def get(self, user_id: str, kind: str, loader: Callable[[], Any]) -> Any:
+        """
+        Veriyi önbellekten getir, yoksa yükle ve sakla
+
+        Args:
+            user_id (str): Kullanıcı ID'si
+            kind (str): Veri türü ('todos', 'categories')
+            loader (callable): Önbellekte yoksa çağrılacak yükleyici
+
+        Returns:
+            Önbellekteki veya yeni yüklenen veri
+        """
+        found, value = self._lookup(user_id, kind)
+        if found:
+            return value
+        data = loader()
+        self._store(user_id, kind, value, data)
+        return data
+
+    async def aget(self, user_id: str, kind: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        get() ile aynı, yükleyici bir coroutine fonksiyonu
+
+        Args:
+            user_id (str): Kullanıcı ID'si
+            kind (str): Veri türü ('todos', 'categories')
+            loader (callable): Önbellekte yoksa beklenecek coroutine fonksiyonu
+
+        Returns:
+            Önbellekteki veya yeni yüklenen veri
+        """
+        found, value = self._lookup(user_id, kind)
+        if found:
+            return value
+        data = await loader()
+        self._store(user_id, kind, value, data)
+        return data
+
+    def bump(self, user_id: str, kind: Optional[str] = None):
+        """
+        Sürümü artır ve önbellekteki veriyi geçersiz kıl
+
+        Args:
+            user_id (str): Kullanıcı ID'si
+            kind (str): Veri türü; verilmezse kullanıcının tüm verileri
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return
+            if kind is None:
+                slots = list(entry.values())
+            else:
+                slots = [entry[kind]] if kind in entry else []
+            for slot in slots:
+                slot[0], slot[1], slot[2] = next(self._clock), None, False
+
+    def apply(self, user_id: str, kind: str, mutate: Callable[[Any], Any]):
+        """
+        Yazma sonucunu önbelleğe uygula (write-through)
+
+        Veri önbellekteyse mutate(eski_veri) ile yeni sürüm oluşturulur;
+        böylece yazmadan sonraki yönlendirme veritabanından tekrar yüklemez.
+        Veri önbellekte değilse yalnızca sürüm artırılır.
+
+        Args:
+            user_id (str): Kullanıcı ID'si
+            kind (str): Veri türü
+            mutate (callable): Eski veriden yeni veriyi üreten fonksiyon
+                (eski veriyi yerinde değiştirmemelidir)
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            slot = entry.get(kind) if entry else None
+            if slot is None:
+                return
+            if slot[2]:
+                slot[1] = mutate(slot[1])
+                slot[0] = next(self._clock)
+            else:
+                slot[0], slot[1] = next(self._clock), None
+
+    def evict(self, user_id: str):
+        """Kullanıcının tüm verilerini önbellekten çıkar"""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        """Tüm önbelleği boşalt"""
+        with self._lock:
+            self._entries.clear()
+
+    def attach_bus(self, bus):
+        """
+        Geçersiz kılma kanalına abone ol
+
+        Kanaldan gelen user_id için kullanıcı tahliye edilir; None gelirse
+        (kaçırılmış bildirim olasılığı) tüm önbellek boşaltılır. Önbellek
+        kanala source olarak bağlanır: kendi yayınladığı yazmalar onu
+        tahliye etmez.
+
+        Args:
+            bus (cache_bus.InvalidationBus): Geçersiz kılma kanalı
+        """
+        bus.subscribe(lambda user_id: self.clear() if user_id is None else self.evict(user_id), source=self)
+
+    def stats(self) -> Dict[str, int]:
+        """Önbellek sayaçlarını döndür"""
+        with self._lock:
+            return {'users': len(self._entries), 'hits': self.hits, 'misses': self.misses}
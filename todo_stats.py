@@ -0,0 +1,130 @@
+"""
+Todo İstatistik Sayaçları
+Bellek içi depolar için artımlı güncellenen istatistikler
+
+Her todo eklendiğinde, değiştiğinde veya silindiğinde sayaçlar O(1)'de
+güncellenir; istatistik sözlüğü todo'lar dolaşılmadan üretilir. Süresi
+geçmiş sayısı sayaçlarda tutulmaz (zamanla değişir), DueDateIndex'ten verilir.
+
+Örnek:
+    stats = TodoStats()
+    stats.track(todo['id'], todo)      # ekleme veya değişiklik sonrası
+    stats.untrack(todo['id'])          # silme
+    stats.as_dict(overdue=due_index.overdue_count())
+    assert not stats.check(todos)      # testlerde tutarlılık kontrolü
+"""
+
+from collections import Counter
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+PRIORITY_KEYS = (('yüksek', 'high_priority'), ('orta', 'medium_priority'), ('düşük', 'low_priority'))
+
+
+def _plain(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def todo_fields(todo: Any) -> Tuple[Any, Any, bool]:
+    """Sayılan alanlar: (öncelik, durum, tamamlandı); sözlük ve model todo'ları için"""
+    if isinstance(todo, dict):
+        return todo.get('priority'), todo.get('status'), bool(todo.get('completed', False))
+    return _plain(todo.priority), _plain(getattr(todo, 'status', None)), bool(todo.completed)
+
+
+class TodoStats:
+    """
+    Bir kullanıcının todo sayaçları
+
+    Her anahtar için sayılan alanların son hali saklanır; böylece değişen
+    todo eski değerlerinden düşülüp yenilerine eklenir.
+
+    Args:
+        fields (callable): Todo'dan (öncelik, durum, tamamlandı) üreten fonksiyon
+    """
+
+    def __init__(self, fields: Callable[[Any], Tuple[Any, Any, bool]] = todo_fields):
+        self.fields = fields
+        self.total = 0
+        self.completed = 0
+        self.by_priority: Counter = Counter()
+        self.by_status: Counter = Counter()
+        self._snapshots: Dict[Hashable, Tuple[Any, Any, bool]] = {}
+
+    @classmethod
+    def from_todos(cls, todos: Iterable[Any], key: Callable[[Any], Hashable] = None, **kwargs) -> 'TodoStats':
+        """Todo listesinden tek geçişte sayaçlar oluştur (anahtar verilmezse sıra numarası)"""
+        stats = cls(**kwargs)
+        for position, todo in enumerate(todos):
+            stats.track(key(todo) if key else position, todo)
+        return stats
+
+    def _apply(self, values: Tuple[Any, Any, bool], sign: int):
+        priority, status, completed = values
+        self.total += sign
+        self.completed += sign * completed
+        self.by_priority[priority] += sign
+        self.by_status[status] += sign
+
+    def track(self, key: Hashable, todo: Any):
+        """Todo'yu ekle veya değişmiş alanlarını güncelle"""
+        values = self.fields(todo)
+        old = self._snapshots.get(key)
+        if old == values:
+            return
+        if old is not None:
+            self._apply(old, -1)
+        self._apply(values, 1)
+        self._snapshots[key] = values
+
+    def untrack(self, key: Hashable) -> bool:
+        """Todo'yu sayaçlardan çıkar"""
+        old = self._snapshots.pop(key, None)
+        if old is None:
+            return False
+        self._apply(old, -1)
+        return True
+
+    def clear(self):
+        self.total = 0
+        self.completed = 0
+        self.by_priority.clear()
+        self.by_status.clear()
+        self._snapshots.clear()
+
+    def as_dict(self, overdue: Optional[int] = None) -> Dict:
+        """İstatistik sözlüğü (overdue verilirse eklenir)"""
+        stats = {
+            'total': self.total,
+            'completed': self.completed,
+            'pending': self.total - self.completed,
+            'completion_rate': round((self.completed / self.total * 100), 1) if self.total > 0 else 0
+        }
+        for priority, name in PRIORITY_KEYS:
+            stats[name] = self.by_priority[priority]
+        if overdue is not None:
+            stats['overdue'] = overdue
+        return stats
+
+    def check(self, todos: Iterable[Any], key: Callable[[Any], Hashable] = None) -> List[str]:
+        """
+        Sayaçları todo'lardan baştan hesaplananla karşılaştır
+
+        Returns:
+            list: Uyuşmazlık açıklamaları (boşsa tutarlı)
+        """
+        todos = list(todos)
+        expected = TodoStats.from_todos(todos, key=key, fields=self.fields)
+        problems = []
+        for name in ('total', 'completed'):
+            if getattr(self, name) != getattr(expected, name):
+                problems.append(f"{name}: {getattr(self, name)} != {getattr(expected, name)}")
+        for name in ('by_priority', 'by_status'):
+            # Sıfır sayaçlar yok sayılır, negatifler hata olarak görünür
+            actual = {value: n for value, n in getattr(self, name).items() if n}
+            wanted = {value: n for value, n in getattr(expected, name).items() if n}
+            if actual != wanted:
+                problems.append(f"{name}: {actual} != {wanted}")
+        if key is not None and set(self._snapshots) != set(expected._snapshots):
+            problems.append(f"anahtarlar: {len(self._snapshots)} izleniyor, {len(expected._snapshots)} todo var")
+        return problems
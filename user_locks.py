@@ -0,0 +1,62 @@
+"""
+Kullanıcı Kilitleri
+Bellek içi kullanıcı deposu için şeritli kilitler ve atomik ID sayaçları
+
+Her kullanıcıya ayrı kilit açmak yerine kullanıcı adı sabit sayıda kilitten
+birine dağıtılır (lock striping): farklı kullanıcıların istekleri çoğunlukla
+farklı kilitlere düşer ve birbirini beklemez, kilit sayısı ise kullanıcı
+sayısıyla büyümez.
+
+Örnek:
+    USER_LOCKS = StripedLock(64)
+    with USER_LOCKS(username):
+        ...
+    todo_ids = IdAllocator()
+    todo_ids.next()  # 1
+"""
+
+import threading
+from typing import Hashable
+
+
+class StripedLock:
+    """
+    Anahtarı sabit sayıdaki yeniden girilebilir kilitten birine eşler
+
+    Args:
+        stripes (int): Kilit sayısı (1 ise tek global kilit)
+    """
+
+    def __init__(self, stripes: int = 64):
+        self._locks = [threading.RLock() for _ in range(max(1, stripes))]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def __call__(self, key: Hashable) -> threading.RLock:
+        """Anahtarın kilidi (aynı anahtar hep aynı kilidi alır)"""
+        return self._locks[hash(key) % len(self._locks)]
+
+
+class IdAllocator:
+    """
+    Thread güvenli artan ID üretici
+
+    Args:
+        start (int): Son verilmiş ID (ilk next() start + 1 döner)
+    """
+
+    def __init__(self, start: int = 0):
+        self._value = start
+        self._lock = threading.Lock()
+
+    def next(self) -> int:
+        """Yeni ID ayır"""
+        with self._lock:
+            self._value += 1
+            return self._value
+
+    @property
+    def value(self) -> int:
+        """Son verilen ID"""
+        return self._value
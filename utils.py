@@ -4,9 +4,14 @@ Python Flask Uygulaması için yardımcı fonksiyonlar
 """
 
 from datetime import datetime
+from enum import Enum
+import json
 import requests
 import os
 
+from todo_stats import TodoStats
+from search_index import tokenize
+
 def get_priority_order(priority):
     """
     Öncelik sıralaması için sayısal değer döndür
@@ -48,7 +53,7 @@ def get_weather_data(city, api_key):
             'units': 'metric',
             'lang': 'tr'
         }
-        response = requests.get('http://api.openweathermap.org/data/2.5/weather', params=params)
+        response = requests.get('http://api.openweathermap.org/data/2.5/weather', params=params, timeout=10)
         data = response.json()
         
         if response.status_code == 200:
@@ -102,21 +107,87 @@ def get_todo_statistics(todos):
     Returns:
         dict: İstatistik verileri
     """
-    total = len(todos)
-    completed = len([todo for todo in todos if todo.get('completed', False)])
-    pending = total - completed
-    
-    # Öncelik bazlı istatistikler
-    high_priority = len([todo for todo in todos if todo.get('priority') == 'yüksek'])
-    medium_priority = len([todo for todo in todos if todo.get('priority') == 'orta'])
-    low_priority = len([todo for todo in todos if todo.get('priority') == 'düşük'])
-    
-    return {
-        'total': total,
-        'completed': completed,
-        'pending': pending,
-        'completion_rate': round((completed / total * 100), 1) if total > 0 else 0,
-        'high_priority': high_priority,
-        'medium_priority': medium_priority,
-        'low_priority': low_priority
-    }
+    # Tek geçişte sayılır; bellek içi depolar sayaçları artımlı tutar (todo_stats)
+    return TodoStats.from_todos(todos).as_dict()
+
+def chunked(items, size):
+    """
+    Listeyi sabit boyutlu parçalara böl
+    
+    Args:
+        items (list): Bölünecek liste
+        size (int): Parça boyutu
+    
+    Returns:
+        generator: Sırayla liste parçaları
+    """
+    if size <= 0:
+        raise ValueError("Parça boyutu pozitif olmalıdır!")
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def group_updates(updates):
+    """
+    Aynı değişikliği alan todo ID'lerini grupla (toplu güncelleme için)
+    
+    Enum değerleri (Priority, Status) karşılık gelen metne çevrilir;
+    böylece Priority.HIGH ile 'yüksek' aynı grupta toplanır.
+    
+    Args:
+        updates (dict): Todo ID'si -> güncellenecek alanlar
+    
+    Returns:
+        list: İlk görülme sırasıyla (alanlar, [todo ID'leri]) çiftleri
+    """
+    groups = {}
+    for todo_id, patch in updates.items():
+        patch = {key: value.value if isinstance(value, Enum) else value for key, value in patch.items()}
+        key = json.dumps(patch, sort_keys=True, default=str)
+        groups.setdefault(key, (patch, []))[1].append(todo_id)
+    return list(groups.values())
+
+# Arama alanları ve ağırlıkları (search_todos SQL fonksiyonundaki A/B/C karşılığı)
+SEARCH_FIELD_WEIGHTS = (('text', 3), ('description', 2), ('tags', 1))
+
+def search_todos(todos, query, limit=None, offset=0):
+    """
+    Todo listesinde sıralı arama (veritabanı olmayan yollar için)
+    
+    Sorgudaki her kelime text, description veya tags içindeki bir kelimenin
+    başında geçmelidir. Eşleşme ağırlıkları toplanır; sonuçlar en alakalı
+    önce, eşitlikte en yeni önce döner.
+    
+    Args:
+        todos (list): Todo sözlükleri
+        query (str): Arama metni
+        limit (int): En fazla sonuç sayısı (None: sınırsız)
+        offset (int): Atlanacak sonuç sayısı
+    
+    Returns:
+        list: Eşleşen todo'lar
+    """
+    terms = tokenize(query)
+    if not terms:
+        return []
+    
+    scored = []
+    for todo in todos:
+        fields = []
+        for field, weight in SEARCH_FIELD_WEIGHTS:
+            value = todo.get(field) or ''
+            if isinstance(value, (list, tuple)):
+                value = ' '.join(value)
+            fields.append((tokenize(value), weight))
+        
+        score = 0
+        for term in terms:
+            term_score = sum(weight for words, weight in fields if any(word.startswith(term) for word in words))
+            if not term_score:
+                break
+            score += term_score
+        else:
+            scored.append((score, str(todo.get('created_at') or ''), todo))
+    
+    scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    results = [todo for _, _, todo in scored]
+    return results[offset:offset + limit] if limit is not None else results[offset:]